@@ -1,10 +1,11 @@
 """El DT (Director Técnico) - Main coordinator agent."""
 
-import json
+import os
 import re
 import uuid
 from datetime import datetime
 from pathlib import Path
+from statistics import fmean
 from typing import Any, Dict, List, Optional
 
 from agents_army.core.agent import Agent, AgentConfig, LLMProvider
@@ -29,6 +30,11 @@ from agents_army.core.task_storage import TaskStorage
 from agents_army.mcp.models import MCPServerConfig, MCPTool
 from agents_army.mcp.server import MCPServer
 from agents_army.protocol.types import AgentRole, MessageType
+from agents_army.utils.serialization import json_dumps, json_loads
+
+# Directories created under the DT path and under each project directory
+_DT_SUBDIRS = ("docs", "tasks", "rules", "config", "templates")
+_PROJECT_SUBDIRS = ("docs", "src", "tests", "assets", "config")
 
 
 class DT(Agent):
@@ -113,6 +119,7 @@ class DT(Agent):
 
         self.project_path = Path(project_path)
         self.prd_path = Path(prd_path)
+        self._dt_subdirs = [os.path.join(str(self.project_path), sub) for sub in _DT_SUBDIRS]
         self.task_storage = TaskStorage(str(self.project_path))
         self.current_project: Optional[Project] = None
         self.rules_checker: Optional[RulesChecker] = None
@@ -182,19 +189,13 @@ class DT(Agent):
             project_dir = Path(project_base_path) / safe_project_name
 
         # Create DT directory structure (for DT management files)
-        (self.project_path / "docs").mkdir(parents=True, exist_ok=True)
-        (self.project_path / "tasks").mkdir(parents=True, exist_ok=True)
-        (self.project_path / "rules").mkdir(parents=True, exist_ok=True)
-        (self.project_path / "config").mkdir(parents=True, exist_ok=True)
-        (self.project_path / "templates").mkdir(parents=True, exist_ok=True)
+        for subdir in self._dt_subdirs:
+            os.makedirs(subdir, exist_ok=True)
 
         # Create project-specific directory structure
-        project_dir.mkdir(parents=True, exist_ok=True)
-        (project_dir / "docs").mkdir(parents=True, exist_ok=True)
-        (project_dir / "src").mkdir(parents=True, exist_ok=True)
-        (project_dir / "tests").mkdir(parents=True, exist_ok=True)
-        (project_dir / "assets").mkdir(parents=True, exist_ok=True)
-        (project_dir / "config").mkdir(parents=True, exist_ok=True)
+        project_root = str(project_dir)
+        for sub in _PROJECT_SUBDIRS:
+            os.makedirs(os.path.join(project_root, sub), exist_ok=True)
 
         # Project PRD goes in project directory, not DT directory
         project_prd_path = project_dir / "docs" / "prd.txt"
@@ -207,8 +208,8 @@ class DT(Agent):
             "project_path": str(project_dir),
             "created_at": datetime.now().isoformat(),
         }
-        with open(project_dir / "project.json", "w", encoding="utf-8") as f:
-            json.dump(project_meta, f, indent=2, ensure_ascii=False)
+        with open(project_dir / "project.json", "wb") as f:
+            f.write(json_dumps(project_meta))
 
         # Create project
         project = Project(
@@ -273,13 +274,11 @@ Return only valid JSON array."""
         try:
             response = await self.generate_response(prompt)
             # Parse JSON response (simplified - in production would be more robust)
-            import json
-
             # Extract JSON from response
             json_start = response.find("[")
             json_end = response.rfind("]") + 1
             if json_start >= 0 and json_end > json_start:
-                tasks_data = json.loads(response[json_start:json_end])
+                tasks_data = json_loads(response[json_start:json_end])
             else:
                 # Fallback: create a single task
                 tasks_data = [
@@ -350,16 +349,12 @@ Return only valid JSON array."""
         # Get pending tasks
         pending_tasks = await self.get_tasks(status="pending", limit=100)
 
-        # Filter ready tasks (no dependencies)
-        ready_tasks = [t for t in pending_tasks if t.is_ready()]
-
-        if not ready_tasks:
-            return None
-
-        # Sort by priority (highest first)
-        ready_tasks.sort(key=lambda t: t.priority, reverse=True)
-
-        return ready_tasks[0]
+        # Highest-priority ready task (no dependencies); first one wins on ties
+        return max(
+            (t for t in pending_tasks if t.is_ready()),
+            key=lambda t: t.priority,
+            default=None,
+        )
 
     async def assign_task(self, task: Task, agent_role: AgentRole) -> TaskAssignment:
         """
@@ -491,12 +486,10 @@ Return JSON:
 
         try:
             response = await self.generate_response(prompt)
-            import json
-
             json_start = response.find("{")
             json_end = response.rfind("}") + 1
             if json_start >= 0 and json_end > json_start:
-                expanded = json.loads(response[json_start:json_end])
+                expanded = json_loads(response[json_start:json_end])
                 task.description = expanded.get("description", task.description)
                 task.metadata.update(expanded)
         except Exception:
@@ -587,7 +580,7 @@ Return the synthesized result.
 
         # Calculate average quality score
         quality_scores = [r.quality_score for r in task_results if r.quality_score]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else None
+        avg_quality = fmean(quality_scores) if quality_scores else None
 
         # Determine overall status
         all_successful = all(r.is_successful() for r in task_results)
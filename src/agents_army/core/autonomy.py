@@ -229,6 +229,10 @@ class DecisionHistory:
         """Initialize decision history."""
         self.history: List[Dict[str, Any]] = []
 
+    def __len__(self) -> int:
+        """Number of recorded decisions."""
+        return len(self.history)
+
     def add_decision(
         self,
         situation: Situation,
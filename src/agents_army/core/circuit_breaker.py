@@ -244,6 +244,10 @@ class TaskCircuitBreaker:
         state_info["iterations"] = []
         self._save_state(task_id, state_info)
 
+    def reset_all(self) -> None:
+        """Reset circuit breaker state for all tasks."""
+        self._states.clear()
+
     def _get_state(self, task_id: str) -> Dict[str, any]:
         """Get state info for a task."""
         if task_id not in self._states:
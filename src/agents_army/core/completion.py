@@ -6,6 +6,30 @@ from typing import Any, Dict, List, Optional
 
 from agents_army.core.models import Task, TaskResult
 
+# Patterns are matched against lower-cased agent output
+_EXIT_SIGNAL_RE = re.compile(r"exit_signal\s*[:=]\s*(true|1|yes)")
+_RALPH_STATUS_RE = re.compile(r"ralph_status[:\s]*\{[^}]*exit_signal[:\s]*(true|1|yes)")
+
+# Strong completion phrases count as 2 indicators each
+_STRONG_COMPLETION_PHRASES = (
+    "all tasks complete",
+    "all tasks completed",
+    "project complete",
+    "project completed",
+    "everything is done",
+    "all done",
+    "fully complete",
+    "completely finished",
+    "ready for review",
+    "ready to deploy",
+    "ready for production",
+)
+
+# Medium completion words, matched as standalone words only
+_MEDIUM_COMPLETION_RE = re.compile(
+    r"\b(?:complete|completed|done|finished|ready|successful|successfully)\b"
+)
+
 
 @dataclass
 class CompletionCriteria:
@@ -150,13 +174,11 @@ class CompletionCriteria:
         # Check for explicit EXIT_SIGNAL
         if "exit_signal" in output_lower:
             # Look for EXIT_SIGNAL: true pattern
-            pattern = r"exit_signal\s*[:=]\s*(true|1|yes)"
-            if re.search(pattern, output_lower):
+            if _EXIT_SIGNAL_RE.search(output_lower):
                 return True
 
         # Check for RALPH_STATUS block
-        ralph_pattern = r"ralph_status[:\s]*\{[^}]*exit_signal[:\s]*(true|1|yes)"
-        if re.search(ralph_pattern, output_lower, re.IGNORECASE):
+        if _RALPH_STATUS_RE.search(output_lower):
             return True
 
         return False
@@ -182,41 +204,12 @@ class CompletionCriteria:
         output_lower = agent_output.lower()
         count = 0
 
-        # Strong completion phrases
-        strong_phrases = [
-            "all tasks complete",
-            "all tasks completed",
-            "project complete",
-            "project completed",
-            "everything is done",
-            "all done",
-            "fully complete",
-            "completely finished",
-            "ready for review",
-            "ready to deploy",
-            "ready for production",
-        ]
-
-        for phrase in strong_phrases:
+        for phrase in _STRONG_COMPLETION_PHRASES:
             if phrase in output_lower:
                 count += 2  # Strong indicators count as 2
 
-        # Medium completion phrases
-        medium_phrases = [
-            "complete",
-            "completed",
-            "done",
-            "finished",
-            "ready",
-            "successful",
-            "successfully",
-        ]
-
-        for phrase in medium_phrases:
-            # Count standalone words, not substrings
-            pattern = r"\b" + re.escape(phrase) + r"\b"
-            matches = len(re.findall(pattern, output_lower))
-            count += matches
+        # Count standalone words, not substrings
+        count += len(_MEDIUM_COMPLETION_RE.findall(output_lower))
 
         # Check for explicit completion blocks
         if "completion:" in output_lower or "status: complete" in output_lower:
@@ -1,27 +1,43 @@
 """Configuration management for agents."""
 
+import copy
 import json
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import yaml
 
 from agents_army.core.agent import AgentConfig
 from agents_army.protocol.types import AgentRole
 
+# Use the libyaml C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs keyed by (resolved path, mtime_ns, size), least recently used first
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 128
+
+# Role lookup by config key, without raising for unknown roles
+_ROLES_BY_VALUE = {role.value: role for role in AgentRole}
+
 
 class ConfigLoader:
     """Loader for agent configuration from YAML/JSON files."""
 
     @staticmethod
-    def load_from_file(file_path: str) -> Dict[str, Any]:
+    def load_from_file(file_path: str, json_cache: bool = False) -> Dict[str, Any]:
         """
         Load configuration from a file.
 
-        Supports both YAML (.yaml, .yml) and JSON (.json) formats.
+        Supports both YAML (.yaml, .yml) and JSON (.json) formats. Parsed
+        configs are memoized until the file's mtime or size changes; each call
+        returns its own copy.
 
         Args:
             file_path: Path to configuration file
+            json_cache: If True, keep a sibling ``<name>.cache.json`` copy of
+                parsed YAML and read it instead while it is newer than the YAML
 
         Returns:
             Configuration dictionary
@@ -30,21 +46,87 @@ class ConfigLoader:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is not supported
         """
+        return copy.deepcopy(ConfigLoader._load_shared(file_path, json_cache))
+
+    @staticmethod
+    def _load_shared(file_path: str, json_cache: bool = False) -> Dict[str, Any]:
+        """Load configuration, returning the memoized dict itself (callers must not mutate it)."""
         path = Path(file_path)
 
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            if path.suffix in (".yaml", ".yml"):
-                return yaml.safe_load(f) or {}
-            elif path.suffix == ".json":
-                return json.load(f)
-            else:
-                raise ValueError(
-                    f"Unsupported file format: {path.suffix}. "
-                    "Supported formats: .yaml, .yml, .json"
-                )
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            _CONFIG_CACHE.move_to_end(key)
+            return cached
+
+        data = ConfigLoader._parse_file(path, json_cache)
+        _CONFIG_CACHE[key] = data
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+        return data
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all memoized configuration files."""
+        _CONFIG_CACHE.clear()
+
+    @staticmethod
+    def _parse_file(path: Path, json_cache: bool) -> Dict[str, Any]:
+        """Parse a configuration file according to its suffix."""
+        if path.suffix in (".yaml", ".yml"):
+            if json_cache:
+                cached = ConfigLoader._read_json_cache(path)
+                if cached is not None:
+                    return cached
+            with open(path, encoding="utf-8") as f:
+                data: Dict[str, Any] = yaml.load(f, Loader=_YAML_LOADER) or {}
+            if json_cache:
+                ConfigLoader._write_json_cache(path, data)
+            return data
+        elif path.suffix == ".json":
+            with open(path, encoding="utf-8") as f:
+                return cast(Dict[str, Any], json.load(f))
+        else:
+            raise ValueError(
+                f"Unsupported file format: {path.suffix}. " "Supported formats: .yaml, .yml, .json"
+            )
+
+    @staticmethod
+    def _json_cache_path(path: Path) -> Path:
+        """Get path of the JSON cache kept next to a YAML file."""
+        return path.with_name(f"{path.name}.cache.json")
+
+    @staticmethod
+    def _read_json_cache(path: Path) -> Optional[Dict[str, Any]]:
+        """Read the JSON cache for a YAML file if it is newer than the YAML."""
+        cache_path = ConfigLoader._json_cache_path(path)
+        try:
+            if cache_path.stat().st_mtime_ns < path.stat().st_mtime_ns:
+                return None
+            with open(cache_path, encoding="utf-8") as f:
+                return cast(Dict[str, Any], json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json_cache(path: Path, data: Dict[str, Any]) -> None:
+        """Write the JSON cache for a YAML file if JSON can represent it exactly."""
+        try:
+            text = json.dumps(data, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return  # e.g. YAML dates
+        if json.loads(text) != data:
+            return  # e.g. non-string mapping keys
+
+        try:
+            with open(ConfigLoader._json_cache_path(path), "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass  # Cache is best effort (read-only directories)
 
     @staticmethod
     def create_agent_config(config_dict: Dict[str, Any], role: AgentRole) -> AgentConfig:
@@ -100,17 +182,14 @@ class ConfigLoader:
         Returns:
             Dictionary mapping AgentRole to AgentConfig
         """
-        config = ConfigLoader.load_from_file(config_path)
-        agents_config = config.get("agents", {})
-
-        agent_configs = {}
-        for role_str, agent_dict in agents_config.items():
-            try:
-                role = AgentRole(role_str)
-                agent_config = ConfigLoader.create_agent_config(agent_dict, role)
-                agent_configs[role] = agent_config
-            except ValueError:
-                # Skip invalid roles
-                continue
-
-        return agent_configs
+        # Only read from the parsed config, so skip the defensive copy
+        agents_config = ConfigLoader._load_shared(config_path).get("agents", {})
+
+        # Skip invalid roles
+        return {
+            _ROLES_BY_VALUE[role_str]: ConfigLoader.create_agent_config(
+                agent_dict, _ROLES_BY_VALUE[role_str]
+            )
+            for role_str, agent_dict in agents_config.items()
+            if role_str in _ROLES_BY_VALUE
+        }
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional
 from agents_army.protocol.types import AgentRole
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a task in the system."""
 
@@ -129,7 +129,7 @@ class Project:
         return project
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of task execution."""
 
@@ -231,7 +231,7 @@ class ActionResult:
 # Conflict Resolution Models
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConflict:
     """Represents a conflict between agents."""
 
@@ -245,7 +245,7 @@ class AgentConflict:
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictResolution:
     """Resolution for an agent conflict."""
 
@@ -1,10 +1,12 @@
 """Task progress tracking for autonomous loops."""
 
 import json
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from agents_army.core.task_storage import TaskStorage
 
@@ -47,8 +49,21 @@ class IterationRecord:
         )
 
 
+# Iterations kept per task, on disk and in the in-memory summary cache
+MAX_ITERATIONS = 100
+
+# (has_progress, errors) per iteration, oldest first
+_IterationSummary = Tuple[bool, Tuple[str, ...]]
+
+
 class TaskProgressTracker:
-    """Tracks progress of task execution across iterations."""
+    """
+    Tracks progress of task execution across iterations.
+
+    Progress files are the durable record. The progress and error checks used
+    on every loop iteration read a per-task summary cache instead, loaded
+    from disk once and refreshed whenever this tracker records iterations.
+    """
 
     def __init__(self, task_storage: TaskStorage):
         """
@@ -60,6 +75,7 @@ class TaskProgressTracker:
         self.task_storage = task_storage
         self.progress_dir = Path(task_storage.project_path) / "tasks" / "progress"
         self.progress_dir.mkdir(parents=True, exist_ok=True)
+        self._recent: Dict[str, Deque[_IterationSummary]] = {}
 
     def _get_progress_file(self, task_id: str) -> Path:
         """
@@ -93,40 +109,102 @@ class TaskProgressTracker:
             agent_output: Output from agent
             errors: List of errors encountered
         """
-        # Load existing progress
-        progress = self._load_progress(task_id)
-
-        # Determine if there's progress
-        has_progress = self._determine_progress(
-            file_changes, test_results, errors, progress.get("iterations", [])
+        self.record_iterations_bulk(
+            task_id,
+            [
+                {
+                    "iteration": iteration,
+                    "file_changes": file_changes,
+                    "test_results": test_results,
+                    "agent_output": agent_output,
+                    "errors": errors,
+                }
+            ],
         )
 
-        # Create iteration record
-        record = IterationRecord(
-            iteration=iteration,
-            timestamp=datetime.now(),
-            file_changes=file_changes,
-            test_results=test_results,
-            agent_output=agent_output,
-            errors=errors,
-            has_progress=has_progress,
-        )
+    def record_iterations_bulk(self, task_id: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Record several iterations with a single load and save of the progress file.
+
+        Args:
+            task_id: Task ID
+            entries: Iteration entries with the same keys as record_iteration
+                arguments (iteration, file_changes, test_results, agent_output, errors)
+        """
+        if not entries:
+            return
 
-        # Add to progress
+        # Load existing progress
+        progress = self._load_progress(task_id)
         if "iterations" not in progress:
             progress["iterations"] = []
-        progress["iterations"].append(record.to_dict())
-
-        # Keep only last 100 iterations
-        if len(progress["iterations"]) > 100:
-            progress["iterations"] = progress["iterations"][-100:]
+        iterations = progress["iterations"]
+
+        for entry in entries:
+            file_changes = entry.get("file_changes", [])
+            test_results = entry.get("test_results", {})
+            errors = entry.get("errors", [])
+
+            # Determine if there's progress
+            has_progress = self._determine_progress(file_changes, test_results, errors, iterations)
+
+            # Create iteration record
+            record = IterationRecord(
+                iteration=entry["iteration"],
+                timestamp=datetime.now(),
+                file_changes=file_changes,
+                test_results=test_results,
+                agent_output=entry.get("agent_output", ""),
+                errors=errors,
+                has_progress=has_progress,
+            )
+            iterations.append(record.to_dict())
+
+        # Keep only the most recent iterations
+        if len(iterations) > MAX_ITERATIONS:
+            progress["iterations"] = iterations[-MAX_ITERATIONS:]
 
         # Update metadata
-        progress["last_iteration"] = iteration
+        progress["last_iteration"] = entries[-1]["iteration"]
         progress["last_updated"] = datetime.now().isoformat()
 
         # Save progress
         self._save_progress(task_id, progress)
+        self._recent[task_id] = self._summarize(progress["iterations"])
+
+    @staticmethod
+    def _summarize(iterations: List[Dict[str, Any]]) -> Deque[_IterationSummary]:
+        """Build the summary cache entry for a task's iteration records."""
+        return deque(
+            (
+                (record.get("has_progress", False), tuple(record.get("errors", [])))
+                for record in iterations
+            ),
+            maxlen=MAX_ITERATIONS,
+        )
+
+    def _recent_iterations(self, task_id: str) -> Deque[_IterationSummary]:
+        """
+        Get the cached iteration summaries for a task, loading them on first use.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Summaries of the task's recorded iterations, oldest first
+        """
+        recent = self._recent.get(task_id)
+        if recent is None:
+            iterations = self._load_progress(task_id).get("iterations", [])
+            recent = self._recent[task_id] = self._summarize(iterations)
+        return recent
+
+    @staticmethod
+    def _last(recent: Deque[_IterationSummary], n: int) -> List[_IterationSummary]:
+        """Get the last n summaries, oldest first."""
+        if n <= 0:
+            return list(recent)  # Matches iterations[-0:] slicing the whole list
+        return list(islice(reversed(recent), n))[::-1]
 
     def _determine_progress(
         self,
@@ -179,16 +257,14 @@ class TaskProgressTracker:
         Returns:
             True if there's progress, False otherwise
         """
-        progress = self._load_progress(task_id)
-        iterations = progress.get("iterations", [])
+        iterations = self._recent_iterations(task_id)
 
         if len(iterations) < last_n:
             # Not enough iterations yet
             return True  # Assume progress if just starting
 
         # Check last N iterations
-        recent = iterations[-last_n:]
-        return any(iter_record.get("has_progress", False) for iter_record in recent)
+        return any(has_progress for has_progress, _ in self._last(iterations, last_n))
 
     def is_stuck(self, task_id: str) -> bool:
         """
@@ -200,22 +276,21 @@ class TaskProgressTracker:
         Returns:
             True if stuck, False otherwise
         """
-        progress = self._load_progress(task_id)
-        iterations = progress.get("iterations", [])
+        iterations = self._recent_iterations(task_id)
 
         if len(iterations) < 3:
             return False  # Need at least 3 iterations to determine if stuck
 
         # Check last 3 iterations
-        recent = iterations[-3:]
+        recent = self._last(iterations, 3)
 
         # Stuck if no progress in last 3 iterations
-        has_any_progress = any(iter_record.get("has_progress", False) for iter_record in recent)
+        has_any_progress = any(has_progress for has_progress, _ in recent)
         if has_any_progress:
             return False
 
         # Check for repeated errors
-        errors_list = [iter_record.get("errors", []) for iter_record in recent]
+        errors_list = [errors for _, errors in recent]
         if not all(errors_list):
             return False  # Not all iterations have errors
 
@@ -260,17 +335,15 @@ class TaskProgressTracker:
         Returns:
             List of unique error patterns
         """
-        progress = self._load_progress(task_id)
-        iterations = progress.get("iterations", [])
+        iterations = self._recent_iterations(task_id)
 
         if not iterations:
             return []
 
         # Get errors from last N iterations
-        recent = iterations[-last_n:]
-        all_errors = []
-        for iter_record in recent:
-            all_errors.extend(iter_record.get("errors", []))
+        all_errors: List[str] = []
+        for _, errors in self._last(iterations, last_n):
+            all_errors.extend(errors)
 
         # Return unique errors
         return list(set(all_errors))
@@ -285,8 +358,7 @@ class TaskProgressTracker:
         Returns:
             Number of iterations
         """
-        progress = self._load_progress(task_id)
-        return len(progress.get("iterations", []))
+        return len(self._recent_iterations(task_id))
 
     def _load_progress(self, task_id: str) -> Dict[str, Any]:
         """
@@ -337,6 +409,7 @@ class TaskProgressTracker:
         Args:
             task_id: Task ID
         """
+        self._recent.pop(task_id, None)
         progress_file = self._get_progress_file(task_id)
         if progress_file.exists():
             progress_file.unlink()
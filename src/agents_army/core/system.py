@@ -58,6 +58,18 @@ class AgentSystem:
         await self.router.stop()
         self._initialized = False
 
+    def reset(self) -> None:
+        """
+        Return the system to its freshly constructed state.
+
+        Clears registered agents, routing handlers and queued messages in
+        place, so a long-lived instance (such as the singleton) can be reused.
+        Call it after stop(); a running router is not stopped.
+        """
+        self.registry.clear()
+        self.router.clear()
+        self._initialized = False
+
     def register_agent(self, agent: Agent) -> None:
         """
         Register an agent with the system.
@@ -131,7 +143,7 @@ class AgentSystem:
 
         async def agent_handler(message: AgentMessage):
             """Handler that routes messages to agent."""
-            if message.get_to_roles() and agent.role in message.get_to_roles():
+            if agent.role in message.get_to_roles():
                 await agent.handle_message(message)
 
         self.router.register_handler(agent.role, agent_handler)
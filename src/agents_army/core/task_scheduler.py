@@ -1,7 +1,9 @@
 """Task scheduler for intelligent task scheduling and prioritization."""
 
+import heapq
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agents_army.core.models import Task
 
@@ -35,29 +37,49 @@ class TaskScheduler:
         Returns:
             List of tasks in scheduled order
         """
-        # Build dependency graph
-        task_map = {task.id: task for task in tasks}
-        ready_tasks = [t for t in tasks if t.is_ready()]
-        scheduled = []
-        scheduled_ids = set()
+        dependents, in_degree = self._build_graph(tasks)
+        return self._schedule(tasks, dependents, in_degree)
 
-        # Sort ready tasks by priority (highest first)
-        ready_tasks.sort(key=lambda t: t.priority, reverse=True)
+    def _schedule(
+        self, tasks: List[Task], dependents: Dict[str, List[int]], in_degree: List[int]
+    ) -> List[Task]:
+        """
+        Order tasks by priority over a prebuilt dependency graph.
 
-        # Schedule ready tasks first
-        while ready_tasks:
-            task = ready_tasks.pop(0)
-            if task.id not in scheduled_ids:
-                scheduled.append(task)
-                scheduled_ids.add(task.id)
+        Args:
+            tasks: List of tasks
+            dependents: Task ID -> indices of tasks depending on it
+            in_degree: In-degree per task index (consumed)
 
-                # Check if any dependent tasks are now ready
-                for other_task in tasks:
-                    if task.id in other_task.dependencies and other_task.id not in scheduled_ids:
-                        other_task.remove_dependency(task.id)
-                        if other_task.is_ready():
-                            ready_tasks.append(other_task)
-                            ready_tasks.sort(key=lambda t: t.priority, reverse=True)
+        Returns:
+            List of tasks in scheduled order
+        """
+        scheduled = []
+        scheduled_ids = set()
+
+        # Ready tasks by priority (highest first), then by the order they became ready
+        ready: List[Tuple[int, int, int]] = []
+        counter = 0
+        for index, task in enumerate(tasks):
+            if in_degree[index] == 0:
+                ready.append((-task.priority, counter, index))
+                counter += 1
+        heapq.heapify(ready)
+
+        while ready:
+            _, _, index = heapq.heappop(ready)
+            task = tasks[index]
+            if task.id in scheduled_ids:
+                continue
+            scheduled.append(task)
+            scheduled_ids.add(task.id)
+
+            # Check if any dependent tasks are now ready
+            for dependent in dependents.get(task.id, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, (-tasks[dependent].priority, counter, dependent))
+                    counter += 1
 
         # Add any remaining tasks (may have circular dependencies)
         for task in tasks:
@@ -66,6 +88,28 @@ class TaskScheduler:
 
         return scheduled
 
+    @staticmethod
+    def _build_graph(tasks: List[Task]) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Build the dependency graph for a list of tasks.
+
+        Dependencies on tasks outside the list are counted but never satisfied.
+
+        Args:
+            tasks: List of tasks
+
+        Returns:
+            Tuple of (task ID -> indices of tasks depending on it, in-degree per index)
+        """
+        dependents: Dict[str, List[int]] = {}
+        in_degree = []
+        for index, task in enumerate(tasks):
+            dependencies = set(task.dependencies)
+            in_degree.append(len(dependencies))
+            for dependency_id in dependencies:
+                dependents.setdefault(dependency_id, []).append(index)
+        return dependents, in_degree
+
     def estimate_duration(self, task: Task) -> timedelta:
         """
         Estimate task duration.
@@ -99,31 +143,64 @@ class TaskScheduler:
         """
         Find critical path through task dependencies.
 
+        The critical path is the dependency chain with the longest total
+        estimated duration. Tasks caught in dependency cycles are ignored.
+
         Args:
             tasks: List of tasks
 
         Returns:
-            List of task IDs in critical path
+            List of task IDs in critical path, in execution order
+        """
+        dependents, in_degree = self._build_graph(tasks)
+        path, _ = self._critical_path(tasks, dependents, in_degree)
+        return [tasks[index].id for index in path]
+
+    def _critical_path(
+        self, tasks: List[Task], dependents: Dict[str, List[int]], in_degree: List[int]
+    ) -> Tuple[List[int], timedelta]:
         """
-        task_map = {task.id: task for task in tasks}
-        in_degree = {task.id: len(task.dependencies) for task in tasks}
-        critical_path = []
+        Longest-duration path over a prebuilt dependency graph.
 
-        # Find tasks with no dependencies (start nodes)
-        queue = [task.id for task in tasks if len(task.dependencies) == 0]
+        Walks the tasks in topological order, tracking for each task the
+        latest finish time of its dependencies and which one set it.
 
-        while queue:
-            current_id = queue.pop(0)
-            critical_path.append(current_id)
+        Args:
+            tasks: List of tasks
+            dependents: Task ID -> indices of tasks depending on it
+            in_degree: In-degree per task index (consumed)
 
-            # Find tasks that depend on current task
-            for task in tasks:
-                if current_id in task.dependencies:
-                    in_degree[task.id] -= 1
-                    if in_degree[task.id] == 0:
-                        queue.append(task.id)
+        Returns:
+            Tuple of (task indices on the critical path, total path duration)
+        """
+        start = [timedelta()] * len(tasks)
+        finish: Dict[int, timedelta] = {}
+        parent = [-1] * len(tasks)
 
-        return critical_path
+        queue = deque(index for index, degree in enumerate(in_degree) if degree == 0)
+        while queue:
+            index = queue.popleft()
+            finish[index] = start[index] + self.estimate_duration(tasks[index])
+
+            for dependent in dependents.get(tasks[index].id, ()):
+                if parent[dependent] == -1 or finish[index] > start[dependent]:
+                    start[dependent] = finish[index]
+                    parent[dependent] = index
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        if not finish:
+            return [], timedelta()
+
+        end = max(finish, key=finish.__getitem__)
+        path = []
+        index = end
+        while index != -1:
+            path.append(index)
+            index = parent[index]
+        path.reverse()
+        return path, finish[end]
 
     def optimize_schedule(
         self,
@@ -140,13 +217,10 @@ class TaskScheduler:
         Returns:
             Optimization result with schedule and metrics
         """
-        scheduled = self.schedule_tasks(tasks)
-        critical_path = self.find_critical_path(tasks)
-
-        total_duration = timedelta()
-        for task_id in critical_path:
-            task = next(t for t in tasks if t.id == task_id)
-            total_duration += self.estimate_duration(task)
+        dependents, in_degree = self._build_graph(tasks)
+        scheduled = self._schedule(tasks, dependents, list(in_degree))
+        path, total_duration = self._critical_path(tasks, dependents, in_degree)
+        critical_path = [tasks[index].id for index in path]
 
         on_time = True
         if deadline:
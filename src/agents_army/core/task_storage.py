@@ -1,26 +1,94 @@
 """Task storage and persistence."""
 
-import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from agents_army.core.models import Task
+from agents_army.utils.serialization import json_dumps, json_loads
 
 
 class TaskStorage:
-    """Storage for tasks using file system."""
+    """
+    Storage for tasks using file system.
 
-    def __init__(self, project_path: str):
+    Each task is a JSON file under a directory per status. With ``use_wal``
+    enabled, saves are appended to a single ``tasks.ndjson`` log instead and
+    written out to the per-task files by ``compact()``.
+    """
+
+    WAL_FILENAME = "tasks.ndjson"
+
+    def __init__(self, project_path: str, use_wal: bool = False):
         """
         Initialize task storage.
 
         Args:
             project_path: Path to .dt directory
+            use_wal: Append saves to a write-ahead log until compact() is called
         """
         self.project_path = Path(project_path)
         self.tasks_dir = self.project_path / "tasks"
         self._ensure_directories()
 
+        self.use_wal = use_wal
+        self._wal_path = self.tasks_dir / self.WAL_FILENAME
+        self._wal: Optional[BinaryIO] = None
+        # Task ID -> (status directory, task data) not yet compacted; None marks a deletion
+        self._pending: Dict[str, Optional[Tuple[Optional[str], Dict[str, Any]]]] = {}
+        if use_wal:
+            self._replay_wal()
+
+    def _replay_wal(self) -> None:
+        """Load entries left in the write-ahead log by a previous run."""
+        try:
+            with open(self._wal_path, "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                entry = json_loads(line)
+            except ValueError:
+                continue  # Torn write at the end of the log
+            task = entry.get("task")
+            self._pending[entry["id"]] = (entry["status"], task) if task is not None else None
+
+    def _append_wal(
+        self, task_id: str, status: Optional[str], data: Optional[Dict[str, Any]]
+    ) -> None:
+        """Append one entry to the write-ahead log."""
+        if self._wal is None:
+            self._wal = open(self._wal_path, "ab", buffering=0)
+        self._wal.write(json_dumps({"id": task_id, "status": status, "task": data}, False) + b"\n")
+        self._pending[task_id] = (status, data) if data is not None else None
+
+    def compact(self) -> None:
+        """Write logged tasks to their task files and truncate the write-ahead log."""
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+
+        for task_id, entry in self._pending.items():
+            if entry is None:
+                continue
+            status, data = entry
+            # Drop the copy left in another status directory by a logged status change
+            for status_dir in ["pending", "in-progress", "done", "blocked"]:
+                if status_dir != status:
+                    (self.tasks_dir / status_dir / f"{task_id}.json").unlink(missing_ok=True)
+            with open(self._get_task_file(task_id, status), "wb") as f:
+                f.write(json_dumps(data))
+
+        self._pending.clear()
+        self._wal_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Compact any logged tasks and release the write-ahead log."""
+        if self.use_wal:
+            self.compact()
+
     def _ensure_directories(self) -> None:
         """Ensure task directories exist."""
         for status in ["pending", "in-progress", "done", "blocked"]:
@@ -55,9 +123,13 @@ class TaskStorage:
         Args:
             task: Task to save
         """
+        if self.use_wal:
+            self._append_wal(task.id, task.status, task.to_dict())
+            return
+
         task_file = self._get_task_file(task.id, task.status)
-        with open(task_file, "w", encoding="utf-8") as f:
-            json.dump(task.to_dict(), f, indent=2, ensure_ascii=False)
+        with open(task_file, "wb") as f:
+            f.write(json_dumps(task.to_dict()))
 
     def load_task(self, task_id: str) -> Optional[Task]:
         """
@@ -69,12 +141,16 @@ class TaskStorage:
         Returns:
             Task or None if not found
         """
+        if task_id in self._pending:
+            entry = self._pending[task_id]
+            return Task.from_dict(entry[1]) if entry is not None else None
+
         task_file = self._get_task_file(task_id)
         if not task_file.exists():
             return None
 
-        with open(task_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(task_file, "rb") as f:
+            data = json_loads(f.read())
             return Task.from_dict(data)
 
     def move_task(self, task_id: str, old_status: str, new_status: str) -> None:
@@ -86,6 +162,12 @@ class TaskStorage:
             old_status: Current status
             new_status: New status
         """
+        entry = self._pending.get(task_id)
+        if entry is not None:
+            if entry[0] == old_status:
+                self._append_wal(task_id, new_status, entry[1])
+            return
+
         old_file = self.tasks_dir / old_status / f"{task_id}.json"
         new_file = self.tasks_dir / new_status / f"{task_id}.json"
 
@@ -114,14 +196,21 @@ class TaskStorage:
             status_dirs = ["pending", "in-progress", "done", "blocked"]
 
         for status_dir in status_dirs:
-            status_path = self.tasks_dir / status_dir
-            if not status_path.exists():
+            try:
+                entries = os.scandir(self.tasks_dir / status_dir)
+            except (FileNotFoundError, NotADirectoryError):
                 continue
 
-            for task_file in status_path.glob("*.json"):
+            # Same files glob("*.json") would match, without a Path per entry
+            with entries:
+                task_files = [entry.path for entry in entries if entry.name.endswith(".json")]
+
+            for task_file in task_files:
                 try:
-                    with open(task_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    with open(task_file, "rb") as f:
+                        data = json_loads(f.read())
+                        if data.get("id") in self._pending:
+                            continue  # Superseded by the write-ahead log
                         tasks.append(Task.from_dict(data))
                 except Exception:
                     continue
@@ -129,6 +218,12 @@ class TaskStorage:
                 if len(tasks) >= limit:
                     return tasks
 
+        for entry in self._pending.values():
+            if len(tasks) >= limit:
+                break
+            if entry is not None and entry[0] in status_dirs:
+                tasks.append(Task.from_dict(entry[1]))
+
         return tasks
 
     def delete_task(self, task_id: str) -> None:
@@ -138,6 +233,9 @@ class TaskStorage:
         Args:
             task_id: Task ID
         """
+        if self.use_wal:
+            self._append_wal(task_id, None, None)
+
         task_file = self._get_task_file(task_id)
         if task_file.exists():
             task_file.unlink()
@@ -1,13 +1,15 @@
 """Cost tracking for LLM usage."""
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from agents_army.cost.alerts import BudgetAlerts
+from agents_army.utils.columns import ColumnarSequence, StringInterner
 
 
-@dataclass
+@dataclass(slots=True)
 class CostRecord:
     """Record of a cost event."""
 
@@ -17,7 +19,20 @@ class CostRecord:
     cost: float
     agent_id: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Dict[str, any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class _CostRecordView(ColumnarSequence[CostRecord]):
+    """Read-only sequence over a tracker's cost columns, building records on access."""
+
+    def __init__(self, tracker: "CostTracker"):
+        self._tracker = tracker
+
+    def __len__(self) -> int:
+        return len(self._tracker._cost)
+
+    def _row(self, index: int) -> CostRecord:
+        return self._tracker._record_at(index)
 
 
 class CostTracker:
@@ -44,10 +59,69 @@ class CostTracker:
         Args:
             budget: Optional budget limit
         """
-        self.costs: List[CostRecord] = []
         self.budget = budget
         self.alerts = BudgetAlerts(budget) if budget else None
 
+        # Per-token prices, divided once instead of on every calculation
+        self._unit_input = {m: p["input"] / 1_000_000 for m, p in self.MODEL_PRICING.items()}
+        self._unit_output = {m: p["output"] / 1_000_000 for m, p in self.MODEL_PRICING.items()}
+
+        # Running aggregates, updated as records are added. Model and agent
+        # names are interned to small ints that index the per-key totals.
+        self._total_cost = 0.0
+        self._models = StringInterner()
+        self._agents = StringInterner()
+        self._cost_by_model: List[float] = []
+        self._cost_by_agent: List[float] = []
+
+        # Records are stored column-wise; CostRecord objects are only built
+        # when read back through ``costs``. Agent column uses -1 for no agent.
+        self._cost = array("d")
+        self._input_tokens = array("q")
+        self._output_tokens = array("q")
+        self._model_col = array("i")
+        self._agent_col = array("i")
+        self._timestamp = array("d")
+        self._metadata: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def costs(self) -> ColumnarSequence[CostRecord]:
+        """Recorded costs, as a read-only sequence of CostRecord."""
+        return _CostRecordView(self)
+
+    @staticmethod
+    def _intern(interner: StringInterner, totals: List[float], key: str) -> int:
+        """
+        Get the integer ID for a key, starting a zero total for a new one.
+
+        Args:
+            interner: Interner for model names or agent IDs
+            totals: Per-ID totals, extended when a new ID is assigned
+            key: Model name or agent ID
+
+        Returns:
+            Integer ID for the key
+        """
+        key_id = interner.intern(key)
+        if key_id == len(totals):
+            totals.append(0.0)
+        return key_id
+
+    def _record_at(self, index: int) -> CostRecord:
+        """Build the CostRecord stored at a column index."""
+        metadata = self._metadata.get(index)
+        if metadata is None:
+            metadata = self._metadata[index] = {}
+        return CostRecord(
+            model=self._models.names[self._model_col[index]],
+            input_tokens=self._input_tokens[index],
+            output_tokens=self._output_tokens[index],
+            cost=self._cost[index],
+            agent_id=self._agents.name(self._agent_col[index]),
+            timestamp=datetime.fromtimestamp(self._timestamp[index]),
+            metadata=metadata,
+        )
+
     def calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """
         Calculate cost for LLM call.
@@ -60,12 +134,10 @@ class CostTracker:
         Returns:
             Cost in USD
         """
-        pricing = self.MODEL_PRICING.get(model, {"input": 0.0, "output": 0.0})
-
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-
-        return input_cost + output_cost
+        return (
+            self._unit_input.get(model, 0.0) * input_tokens
+            + self._unit_output.get(model, 0.0) * output_tokens
+        )
 
     def record_llm_cost(
         self,
@@ -73,7 +145,7 @@ class CostTracker:
         input_tokens: int,
         output_tokens: int,
         agent_id: Optional[str] = None,
-        metadata: Optional[Dict[str, any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> CostRecord:
         """
         Record an LLM cost.
@@ -89,24 +161,31 @@ class CostTracker:
             Cost record
         """
         cost = self.calculate_cost(model, input_tokens, output_tokens)
-
-        record = CostRecord(
-            model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost=cost,
-            agent_id=agent_id,
-            metadata=metadata or {},
-        )
-
-        self.costs.append(record)
+        model_id = self._intern(self._models, self._cost_by_model, model)
+        agent = -1
+        if agent_id:
+            agent = self._intern(self._agents, self._cost_by_agent, agent_id)
+            self._cost_by_agent[agent] += cost
+
+        index = len(self._cost)
+        self._cost.append(cost)
+        self._input_tokens.append(input_tokens)
+        self._output_tokens.append(output_tokens)
+        self._model_col.append(model_id)
+        self._agent_col.append(agent)
+        self._timestamp.append(datetime.now().timestamp())
+        if metadata:
+            self._metadata[index] = metadata
+
+        self._total_cost += cost
+        self._cost_by_model[model_id] += cost
 
         # Check budget
-        if self.budget and self.get_total_cost() > self.budget:
+        if self.budget and self._total_cost > self.budget:
             if self.alerts:
-                self.alerts.trigger_alert(self.get_total_cost(), self.budget)
+                self.alerts.trigger_alert(self._total_cost, self.budget)
 
-        return record
+        return self._record_at(index)
 
     def get_total_cost(self) -> float:
         """
@@ -115,7 +194,7 @@ class CostTracker:
         Returns:
             Total cost in USD
         """
-        return sum(record.cost for record in self.costs)
+        return self._total_cost
 
     def get_cost_by_model(self) -> Dict[str, float]:
         """
@@ -124,10 +203,7 @@ class CostTracker:
         Returns:
             Dictionary mapping model to total cost
         """
-        breakdown: Dict[str, float] = {}
-        for record in self.costs:
-            breakdown[record.model] = breakdown.get(record.model, 0.0) + record.cost
-        return breakdown
+        return dict(zip(self._models.names, self._cost_by_model, strict=True))
 
     def get_cost_by_agent(self) -> Dict[str, float]:
         """
@@ -136,11 +212,7 @@ class CostTracker:
         Returns:
             Dictionary mapping agent_id to total cost
         """
-        breakdown: Dict[str, float] = {}
-        for record in self.costs:
-            if record.agent_id:
-                breakdown[record.agent_id] = breakdown.get(record.agent_id, 0.0) + record.cost
-        return breakdown
+        return dict(zip(self._agents.names, self._cost_by_agent, strict=True))
 
     def get_recent_costs(self, hours: int = 24) -> List[CostRecord]:
         """
@@ -154,9 +226,25 @@ class CostTracker:
         """
         from datetime import timedelta
 
-        cutoff = datetime.now() - timedelta(hours=hours)
-        return [record for record in self.costs if record.timestamp >= cutoff]
+        cutoff = (datetime.now() - timedelta(hours=hours)).timestamp()
+        return [
+            self._record_at(i) for i, timestamp in enumerate(self._timestamp) if timestamp >= cutoff
+        ]
 
     def reset(self) -> None:
         """Reset all cost records."""
-        self.costs.clear()
+        for column in (
+            self._cost,
+            self._input_tokens,
+            self._output_tokens,
+            self._model_col,
+            self._agent_col,
+            self._timestamp,
+        ):
+            del column[:]
+        self._metadata.clear()
+        self._total_cost = 0.0
+        self._models.clear()
+        self._agents.clear()
+        self._cost_by_model.clear()
+        self._cost_by_agent.clear()
@@ -1,10 +1,16 @@
 """MCP Server implementation."""
 
-from typing import Any, Dict, List, Optional
+import bisect
+import heapq
+import operator
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agents_army.mcp.models import MCPResource, MCPServerConfig, MCPTool
 from agents_army.protocol.types import AgentRole
 
+_position = operator.itemgetter(0)
+
 
 class MCPServer:
     """
@@ -24,6 +30,48 @@ class MCPServer:
         self.config = config
         self.tools: Dict[str, MCPTool] = {}
         self.resources: Dict[str, MCPResource] = {}
+        # Role -> entries index so get_tools/get_resources avoid a full scan.
+        # Entries with an empty accessible_by list are open to every role.
+        # Each list holds (position, entry) pairs sorted by the entry's
+        # position in self.tools / self.resources, so merging the unrestricted
+        # and per-role lists keeps registration order.
+        self._unrestricted_tools: List[Tuple[int, MCPTool]] = []
+        self._tools_by_role: Dict[AgentRole, List[Tuple[int, MCPTool]]] = defaultdict(list)
+        self._unrestricted_resources: List[Tuple[int, MCPResource]] = []
+        self._resources_by_role: Dict[AgentRole, List[Tuple[int, MCPResource]]] = defaultdict(list)
+        self._tool_positions: Dict[str, int] = {}
+        self._resource_positions: Dict[str, int] = {}
+
+    @staticmethod
+    def _index_add(
+        position: int,
+        entry: Union[MCPTool, MCPResource],
+        unrestricted: List[Any],
+        by_role: Dict[AgentRole, List[Any]],
+    ) -> None:
+        """Add a tool or resource to a role index at its registration position."""
+        if not entry.accessible_by:
+            bisect.insort(unrestricted, (position, entry), key=_position)
+            return
+        for role in dict.fromkeys(entry.accessible_by):
+            bisect.insort(by_role[role], (position, entry), key=_position)
+
+    @staticmethod
+    def _index_remove(
+        position: int,
+        unrestricted: List[Any],
+        by_role: Dict[AgentRole, List[Any]],
+    ) -> None:
+        """Remove the entry at a registration position from a role index."""
+        for entries in [unrestricted, *by_role.values()]:
+            i = bisect.bisect_left(entries, position, key=_position)
+            if i < len(entries) and entries[i][0] == position:
+                del entries[i]
+
+    @staticmethod
+    def _merged(unrestricted: List[Any], for_role: List[Any]) -> List[Any]:
+        """Entries visible to a role, in registration order."""
+        return [entry for _, entry in heapq.merge(unrestricted, for_role, key=_position)]
 
     async def register_tool(
         self, tool: MCPTool, accessible_by: Optional[List[AgentRole]] = None
@@ -36,13 +84,23 @@ class MCPServer:
             accessible_by: Optional list of agent roles that can access this tool
                          (None = all agents)
         """
+        self._register_tool_impl(tool, accessible_by)
+
+    def _register_tool_impl(
+        self, tool: MCPTool, accessible_by: Optional[List[AgentRole]] = None
+    ) -> None:
+        """Register an MCP tool without going through the event loop."""
         if accessible_by is not None:
             tool.accessible_by = accessible_by
         elif not tool.accessible_by:
             # Default: accessible by all agents
             tool.accessible_by = []
 
+        position = self._tool_positions.setdefault(tool.name, len(self._tool_positions))
+        if tool.name in self.tools:
+            self._index_remove(position, self._unrestricted_tools, self._tools_by_role)
         self.tools[tool.name] = tool
+        self._index_add(position, tool, self._unrestricted_tools, self._tools_by_role)
 
     async def register_resource(
         self,
@@ -63,7 +121,11 @@ class MCPServer:
             # Default: accessible by all agents
             resource.accessible_by = []
 
+        position = self._resource_positions.setdefault(resource.uri, len(self._resource_positions))
+        if resource.uri in self.resources:
+            self._index_remove(position, self._unrestricted_resources, self._resources_by_role)
         self.resources[resource.uri] = resource
+        self._index_add(position, resource, self._unrestricted_resources, self._resources_by_role)
 
     async def execute_tool(
         self, tool_name: str, params: Dict[str, Any], agent_role: AgentRole
@@ -133,11 +195,7 @@ class MCPServer:
         if agent_role is None:
             return list(self.tools.values())
 
-        return [
-            tool
-            for tool in self.tools.values()
-            if not tool.accessible_by or agent_role in tool.accessible_by
-        ]
+        return self._merged(self._unrestricted_tools, self._tools_by_role.get(agent_role, []))
 
     def get_resources(self, agent_role: Optional[AgentRole] = None) -> List[MCPResource]:
         """
@@ -152,11 +210,9 @@ class MCPServer:
         if agent_role is None:
             return list(self.resources.values())
 
-        return [
-            resource
-            for resource in self.resources.values()
-            if not resource.accessible_by or agent_role in resource.accessible_by
-        ]
+        return self._merged(
+            self._unrestricted_resources, self._resources_by_role.get(agent_role, [])
+        )
 
     def list_tools(self) -> List[str]:
         """
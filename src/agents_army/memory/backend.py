@@ -1,8 +1,11 @@
 """Memory backends - storage implementations."""
 
+import asyncio
+import heapq
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from agents_army.memory.models import MemoryItem
 
@@ -20,6 +23,19 @@ class MemoryBackend(ABC):
         """
         pass
 
+    async def store_many(self, items: Sequence[MemoryItem]) -> None:
+        """
+        Store several memory items.
+
+        Backends that can write in bulk override this; the default stores
+        items one at a time.
+
+        Args:
+            items: Memory items to store
+        """
+        for item in items:
+            await self.store(item)
+
     @abstractmethod
     async def retrieve(self, key: str) -> Optional[MemoryItem]:
         """
@@ -50,6 +66,24 @@ class MemoryBackend(ABC):
         """
         pass
 
+    async def search_by_tags(
+        self, tags: List[str], limit: Optional[int] = None
+    ) -> List[MemoryItem]:
+        """
+        Find memory items carrying every one of the given tags.
+
+        Backends with a tag index override this; the default filters list_all.
+
+        Args:
+            tags: Tags that must all be present
+            limit: Optional limit on number of items
+
+        Returns:
+            List of matching memory items, in no particular order
+        """
+        items = [item for item in await self.list_all() if all(tag in item.tags for tag in tags)]
+        return items[:limit] if limit else items
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """
@@ -87,19 +121,77 @@ class MemoryBackend(ABC):
 class InMemoryBackend(MemoryBackend):
     """In-memory backend for development and testing."""
 
-    def __init__(self):
-        """Initialize in-memory backend."""
+    def __init__(self, cleanup_batch_size: int = 10_000):
+        """
+        Initialize in-memory backend.
+
+        Args:
+            cleanup_batch_size: Items deleted by cleanup_expired between yields
+                to the event loop
+        """
+        self.cleanup_batch_size = cleanup_batch_size
         self._storage: Dict[str, MemoryItem] = {}
+        # (expires_at, key) min-heap; entries for replaced or deleted items are
+        # left in place and skipped when popped, until they outnumber the live
+        # items and the heap is rebuilt
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # Tag -> keys of the stored items carrying it
+        self._keys_by_tag: Dict[str, Set[str]] = defaultdict(set)
+
+    def _put(self, item: MemoryItem) -> None:
+        """Store an item and index its tags and expiry."""
+        previous = self._storage.get(item.key)
+        if previous is not None:
+            self._unindex_tags(previous)
+        self._storage[item.key] = item
+        for tag in item.tags:
+            self._keys_by_tag[tag].add(item.key)
+        if item.expires_at is not None and (
+            previous is None or previous.expires_at != item.expires_at
+        ):
+            heapq.heappush(self._expiry_heap, (item.expires_at, item.key))
+            self._maybe_rebuild_expiry_heap()
+
+    def _remove(self, key: str) -> None:
+        """Remove an item, if present, and drop it from the tag index."""
+        item = self._storage.pop(key, None)
+        if item is not None:
+            self._unindex_tags(item)
+            self._maybe_rebuild_expiry_heap()
+
+    def _maybe_rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from the live items once stale entries dominate it."""
+        if len(self._expiry_heap) > 2 * len(self._storage):
+            self._expiry_heap = [
+                (item.expires_at, key)
+                for key, item in self._storage.items()
+                if item.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _unindex_tags(self, item: MemoryItem) -> None:
+        """Drop an item's key from the tag index."""
+        for tag in item.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(item.key)
+                if not keys:
+                    del self._keys_by_tag[tag]
 
     async def store(self, item: MemoryItem) -> None:
         """Store a memory item."""
-        self._storage[item.key] = item
+        self._put(item)
+
+    async def store_many(self, items: Sequence[MemoryItem]) -> None:
+        """Store several memory items without a coroutine round-trip per item."""
+        for item in items:
+            self._put(item)
 
     async def retrieve(self, key: str) -> Optional[MemoryItem]:
         """Retrieve a memory item by key."""
         item = self._storage.get(key)
-        if item and item.is_expired():
-            del self._storage[key]
+        if item is not None and item.is_expired():
+            self._remove(key)
             return None
         return item
 
@@ -110,9 +202,10 @@ class InMemoryBackend(MemoryBackend):
         results = []
 
         query_lower = query.lower()
+        now = datetime.now()
 
         for item in self._storage.values():
-            if item.is_expired():
+            if item.is_expired(now):
                 continue
 
             # Simple text search
@@ -134,12 +227,32 @@ class InMemoryBackend(MemoryBackend):
 
     async def delete(self, key: str) -> None:
         """Delete a memory item."""
-        if key in self._storage:
-            del self._storage[key]
+        self._remove(key)
+
+    async def search_by_tags(
+        self, tags: List[str], limit: Optional[int] = None
+    ) -> List[MemoryItem]:
+        """Find items carrying every given tag by intersecting the tag index."""
+        if not tags:
+            return await self.list_all(limit=limit)
+
+        key_sets = sorted((self._keys_by_tag.get(tag, set()) for tag in tags), key=len)
+        keys = key_sets[0].intersection(*key_sets[1:])
+
+        now = datetime.now()
+        items = []
+        for key in keys:
+            item = self._storage[key]
+            if not item.is_expired(now):
+                items.append(item)
+                if limit and len(items) >= limit:
+                    break
+        return items
 
     async def list_all(self, limit: Optional[int] = None) -> List[MemoryItem]:
         """List all memory items."""
-        items = [item for item in self._storage.values() if not item.is_expired()]
+        now = datetime.now()
+        items = [item for item in self._storage.values() if not item.is_expired(now)]
 
         if limit:
             items = items[:limit]
@@ -147,33 +260,134 @@ class InMemoryBackend(MemoryBackend):
         return items
 
     async def cleanup_expired(self) -> int:
-        """Clean up expired memory items."""
-        expired_keys = [key for key, item in self._storage.items() if item.is_expired()]
+        """
+        Clean up expired memory items, popping only expired heap entries.
 
-        for key in expired_keys:
-            del self._storage[key]
+        Yields to the event loop after every ``cleanup_batch_size`` deletions
+        so a long sweep does not stall other tasks.
+        """
+        now = datetime.now()
+        deleted = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, key = heapq.heappop(self._expiry_heap)
+            item = self._storage.get(key)
+            if item is not None and item.is_expired(now):
+                self._remove(key)
+                deleted += 1
+                if deleted % self.cleanup_batch_size == 0:
+                    await asyncio.sleep(0)
 
-        return len(expired_keys)
+        return deleted
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Membership tests can return false positives but never false negatives.
+    Uses the built-in str hash, so a filter is only valid within one process.
+    """
+
+    def __init__(self, num_bits: int = 1 << 20, num_hashes: int = 4):
+        """
+        Initialize the filter.
+
+        Args:
+            num_bits: Size of the bit array; rounded up to a whole byte
+            num_hashes: Bit positions set per item
+        """
+        self._bits = bytearray((num_bits + 7) // 8)
+        self._num_bits = len(self._bits) * 8
+        self._num_hashes = num_hashes
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Bit positions for an item, by double hashing the two halves of one hash."""
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added."""
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Lowercased character trigrams, as matched by the FTS5 trigram tokenizer."""
+    text = text.lower()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
 
 class SQLiteBackend(MemoryBackend):
     """SQLite backend for production use."""
 
-    def __init__(self, database_path: str = "memory.db"):
+    # Connection pragmas: WAL journal with fsync per checkpoint rather than per
+    # commit, in-memory temp tables, memory-mapped reads and a 64 MiB page cache
+    DEFAULT_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "mmap_size": "10737418240",
+        "cache_size": "-65536",
+    }
+
+    def __init__(
+        self,
+        database_path: str = "memory.db",
+        pragmas: Optional[Dict[str, str]] = None,
+        cleanup_batch_size: int = 10_000,
+        bloom_filter: bool = False,
+    ):
         """
         Initialize SQLite backend.
 
         Args:
             database_path: Path to SQLite database file
+            pragmas: Optional pragma overrides, merged over DEFAULT_PRAGMAS
+            cleanup_batch_size: Rows deleted per transaction by cleanup_expired
+            bloom_filter: Answer guaranteed misses in retrieve and search from
+                in-process Bloom filters without querying SQLite. Only safe
+                when this backend is the database's sole writer.
         """
         import sqlite3
-        import json
 
         self.database_path = database_path
+        self.cleanup_batch_size = cleanup_batch_size
         self.conn = sqlite3.connect(database_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.conn.executescript(
+            "".join(f"PRAGMA {name}={value};" for name, value in self.pragmas.items())
+        )
         self._init_schema()
 
+        self._key_filter: Optional[_BloomFilter] = None
+        self._trigram_filter: Optional[_BloomFilter] = None
+        if bloom_filter:
+            self._init_bloom_filters()
+
+    def _init_bloom_filters(self) -> None:
+        """Build the key and trigram Bloom filters from the stored rows."""
+        self._key_filter = _BloomFilter()
+        self._trigram_filter = _BloomFilter(num_bits=1 << 23)
+        for row in self.conn.execute("SELECT key, value FROM memories"):
+            self._add_to_filters(row["key"], row["value"])
+
+    def _add_to_filters(self, key: str, value_json: str) -> None:
+        """Record a stored row in the Bloom filters, if enabled."""
+        key_filter, trigram_filter = self._key_filter, self._trigram_filter
+        if key_filter is None or trigram_filter is None:
+            return
+        key_filter.add(key)
+        for trigram in _trigrams(key) | _trigrams(value_json):
+            trigram_filter.add(trigram)
+
     def _init_schema(self) -> None:
         """Initialize database schema."""
         cursor = self.conn.cursor()
@@ -194,112 +408,183 @@ class SQLiteBackend(MemoryBackend):
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_memory_type ON memories(memory_type)
             """)
+        # Partial index: rows without an expiry never need a TTL sweep
+        cursor.execute("DROP INDEX IF EXISTS idx_expires_at")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_expires_at ON memories(expires_at)
+            CREATE INDEX IF NOT EXISTS idx_expires_at_set ON memories(expires_at)
+            WHERE expires_at IS NOT NULL
             """)
         self.conn.commit()
+        self._fts = self._init_fts()
+
+    def _init_fts(self) -> bool:
+        """
+        Create the full-text index over memory keys and values.
+
+        Uses an external-content FTS5 table with the trigram tokenizer, so it
+        answers the same case-insensitive substring queries as LIKE. Kept in
+        sync by triggers; rebuilt from the memories table when first created.
+
+        Returns:
+            True if the index is available, False if SQLite lacks FTS5 trigram
+        """
+        import sqlite3
+
+        cursor = self.conn.cursor()
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts'"
+        ).fetchone()
+        try:
+            cursor.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                    key, value, content='memories', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+                    INSERT INTO memories_fts(rowid, key, value)
+                    VALUES (new.rowid, new.key, new.value);
+                END;
+                CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+                    INSERT INTO memories_fts(memories_fts, rowid, key, value)
+                    VALUES ('delete', old.rowid, old.key, old.value);
+                END;
+                CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE ON memories BEGIN
+                    INSERT INTO memories_fts(memories_fts, rowid, key, value)
+                    VALUES ('delete', old.rowid, old.key, old.value);
+                    INSERT INTO memories_fts(rowid, key, value)
+                    VALUES (new.rowid, new.key, new.value);
+                END;
+                """)
+        except sqlite3.OperationalError:
+            return False  # No FTS5, or SQLite older than 3.34 (no trigram tokenizer)
+        if not exists:
+            cursor.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+        self.conn.commit()
+        return True
+
+    # Rows pulled from SQLite per fetch while streaming search results
+    SEARCH_FETCH_SIZE = 128
+
+    # Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+    # firing delete triggers, which would leave stale full-text index entries
+    _INSERT_SQL = """
+        INSERT INTO memories
+        (key, value, metadata, created_at, expires_at, tags, memory_type)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            metadata = excluded.metadata,
+            created_at = excluded.created_at,
+            expires_at = excluded.expires_at,
+            tags = excluded.tags,
+            memory_type = excluded.memory_type
+        """
 
     async def store(self, item: MemoryItem) -> None:
         """Store a memory item."""
-        import json
+        row = item.to_row()
+        cursor = self.conn.cursor()
+        cursor.execute(self._INSERT_SQL, row)
+        self.conn.commit()
+        self._add_to_filters(row[0], row[1])
 
+    async def store_many(self, items: Sequence[MemoryItem]) -> None:
+        """Store several memory items in a single transaction."""
+        rows = [item.to_row() for item in items]
         cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO memories 
-            (key, value, metadata, created_at, expires_at, tags, memory_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                item.key,
-                json.dumps(item.value),
-                json.dumps(item.metadata),
-                item.created_at.isoformat(),
-                item.expires_at.isoformat() if item.expires_at else None,
-                json.dumps(item.tags),
-                item.memory_type,
-            ),
-        )
+        cursor.executemany(self._INSERT_SQL, rows)
         self.conn.commit()
+        for row in rows:
+            self._add_to_filters(row[0], row[1])
 
     async def retrieve(self, key: str) -> Optional[MemoryItem]:
         """Retrieve a memory item by key."""
-        import json
+        if self._key_filter is not None and key not in self._key_filter:
+            return None
 
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT * FROM memories WHERE key = ? AND (expires_at IS NULL OR expires_at > datetime('now'))",
-            (key,),
+            "SELECT * FROM memories WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, datetime.now().isoformat()),
         )
         row = cursor.fetchone()
 
         if not row:
             return None
 
-        return MemoryItem(
-            key=row["key"],
-            value=json.loads(row["value"]),
-            metadata=json.loads(row["metadata"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            expires_at=datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None,
-            tags=json.loads(row["tags"]),
-            memory_type=row["memory_type"],
-        )
+        return MemoryItem.from_row(row)
 
     async def search(
         self, query: str, tags: Optional[List[str]] = None, limit: int = 10
     ) -> List[MemoryItem]:
         """Search memory items."""
+        return [item async for item in self.iter_search(query, tags=tags, limit=limit)]
+
+    async def iter_search(
+        self, query: str, tags: Optional[List[str]] = None, limit: Optional[int] = None
+    ) -> AsyncIterator[MemoryItem]:
+        """
+        Search memory items, yielding them as rows are fetched.
+
+        Rows are fetched SEARCH_FETCH_SIZE at a time, so callers that stop
+        early never convert the rest of the result set. Such callers should
+        wrap the iterator in ``contextlib.aclosing`` so the underlying cursor
+        is closed straight away rather than when the generator is collected.
+
+        Args:
+            query: Search query (text search)
+            tags: Optional tags to filter by
+            limit: Optional maximum number of results
+
+        Yields:
+            Matching memory items, best match first when the full-text index is used
+        """
         import json
 
-        cursor = self.conn.cursor()
+        if (
+            self._trigram_filter is not None
+            and len(query) >= 3
+            and query.isascii()
+            and not all(trigram in self._trigram_filter for trigram in _trigrams(query))
+        ):
+            # Some trigram of the query occurs in no stored key or value
+            return
 
-        # Simple LIKE search
-        query_pattern = f"%{query}%"
+        cursor = self.conn.cursor()
 
-        if tags:
-            # Search with tags
-            tags_json = json.dumps(tags)
-            cursor.execute(
+        if self._fts and len(query) >= 3:
+            # Trigram index lookup, quoted as a phrase so the query is matched literally
+            sql = """
+                SELECT m.* FROM memories_fts
+                JOIN memories m ON m.rowid = memories_fts.rowid
+                WHERE memories_fts MATCH ?
                 """
-                SELECT * FROM memories 
-                WHERE (value LIKE ? OR key LIKE ?)
-                AND (expires_at IS NULL OR expires_at > datetime('now'))
-                AND tags LIKE ?
-                LIMIT ?
-                """,
-                (query_pattern, query_pattern, f"%{tags_json[1:-1]}%", limit),
-            )
+            params: List[Any] = ['"' + query.replace('"', '""') + '"']
+            order_by = " ORDER BY bm25(memories_fts)"
         else:
-            cursor.execute(
-                """
-                SELECT * FROM memories 
-                WHERE (value LIKE ? OR key LIKE ?)
-                AND (expires_at IS NULL OR expires_at > datetime('now'))
-                LIMIT ?
-                """,
-                (query_pattern, query_pattern, limit),
-            )
+            # Trigrams need at least three characters; fall back to a LIKE scan
+            sql = "SELECT m.* FROM memories m WHERE (m.value LIKE ? OR m.key LIKE ?)"
+            params = [f"%{query}%", f"%{query}%"]
+            order_by = ""
 
-        rows = cursor.fetchall()
-        items = []
+        sql += " AND (m.expires_at IS NULL OR m.expires_at > ?)"
+        params.append(datetime.now().isoformat())
+        if tags:
+            tags_json = json.dumps(tags)
+            sql += " AND m.tags LIKE ?"
+            params.append(f"%{tags_json[1:-1]}%")
 
-        for row in rows:
-            items.append(
-                MemoryItem(
-                    key=row["key"],
-                    value=json.loads(row["value"]),
-                    metadata=json.loads(row["metadata"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    expires_at=(
-                        datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None
-                    ),
-                    tags=json.loads(row["tags"]),
-                    memory_type=row["memory_type"],
-                )
-            )
+        sql += order_by
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor.execute(sql, params)
 
-        return items
+        try:
+            while rows := cursor.fetchmany(self.SEARCH_FETCH_SIZE):
+                for row in rows:
+                    yield MemoryItem.from_row(row)
+        finally:
+            cursor.close()
 
     async def delete(self, key: str) -> None:
         """Delete a memory item."""
@@ -309,55 +594,58 @@ class SQLiteBackend(MemoryBackend):
 
     async def list_all(self, limit: Optional[int] = None) -> List[MemoryItem]:
         """List all memory items."""
-        import json
-
         cursor = self.conn.cursor()
 
+        now = datetime.now().isoformat()
         if limit:
             cursor.execute(
                 """
-                SELECT * FROM memories 
-                WHERE expires_at IS NULL OR expires_at > datetime('now')
+                SELECT * FROM memories
+                WHERE expires_at IS NULL OR expires_at > ?
                 LIMIT ?
                 """,
-                (limit,),
+                (now, limit),
             )
         else:
-            cursor.execute("""
-                SELECT * FROM memories 
-                WHERE expires_at IS NULL OR expires_at > datetime('now')
-                """)
-
-        rows = cursor.fetchall()
-        items = []
-
-        for row in rows:
-            items.append(
-                MemoryItem(
-                    key=row["key"],
-                    value=json.loads(row["value"]),
-                    metadata=json.loads(row["metadata"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    expires_at=(
-                        datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None
-                    ),
-                    tags=json.loads(row["tags"]),
-                    memory_type=row["memory_type"],
-                )
+            cursor.execute(
+                """
+                SELECT * FROM memories
+                WHERE expires_at IS NULL OR expires_at > ?
+                """,
+                (now,),
             )
 
-        return items
+        return [MemoryItem.from_row(row) for row in cursor.fetchall()]
 
     async def cleanup_expired(self) -> int:
-        """Clean up expired memory items."""
+        """
+        Clean up expired memory items.
+
+        Deletes in batches of ``cleanup_batch_size`` rows found through the
+        expiry index, committing after each batch to keep transactions short.
+        """
+        now = datetime.now().isoformat()
         cursor = self.conn.cursor()
-        cursor.execute(
-            "DELETE FROM memories WHERE expires_at IS NOT NULL AND expires_at <= datetime('now')"
-        )
-        deleted = cursor.rowcount
-        self.conn.commit()
-        return deleted
+        deleted = 0
+
+        while True:
+            cursor.execute(
+                """
+                DELETE FROM memories WHERE rowid IN (
+                    SELECT rowid FROM memories
+                    WHERE expires_at IS NOT NULL AND expires_at <= ?
+                    LIMIT ?
+                )
+                """,
+                (now, self.cleanup_batch_size),
+            )
+            self.conn.commit()
+            deleted += cursor.rowcount
+            if cursor.rowcount < self.cleanup_batch_size:
+                return deleted
 
     def close(self) -> None:
-        """Close database connection."""
+        """Checkpoint the write-ahead log and close database connection."""
+        if self.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal":
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         self.conn.close()
@@ -1,10 +1,32 @@
 """Embedding providers for semantic search."""
 
+import hashlib
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from agents_army.core.agent import LLMProvider
 
+# Float between -1 and 1 for each possible digest byte
+_BYTE_VALUES = tuple(byte / 255.0 * 2 - 1 for byte in range(256))
+
+
+@lru_cache(maxsize=4096)
+def _mock_embedding(text: str, dimensions: int) -> Tuple[float, ...]:
+    """
+    Hash-based mock embedding, memoized since it depends only on its inputs.
+
+    Args:
+        text: Text to embed
+        dimensions: Embedding dimensions
+
+    Returns:
+        Embedding vector as an immutable tuple
+    """
+    # Map each byte of the MD5 digest through the lookup table, padded to exact dimensions
+    digest = hashlib.md5(text.encode()).digest()[:dimensions]
+    return tuple(map(_BYTE_VALUES.__getitem__, digest)) + (0.0,) * (dimensions - len(digest))
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
@@ -68,26 +90,7 @@ class MockEmbeddings(EmbeddingProvider):
         Returns:
             Mock embedding vector
         """
-        # Simple hash-based embedding for testing
-        import hashlib
-
-        hash_obj = hashlib.md5(text.encode())
-        hash_hex = hash_obj.hexdigest()
-
-        # Convert hex to floats
-        embedding = []
-        for i in range(0, len(hash_hex), 2):
-            if len(embedding) >= self._dimensions:
-                break
-            # Convert hex pair to float between -1 and 1
-            val = int(hash_hex[i : i + 2], 16) / 255.0 * 2 - 1
-            embedding.append(val)
-
-        # Pad or truncate to exact dimensions
-        while len(embedding) < self._dimensions:
-            embedding.append(0.0)
-
-        return embedding[: self._dimensions]
+        return list(_mock_embedding(text, self._dimensions))
 
     async def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
@@ -99,7 +102,7 @@ class MockEmbeddings(EmbeddingProvider):
         Returns:
             List of embedding vectors
         """
-        return [await self.embed(text) for text in texts]
+        return [list(_mock_embedding(text, self._dimensions)) for text in texts]
 
     @property
     def dimensions(self) -> int:
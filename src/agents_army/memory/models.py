@@ -1,11 +1,13 @@
 """Data models for memory system."""
 
-from dataclasses import dataclass, field
+import json
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryItem:
     """Represents a memory item."""
 
@@ -17,11 +19,16 @@ class MemoryItem:
     tags: List[str] = field(default_factory=list)
     memory_type: str = "general"  # session, task, user, system, general
 
-    def is_expired(self) -> bool:
-        """Check if memory item has expired."""
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if memory item has expired.
+
+        Args:
+            now: Current time, so loops over many items can read the clock once
+        """
         if self.expires_at is None:
             return False
-        return datetime.now() > self.expires_at
+        return (now or datetime.now()) > self.expires_at
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -38,20 +45,70 @@ class MemoryItem:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MemoryItem":
         """Create from dictionary."""
-        item = cls(
+        created_at = data.get("created_at")
+        expires_at = data.get("expires_at")
+        return cls(
             key=data["key"],
             value=data["value"],
             metadata=data.get("metadata", {}),
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+            expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
             tags=data.get("tags", []),
             memory_type=data.get("memory_type", "general"),
         )
 
-        if "created_at" in data:
-            item.created_at = datetime.fromisoformat(data["created_at"])
-        if "expires_at" in data and data["expires_at"]:
-            item.expires_at = datetime.fromisoformat(data["expires_at"])
+    def to_row(self) -> Tuple[Any, ...]:
+        """
+        Convert to a SQLite memories table row.
+
+        Returns:
+            (key, value, metadata, created_at, expires_at, tags, memory_type),
+            with JSON-encoded value, metadata and tags and ISO timestamps
+        """
+        return (
+            self.key,
+            json.dumps(self.value),
+            json.dumps(self.metadata),
+            self.created_at.isoformat(),
+            self.expires_at.isoformat() if self.expires_at else None,
+            json.dumps(self.tags),
+            self.memory_type,
+        )
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "MemoryItem":
+        """
+        Create from a SQLite memories table row.
+
+        Args:
+            row: Row with the memories table columns, e.g. a sqlite3.Row
+        """
+        expires_at = row["expires_at"]
+        return cls(
+            key=row["key"],
+            value=json.loads(row["value"]),
+            metadata=json.loads(row["metadata"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
+            tags=json.loads(row["tags"]),
+            memory_type=row["memory_type"],
+        )
+
 
-        return item
+@lru_cache(maxsize=64)
+def _parse_duration(duration_str: str) -> timedelta:
+    """Parse duration string like '1h', '7d', '30d'."""
+    if duration_str.endswith("h"):
+        hours = int(duration_str[:-1])
+        return timedelta(hours=hours)
+    elif duration_str.endswith("d"):
+        days = int(duration_str[:-1])
+        return timedelta(days=days)
+    elif duration_str.endswith("m"):
+        minutes = int(duration_str[:-1])
+        return timedelta(minutes=minutes)
+    else:
+        return timedelta(days=30)  # Default
 
 
 @dataclass
@@ -74,7 +131,9 @@ class RetentionPolicy:
         Returns:
             TTL timedelta
         """
-        return getattr(self, memory_type, self.general)
+        if memory_type in _MEMORY_TYPES:
+            return cast(timedelta, getattr(self, memory_type))
+        return self.general
 
     @classmethod
     def from_config(cls, config: Dict[str, str]) -> "RetentionPolicy":
@@ -87,25 +146,14 @@ class RetentionPolicy:
         Returns:
             RetentionPolicy instance
         """
-
-        def parse_duration(duration_str: str) -> timedelta:
-            """Parse duration string like '1h', '7d', '30d'."""
-            if duration_str.endswith("h"):
-                hours = int(duration_str[:-1])
-                return timedelta(hours=hours)
-            elif duration_str.endswith("d"):
-                days = int(duration_str[:-1])
-                return timedelta(days=days)
-            elif duration_str.endswith("m"):
-                minutes = int(duration_str[:-1])
-                return timedelta(minutes=minutes)
-            else:
-                return timedelta(days=30)  # Default
-
         return cls(
-            session=parse_duration(config.get("session", "1h")),
-            task=parse_duration(config.get("task", "7d")),
-            user=parse_duration(config.get("user", "30d")),
-            system=parse_duration(config.get("system", "90d")),
-            general=parse_duration(config.get("general", "30d")),
+            session=_parse_duration(config.get("session", "1h")),
+            task=_parse_duration(config.get("task", "7d")),
+            user=_parse_duration(config.get("user", "30d")),
+            system=_parse_duration(config.get("system", "90d")),
+            general=_parse_duration(config.get("general", "30d")),
         )
+
+
+# Memory types with their own TTL field; anything else falls back to ``general``
+_MEMORY_TYPES = frozenset(f.name for f in fields(RetentionPolicy))
@@ -1,11 +1,15 @@
 """Memory system for storing and retrieving agent memories."""
 
+import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from agents_army.memory.backend import MemoryBackend
 from agents_army.memory.models import MemoryItem, RetentionPolicy
 
+logger = logging.getLogger(__name__)
+
 
 class MemorySystem:
     """
@@ -18,6 +22,7 @@ class MemorySystem:
         self,
         backend: MemoryBackend,
         retention_policy: Optional[RetentionPolicy] = None,
+        cleanup_interval: float = 3600.0,
     ):
         """
         Initialize memory system.
@@ -25,9 +30,12 @@ class MemorySystem:
         Args:
             backend: Memory backend implementation
             retention_policy: Optional retention policy (uses default if None)
+            cleanup_interval: Minimum seconds between expiry sweeps triggered by store()
         """
         self.backend = backend
         self.retention_policy = retention_policy or RetentionPolicy()
+        self.cleanup_interval = cleanup_interval
+        self._last_cleanup = time.monotonic()
 
     async def store(
         self,
@@ -65,6 +73,20 @@ class MemorySystem:
         )
 
         await self.backend.store(item)
+        await self._maybe_cleanup_expired()
+
+    async def _maybe_cleanup_expired(self) -> None:
+        """
+        Sweep expired items if cleanup_interval has passed since the last sweep.
+
+        The sweep is opportunistic, so a failure is logged instead of being
+        raised from the store() that has already succeeded.
+        """
+        if time.monotonic() - self._last_cleanup >= self.cleanup_interval:
+            try:
+                await self.cleanup_expired()
+            except Exception:
+                logger.exception("Opportunistic expired-memory cleanup failed")
 
     async def retrieve(self, key: str) -> Optional[MemoryItem]:
         """
@@ -109,8 +131,9 @@ class MemorySystem:
 
         # Remove expired items
         valid_results = []
+        now = datetime.now()
         for item in results:
-            if item.is_expired():
+            if item.is_expired(now):
                 await self.backend.delete(item.key)
             else:
                 valid_results.append(item)
@@ -157,8 +180,9 @@ class MemorySystem:
 
         # Remove expired items
         valid_results = []
+        now = datetime.now()
         for item in results:
-            if item.is_expired():
+            if item.is_expired(now):
                 await self.backend.delete(item.key)
             else:
                 valid_results.append(item)
@@ -201,4 +225,8 @@ class MemorySystem:
         Returns:
             Number of items deleted
         """
-        return await self.backend.cleanup_expired()
+        try:
+            return await self.backend.cleanup_expired()
+        finally:
+            # Record the attempt even on failure so a broken sweep isn't retried every call
+            self._last_cleanup = time.monotonic()
@@ -1,13 +1,46 @@
 """Vector backends for semantic search in memory."""
 
+import heapq
+import json
+import math
+import operator
+import os
 from abc import ABC, abstractmethod
+from array import array
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from agents_army.memory.backend import MemoryBackend
 from agents_army.memory.embeddings import EmbeddingProvider, MockEmbeddings
 from agents_army.memory.models import MemoryItem, RetentionPolicy
 
+try:
+    import hnswlib
+
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+if hasattr(math, "sumprod"):
+    # Python 3.12+: single C-level loop with extended precision
+    _dot = math.sumprod
+else:
+
+    def _dot(vec1, vec2) -> float:
+        """Dot product of two equal-length vectors."""
+        return float(sum(map(operator.mul, vec1, vec2)))
+
+
+def _normalize(vec: List[float]) -> List[float]:
+    """Scale a vector to unit length; zero vectors are returned unchanged."""
+    magnitude = math.hypot(*vec)
+    if magnitude == 0:
+        return list(vec)
+    return [x / magnitude for x in vec]
+
 
 class VectorBackend(MemoryBackend):
     """
@@ -61,9 +94,9 @@ class VectorBackend(MemoryBackend):
         if len(vec1) != len(vec2):
             return 0.0
 
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
+        dot_product = _dot(vec1, vec2)
+        magnitude1 = math.hypot(*vec1)
+        magnitude2 = math.hypot(*vec2)
 
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
@@ -77,18 +110,157 @@ class InMemoryVectorBackend(VectorBackend):
 
     Stores embeddings in memory and performs similarity search.
     Suitable for development and small-scale deployments.
+
+    Embeddings are normalized to unit length when stored, so a search
+    scores each item with a single dot product. They are kept as packed
+    float32 arrays, which take 4 bytes per dimension instead of a Python
+    float object each.
+
+    With ``persist_path`` set, every store and delete is also appended to two
+    logs in that directory: ``embeddings.f32`` holds the packed float32 rows
+    back to back and ``items.ndjson`` one JSON line per stored item (or
+    deletion). A new backend on the same path reloads the embeddings with a
+    single bulk read instead of re-embedding every value.
+
+    With ``index="hnsw"`` (requires ``hnswlib``), untagged searches walk an
+    approximate nearest-neighbour graph instead of scoring every item. The
+    graph holds embeddings of the first stored dimension; tag-filtered
+    searches keep using the exact scan over the tagged items.
     """
 
-    def __init__(self, embedding_provider: Optional[EmbeddingProvider] = None):
+    EMBEDDINGS_FILENAME = "embeddings.f32"
+    ITEMS_FILENAME = "items.ndjson"
+
+    def __init__(
+        self,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        persist_path: Optional[str] = None,
+        index: str = "flat",
+    ):
         """
         Initialize InMemoryVectorBackend.
 
         Args:
             embedding_provider: Optional embedding provider
+            persist_path: Optional directory to persist items and embeddings in
+            index: Search index, "flat" (exact scan) or "hnsw" (approximate)
+
+        Raises:
+            ValueError: If the index is not supported
+            ImportError: If index is "hnsw" and hnswlib is not installed
         """
+        if index not in ("flat", "hnsw"):
+            raise ValueError(f"Unsupported index: {index}")
+        if index == "hnsw" and not HNSWLIB_AVAILABLE:
+            raise ImportError("hnswlib package required. Install with: pip install hnswlib")
+
         super().__init__(embedding_provider)
         self._storage: Dict[str, MemoryItem] = {}
-        self._embeddings: Dict[str, List[float]] = {}
+        self._embeddings: Dict[str, array] = {}
+        # Tag -> keys of the stored items carrying it
+        self._keys_by_tag: Dict[str, Set[str]] = defaultdict(set)
+
+        self.index = index
+        self._hnsw: Optional[Any] = None
+        # HNSW labels are ints; a key gets a fresh label each time it is stored,
+        # and the graph slot of a deleted label is reused by the next insert
+        self._label_by_key: Dict[str, int] = {}
+        self._key_by_label: Dict[int, str] = {}
+        self._next_label = 0
+
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._embeddings_log: Optional[BinaryIO] = None
+        self._items_log: Optional[BinaryIO] = None
+        if self.persist_path is not None:
+            self.persist_path.mkdir(parents=True, exist_ok=True)
+            self._load(self.persist_path)
+
+    def _load(self, persist_path: Path) -> None:
+        """Rebuild the in-memory state from the logs left by a previous run."""
+        try:
+            with open(persist_path / self.ITEMS_FILENAME, "rb") as f:
+                lines = f.read().splitlines()
+            with open(persist_path / self.EMBEDDINGS_FILENAME, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        vectors = array("f")
+        vectors.frombytes(data[: len(data) - len(data) % vectors.itemsize])
+
+        offset = 0
+        torn = False
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                torn = True  # Torn write at the end of the log
+                break
+            if entry["item"] is None:
+                self._remove(entry["key"], log=False)
+                continue
+            end = offset + entry["dims"]
+            if end > len(vectors):
+                torn = True
+                break
+            self._index(MemoryItem.from_dict(entry["item"]), vectors[offset:end])
+            offset = end
+
+        if torn or offset != len(vectors):
+            # Rewrite the logs so new rows line up with their entries again
+            self.compact()
+
+    def _open_logs(self) -> Tuple[BinaryIO, BinaryIO]:
+        """Open the persistence logs for appending, unless they are open already."""
+        if self._embeddings_log is None or self._items_log is None:
+            if self.persist_path is None:
+                raise RuntimeError("Backend has no persist_path")
+            self._embeddings_log = open(self.persist_path / self.EMBEDDINGS_FILENAME, "ab", 0)
+            self._items_log = open(self.persist_path / self.ITEMS_FILENAME, "ab", 0)
+        return self._embeddings_log, self._items_log
+
+    def _log_store(self, item: MemoryItem, vector: array) -> None:
+        """Append a stored item and its embedding to the logs."""
+        # Serialize first so an unserializable value leaves the logs untouched
+        entry = {"key": item.key, "item": item.to_dict(), "dims": len(vector)}
+        line = json.dumps(entry).encode("utf-8") + b"\n"
+        embeddings_log, items_log = self._open_logs()
+        vector.tofile(embeddings_log)
+        items_log.write(line)
+
+    def _log_delete(self, key: str) -> None:
+        """Append a deletion to the logs."""
+        _, items_log = self._open_logs()
+        items_log.write(json.dumps({"key": key, "item": None, "dims": 0}).encode("utf-8") + b"\n")
+
+    def compact(self) -> None:
+        """Rewrite the logs to hold only the items currently stored."""
+        persist_path = self.persist_path
+        if persist_path is None:
+            return
+        self.close()
+
+        embeddings_path = persist_path / self.EMBEDDINGS_FILENAME
+        items_path = persist_path / self.ITEMS_FILENAME
+        with (
+            open(f"{embeddings_path}.tmp", "wb") as vectors,
+            open(f"{items_path}.tmp", "wb") as items,
+        ):
+            for key, item in self._storage.items():
+                vector = self._embeddings[key]
+                vector.tofile(vectors)
+                entry = {"key": key, "item": item.to_dict(), "dims": len(vector)}
+                items.write(json.dumps(entry).encode("utf-8") + b"\n")
+        os.replace(f"{embeddings_path}.tmp", embeddings_path)
+        os.replace(f"{items_path}.tmp", items_path)
+
+    def close(self) -> None:
+        """Release the persistence logs; they are reopened on the next write."""
+        for log in (self._embeddings_log, self._items_log):
+            if log is not None:
+                log.close()
+        self._embeddings_log = None
+        self._items_log = None
 
     async def store(self, item: MemoryItem) -> None:
         """
@@ -100,10 +272,94 @@ class InMemoryVectorBackend(VectorBackend):
         # Generate embedding for value
         value_text = str(item.value)
         embedding = await self.embedding_provider.embed(value_text)
-        self._embeddings[item.key] = embedding
+        self._put(item, embedding)
+
+    async def store_many(self, items: Sequence[MemoryItem]) -> None:
+        """
+        Store several memory items, embedding their values in one batch.
+
+        Args:
+            items: Memory items to store
 
-        # Store item
+        Raises:
+            ValueError: If the provider returns a different number of embeddings
+        """
+        if not items:
+            return
+        embeddings = await self.embedding_provider.embed_batch([str(item.value) for item in items])
+        if len(embeddings) != len(items):
+            raise ValueError(
+                f"Embedding provider returned {len(embeddings)} embeddings for {len(items)} items"
+            )
+        for item, embedding in zip(items, embeddings, strict=True):
+            self._put(item, embedding)
+
+    def _put(self, item: MemoryItem, embedding: List[float]) -> None:
+        """Store an item with its normalized, packed embedding."""
+        vector = array("f", _normalize(embedding))
+        if self.persist_path is not None:
+            self._log_store(item, vector)
+        self._index(item, vector)
+
+    def _index(self, item: MemoryItem, vector: array) -> None:
+        """Keep an item and its packed embedding in memory and index its tags."""
+        previous = self._storage.get(item.key)
+        if previous is not None:
+            self._unindex_tags(previous)
+        self._embeddings[item.key] = vector
         self._storage[item.key] = item
+        for tag in item.tags:
+            self._keys_by_tag[tag].add(item.key)
+        if self.index == "hnsw":
+            self._hnsw_add(item.key, vector)
+
+    def _hnsw_add(self, key: str, vector: array) -> None:
+        """Add an embedding to the HNSW graph, creating or growing the graph as needed."""
+        self._hnsw_remove(key)
+        hnsw = self._hnsw
+        if hnsw is None:
+            hnsw = self._hnsw = hnswlib.Index(space="cosine", dim=len(vector))
+            hnsw.init_index(
+                max_elements=1024, ef_construction=200, M=16, allow_replace_deleted=True
+            )
+        elif len(vector) != hnsw.dim:
+            return  # Only reachable through the exact scan
+        # Deleted slots are reused first, so only grow once every slot holds a live item
+        if len(self._label_by_key) >= hnsw.get_max_elements():
+            hnsw.resize_index(2 * hnsw.get_max_elements())
+
+        label = self._next_label
+        self._next_label += 1
+        hnsw.add_items([vector.tolist()], [label], replace_deleted=True)
+        self._label_by_key[key] = label
+        self._key_by_label[label] = key
+
+    def _hnsw_remove(self, key: str) -> None:
+        """Mark a key's embedding, if any, as deleted in the HNSW graph."""
+        label = self._label_by_key.pop(key, None)
+        if label is not None and self._hnsw is not None:
+            del self._key_by_label[label]
+            self._hnsw.mark_deleted(label)
+
+    def _remove(self, key: str, log: bool = True) -> None:
+        """Remove an item, if present, with its embedding and tag index entries."""
+        item = self._storage.pop(key, None)
+        if item is not None:
+            self._embeddings.pop(key, None)
+            self._unindex_tags(item)
+            if self.index == "hnsw":
+                self._hnsw_remove(key)
+            if log and self.persist_path is not None:
+                self._log_delete(key)
+
+    def _unindex_tags(self, item: MemoryItem) -> None:
+        """Drop an item's key from the tag index."""
+        for tag in item.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(item.key)
+                if not keys:
+                    del self._keys_by_tag[tag]
 
     async def retrieve(self, key: str) -> Optional[MemoryItem]:
         """
@@ -117,8 +373,7 @@ class InMemoryVectorBackend(VectorBackend):
         """
         item = self._storage.get(key)
         if item and item.is_expired():
-            del self._storage[key]
-            self._embeddings.pop(key, None)
+            self._remove(key)
             return None
         return item
 
@@ -161,16 +416,32 @@ class InMemoryVectorBackend(VectorBackend):
             List of matching items sorted by similarity
         """
         # Generate query embedding
-        query_embedding = await self.embedding_provider.embed(query)
-
-        # Calculate similarities
-        results = []
-        for item in self._storage.values():
-            if item.is_expired():
-                continue
-
-            # Filter by tags if provided
-            if tags and not any(tag in item.tags for tag in tags):
+        query_embedding = _normalize(await self.embedding_provider.embed(query))
+        dimensions = len(query_embedding)
+        hnsw = self._hnsw
+        if (
+            hnsw is not None
+            and not tags
+            and dimensions == hnsw.dim
+            and len(self._label_by_key) == len(self._storage)
+        ):
+            return self._search_hnsw(hnsw, query_embedding, limit, threshold)
+
+        # Collect candidate items first, then score them in one batched pass
+        candidates = []
+        vectors = []
+        incomparable = []
+        items: Iterable[MemoryItem]
+        if tags:
+            # Only visit items carrying at least one of the tags
+            tagged = set().union(*(self._keys_by_tag.get(tag, ()) for tag in tags))
+            items = [self._storage[key] for key in tagged]
+        else:
+            items = self._storage.values()
+
+        now = datetime.now()
+        for item in items:
+            if item.is_expired(now):
                 continue
 
             # Get item embedding
@@ -178,15 +449,46 @@ class InMemoryVectorBackend(VectorBackend):
             if not item_embedding:
                 continue
 
-            # Calculate similarity
-            similarity = self._cosine_similarity(query_embedding, item_embedding)
-
-            if similarity >= threshold:
-                results.append((similarity, item))
-
-        # Sort by similarity (descending) and return top results
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [item for _, item in results[:limit]]
+            if len(item_embedding) == dimensions:
+                candidates.append(item)
+                vectors.append(item_embedding)
+            elif threshold <= 0.0:
+                # Embeddings of another dimension are not comparable
+                incomparable.append((0.0, item))
+
+        # Both vectors are unit length, so the dot product is the cosine.
+        # Scoring, thresholding and top-k selection run as one lazy pipeline,
+        # so no intermediate list of scored matches is built.
+        scored = zip(map(_dot, repeat(query_embedding), vectors), candidates, strict=True)
+        matches = (pair for pair in scored if pair[0] >= threshold)
+        top = heapq.nlargest(limit, chain(incomparable, matches), key=operator.itemgetter(0))
+        return [item for _, item in top]
+
+    def _search_hnsw(
+        self, hnsw: Any, query_embedding: List[float], limit: int, threshold: float
+    ) -> List[MemoryItem]:
+        """Approximate top-k search over the HNSW graph."""
+        live = len(self._label_by_key)
+        k = min(limit, live)
+        now = datetime.now()
+        while k:
+            hnsw.set_ef(max(k, 50))
+            labels, distances = hnsw.knn_query([query_embedding], k=k)
+
+            results: List[MemoryItem] = []
+            for label, distance in zip(labels[0], distances[0], strict=True):
+                # Cosine distance is 1 - cosine similarity, in ascending order
+                if 1.0 - float(distance) < threshold:
+                    return results[:limit]
+                item = self._storage[self._key_by_label[int(label)]]
+                if not item.is_expired(now):
+                    results.append(item)
+
+            if len(results) >= limit or k == live:
+                return results[:limit]
+            # Expired items took some of the k slots; widen the query
+            k = min(2 * k, live)
+        return []
 
     async def delete(self, key: str) -> None:
         """
@@ -195,9 +497,7 @@ class InMemoryVectorBackend(VectorBackend):
         Args:
             key: Memory key
         """
-        if key in self._storage:
-            del self._storage[key]
-            self._embeddings.pop(key, None)
+        self._remove(key)
 
     async def list_all(self, limit: Optional[int] = None) -> List[MemoryItem]:
         """
@@ -209,7 +509,8 @@ class InMemoryVectorBackend(VectorBackend):
         Returns:
             List of items
         """
-        items = [item for item in self._storage.values() if not item.is_expired()]
+        now = datetime.now()
+        items = [item for item in self._storage.values() if not item.is_expired(now)]
 
         if limit:
             items = items[:limit]
@@ -223,10 +524,10 @@ class InMemoryVectorBackend(VectorBackend):
         Returns:
             Number of items deleted
         """
-        expired_keys = [key for key, item in self._storage.items() if item.is_expired()]
+        now = datetime.now()
+        expired_keys = [key for key, item in self._storage.items() if item.is_expired(now)]
 
         for key in expired_keys:
-            del self._storage[key]
-            self._embeddings.pop(key, None)
+            self._remove(key)
 
         return len(expired_keys)
@@ -1,8 +1,71 @@
 """Metrics collection for Agents_Army."""
 
-from collections import defaultdict
+import math
+from array import array
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
+
+from agents_army.utils.columns import ColumnarSequence, StringInterner
+
+# Column kinds for _EventColumns: "S" interned string (None allowed), "q" int,
+# "d" float (None stored as NaN), "b" bool, "T" timestamp
+_ARRAY_TYPECODES = {"S": "i", "q": "q", "d": "d", "b": "b", "T": "d"}
+
+
+class _EventColumns(ColumnarSequence[Dict[str, Any]]):
+    """
+    Append-only event log stored column-wise in typed arrays.
+
+    String fields are interned to int IDs. Events are rebuilt as dicts only
+    when indexed, so aggregations can run over the raw columns.
+    """
+
+    def __init__(self, fields: Dict[str, str]):
+        """
+        Initialize event columns.
+
+        Args:
+            fields: Mapping of field name to column kind
+        """
+        self._fields = fields
+        self.columns: Dict[str, array] = {
+            name: array(_ARRAY_TYPECODES[kind]) for name, kind in fields.items()
+        }
+        self._strings = StringInterner()
+
+    def string_id(self, value: Optional[str]) -> int:
+        """Get the interned ID of a string, or -1 if it was never recorded."""
+        return self._strings.lookup(value)
+
+    def append(self, **values: Any) -> None:
+        """Append one event."""
+        for name, kind in self._fields.items():
+            value = values[name]
+            if kind == "S":
+                value = self._strings.intern(value)
+            elif kind == "d" and value is None:
+                value = math.nan
+            self.columns[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        event: Dict[str, Any] = {}
+        for name, kind in self._fields.items():
+            value = self.columns[name][index]
+            if kind == "S":
+                event[name] = self._strings.name(value)
+            elif kind == "d":
+                event[name] = None if math.isnan(value) else value
+            elif kind == "b":
+                event[name] = bool(value)
+            elif kind == "T":
+                event[name] = datetime.fromtimestamp(value).isoformat()
+            else:
+                event[name] = value
+        return event
 
 
 class MetricsCollector:
@@ -14,12 +77,39 @@ class MetricsCollector:
 
     def __init__(self):
         """Initialize MetricsCollector."""
-        self.metrics: Dict[str, Any] = defaultdict(lambda: {"count": 0, "total": 0.0})
-        self.llm_calls: List[Dict[str, Any]] = []
-        self.task_events: List[Dict[str, Any]] = []
-        self.agent_actions: List[Dict[str, Any]] = []
+        # Flat running aggregates per metric key; nested only when read via `metrics`
+        self._counts: Counter[str] = Counter()
+        self._totals: Dict[str, float] = defaultdict(float)
+        self._init_events()
         self.start_time = datetime.now()
 
+    @property
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregated metrics as ``{key: {"count": int, "total": float}}``."""
+        metrics: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "total": 0.0})
+        for key, count in self._counts.items():
+            metrics[key] = {"count": count, "total": float(self._totals.get(key, 0.0))}
+        return metrics
+
+    def _init_events(self) -> None:
+        """Create empty event logs."""
+        self.llm_calls = _EventColumns(
+            {
+                "agent_id": "S",
+                "model": "S",
+                "tokens": "q",
+                "duration": "d",
+                "success": "b",
+                "timestamp": "T",
+            }
+        )
+        self.task_events = _EventColumns(
+            {"task_id": "S", "event": "S", "agent_id": "S", "duration": "d", "timestamp": "T"}
+        )
+        self.agent_actions = _EventColumns(
+            {"agent_id": "S", "action": "S", "duration": "d", "timestamp": "T"}
+        )
+
     def record_llm_call(
         self,
         agent_id: str,
@@ -38,29 +128,24 @@ class MetricsCollector:
             duration: Call duration in seconds
             success: Whether call succeeded
         """
-        call_data = {
-            "agent_id": agent_id,
-            "model": model,
-            "tokens": tokens,
-            "duration": duration,
-            "success": success,
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        self.llm_calls.append(call_data)
+        self.llm_calls.append(
+            agent_id=agent_id,
+            model=model,
+            tokens=tokens,
+            duration=duration,
+            success=success,
+            timestamp=datetime.now().timestamp(),
+        )
 
         # Update aggregated metrics
         key = f"llm_calls.{model}"
-        self.metrics[key]["count"] += 1
-        self.metrics[key]["total"] += tokens
+        self._counts[key] += 1
+        self._totals[key] += tokens
 
-        self.metrics["llm_calls.total"]["count"] += 1
-        self.metrics["llm_calls.total"]["total"] += tokens
+        self._counts["llm_calls.total"] += 1
+        self._totals["llm_calls.total"] += tokens
 
-        if success:
-            self.metrics["llm_calls.success"]["count"] += 1
-        else:
-            self.metrics["llm_calls.failed"]["count"] += 1
+        self._counts["llm_calls.success" if success else "llm_calls.failed"] += 1
 
     def record_task_event(
         self,
@@ -78,22 +163,20 @@ class MetricsCollector:
             agent_id: Optional agent ID
             duration: Optional task duration
         """
-        event_data = {
-            "task_id": task_id,
-            "event": event,
-            "agent_id": agent_id,
-            "duration": duration,
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        self.task_events.append(event_data)
+        self.task_events.append(
+            task_id=task_id,
+            event=event,
+            agent_id=agent_id,
+            duration=duration,
+            timestamp=datetime.now().timestamp(),
+        )
 
         # Update metrics
         key = f"tasks.{event}"
-        self.metrics[key]["count"] += 1
+        self._counts[key] += 1
 
         if duration:
-            self.metrics[key]["total"] += duration
+            self._totals[key] += duration
 
     def record_agent_action(
         self,
@@ -109,21 +192,19 @@ class MetricsCollector:
             action: Action performed
             duration: Optional action duration
         """
-        action_data = {
-            "agent_id": agent_id,
-            "action": action,
-            "duration": duration,
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        self.agent_actions.append(action_data)
+        self.agent_actions.append(
+            agent_id=agent_id,
+            action=action,
+            duration=duration,
+            timestamp=datetime.now().timestamp(),
+        )
 
         # Update metrics
         key = f"agent_actions.{action}"
-        self.metrics[key]["count"] += 1
+        self._counts[key] += 1
 
         if duration:
-            self.metrics[key]["total"] += duration
+            self._totals[key] += duration
 
     def get_metrics(self, time_window: Optional[timedelta] = None) -> Dict[str, Any]:
         """
@@ -135,30 +216,32 @@ class MetricsCollector:
         Returns:
             Dictionary of metrics
         """
+        llm = self.llm_calls.columns
+        tasks = self.task_events.columns
+        success: Sequence[int]
+        tokens: Sequence[int]
+        durations: Sequence[float]
         if time_window:
-            cutoff = datetime.now() - time_window
-            filtered_llm = [
-                c for c in self.llm_calls if datetime.fromisoformat(c["timestamp"]) >= cutoff
-            ]
-            filtered_tasks = [
-                t for t in self.task_events if datetime.fromisoformat(t["timestamp"]) >= cutoff
-            ]
+            cutoff = (datetime.now() - time_window).timestamp()
+            llm_rows = [i for i, ts in enumerate(llm["timestamp"]) if ts >= cutoff]
+            task_rows = [i for i, ts in enumerate(tasks["timestamp"]) if ts >= cutoff]
+            success = [llm["success"][i] for i in llm_rows]
+            tokens = [llm["tokens"][i] for i in llm_rows]
+            durations = [llm["duration"][i] for i in llm_rows]
+            events = array("i", (tasks["event"][i] for i in task_rows))
         else:
-            filtered_llm = self.llm_calls
-            filtered_tasks = self.task_events
+            success, tokens, durations = llm["success"], llm["tokens"], llm["duration"]
+            events = tasks["event"]
 
         # Calculate statistics
-        total_llm_calls = len(filtered_llm)
-        successful_llm_calls = sum(1 for c in filtered_llm if c.get("success", True))
-        total_tokens = sum(c.get("tokens", 0) for c in filtered_llm)
-        avg_duration = (
-            sum(c.get("duration", 0) for c in filtered_llm) / total_llm_calls
-            if total_llm_calls > 0
-            else 0
-        )
+        total_llm_calls = len(tokens)
+        successful_llm_calls = sum(success)
+        total_tokens = sum(tokens)
+        avg_duration = math.fsum(durations) / total_llm_calls if total_llm_calls > 0 else 0
 
-        total_tasks = len(filtered_tasks)
-        completed_tasks = sum(1 for t in filtered_tasks if t.get("event") == "completed")
+        total_tasks = len(events)
+        completed_id = self.task_events.string_id("completed")
+        completed_tasks = events.count(completed_id) if completed_id >= 0 else 0
 
         return {
             "uptime_seconds": (datetime.now() - self.start_time).total_seconds(),
@@ -190,22 +273,32 @@ class MetricsCollector:
         Returns:
             Agent-specific metrics
         """
-        agent_llm_calls = [c for c in self.llm_calls if c["agent_id"] == agent_id]
-        agent_tasks = [t for t in self.task_events if t.get("agent_id") == agent_id]
-        agent_actions = [a for a in self.agent_actions if a["agent_id"] == agent_id]
+        counts = {}
+        for name, log in (
+            ("llm_calls", self.llm_calls),
+            ("tasks", self.task_events),
+            ("actions", self.agent_actions),
+        ):
+            string_id = log.string_id(agent_id)
+            counts[name] = log.columns["agent_id"].count(string_id) if string_id >= 0 else 0
+
+        llm = self.llm_calls.columns
+        llm_agent_id = self.llm_calls.string_id(agent_id)
+        total_tokens = sum(
+            tokens
+            for tokens, owner in zip(llm["tokens"], llm["agent_id"], strict=True)
+            if owner == llm_agent_id
+        )
 
         return {
             "agent_id": agent_id,
-            "llm_calls": len(agent_llm_calls),
-            "tasks": len(agent_tasks),
-            "actions": len(agent_actions),
-            "total_tokens": sum(c.get("tokens", 0) for c in agent_llm_calls),
+            **counts,
+            "total_tokens": total_tokens if llm_agent_id >= 0 else 0,
         }
 
     def reset(self) -> None:
         """Reset all metrics."""
-        self.metrics.clear()
-        self.llm_calls.clear()
-        self.task_events.clear()
-        self.agent_actions.clear()
+        self._counts.clear()
+        self._totals.clear()
+        self._init_events()
         self.start_time = datetime.now()
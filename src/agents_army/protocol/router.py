@@ -43,6 +43,12 @@ class MessageRouter:
         if role in self._handlers and handler in self._handlers[role]:
             self._handlers[role].remove(handler)
 
+    def clear(self) -> None:
+        """Remove all handlers and drop any queued messages."""
+        self._handlers.clear()
+        while not self._message_queue.empty():
+            self._message_queue.get_nowait()
+
     async def route(self, message: AgentMessage) -> None:
         """
         Route a message to appropriate handlers.
@@ -1,9 +1,15 @@
 """Message serialization and deserialization."""
 
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from agents_army.protocol.message import AgentMessage
+from agents_army.utils.serialization import ORJSON_AVAILABLE, json_loads
+
+
+def _parse_with_orjson(data: str) -> AgentMessage:
+    """Parse JSON with orjson, then validate the resulting dict as a message."""
+    return AgentMessage.model_validate(json_loads(data))
 
 
 class MessageSerializer:
@@ -89,18 +95,36 @@ class MessageSerializer:
             raise ValueError(f"Failed to deserialize message from dict: {e}")
 
     @staticmethod
-    def validate_json(json_str: str) -> bool:
+    def validate_json(json_str: str, backend: str = "pydantic") -> bool:
         """
         Validate that a JSON string is a valid message.
 
+        The default backend parses and validates in a single pydantic pass.
+        ``backend="orjson"`` parses with orjson first and validates the
+        resulting dict, for callers that already standardize on orjson.
+
         Args:
             json_str: JSON string to validate
+            backend: JSON backend, either "pydantic" or "orjson"
 
         Returns:
             True if valid, False otherwise
+
+        Raises:
+            ValueError: If backend is not supported or not installed
         """
+        parse: Callable[[str], AgentMessage]
+        if backend == "pydantic":
+            parse = AgentMessage.from_json
+        elif backend == "orjson":
+            if not ORJSON_AVAILABLE:
+                raise ValueError("orjson backend requested but orjson is not installed")
+            parse = _parse_with_orjson
+        else:
+            raise ValueError(f"Unsupported backend: {backend}")
+
         try:
-            AgentMessage.from_json(json_str)
+            parse(json_str)
             return True
         except Exception:
             return False
@@ -1,21 +1,24 @@
 """Rate limiting for Agents_Army."""
 
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+from typing import Callable, Deque, Dict, Optional
 
 
 class RateLimiter:
     """
     Rate limiter for API and agent actions.
 
-    Prevents abuse by limiting requests per time window.
+    Prevents abuse by limiting requests per sliding time window. Request
+    times are kept oldest first, so expiring them only touches the stale ones.
     """
 
     def __init__(
         self,
         default_limit: int = 100,
         default_window: timedelta = timedelta(minutes=1),
+        clock: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize RateLimiter.
@@ -23,13 +26,15 @@ class RateLimiter:
         Args:
             default_limit: Default requests per window
             default_window: Default time window
+            clock: Source of request times in seconds; monotonic by default
         """
         self.default_limit = default_limit
         self.default_window = default_window
+        self.clock = clock
         self.limits: Dict[str, Dict[str, int]] = defaultdict(
             lambda: {"limit": default_limit, "window_seconds": default_window.total_seconds()}
         )
-        self.requests: Dict[str, List[datetime]] = defaultdict(list)
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
 
     def set_limit(
         self,
@@ -62,24 +67,16 @@ class RateLimiter:
         Returns:
             True if allowed, False if rate limited
         """
-        now = datetime.now()
-        limit_config = self.limits[identifier]
-        limit = limit_config["limit"]
-        window_seconds = limit_config["window_seconds"]
-        window = timedelta(seconds=window_seconds)
-
-        # Clean old requests
-        cutoff = now - window
-        self.requests[identifier] = [
-            req_time for req_time in self.requests[identifier] if req_time > cutoff
-        ]
+        now = self.clock()
+        limit = self.limits[identifier]["limit"]
+        requests = self._prune(identifier, now)
 
         # Check limit
-        if len(self.requests[identifier]) >= limit:
+        if len(requests) >= limit:
             return False
 
         # Record request
-        self.requests[identifier].append(now)
+        requests.append(now)
         return True
 
     def get_remaining(self, identifier: str) -> int:
@@ -92,19 +89,25 @@ class RateLimiter:
         Returns:
             Number of remaining requests
         """
-        now = datetime.now()
-        limit_config = self.limits[identifier]
-        limit = limit_config["limit"]
-        window_seconds = limit_config["window_seconds"]
-        window = timedelta(seconds=window_seconds)
-
-        # Clean old requests
-        cutoff = now - window
-        self.requests[identifier] = [
-            req_time for req_time in self.requests[identifier] if req_time > cutoff
-        ]
-
-        return max(0, limit - len(self.requests[identifier]))
+        limit = self.limits[identifier]["limit"]
+        return max(0, limit - len(self._prune(identifier, self.clock())))
+
+    def _prune(self, identifier: str, now: float) -> Deque[float]:
+        """
+        Drop requests that have left the identifier's window.
+
+        Args:
+            identifier: Request identifier
+            now: Current clock reading
+
+        Returns:
+            The identifier's remaining request times, oldest first
+        """
+        cutoff = now - self.limits[identifier]["window_seconds"]
+        requests = self.requests[identifier]
+        while requests and requests[0] <= cutoff:
+            requests.popleft()
+        return requests
 
     def reset(self, identifier: Optional[str] = None) -> None:
         """
@@ -1,6 +1,8 @@
 """Tool Registry for managing and executing tools."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from agents_army.tools.tool import (
     InvalidParametersError,
@@ -20,6 +22,8 @@ class ToolRegistry:
     def __init__(self):
         """Initialize the tool registry."""
         self._tools: Dict[str, Tool] = {}
+        # Category -> tools in registration order
+        self._by_category: Dict[str, List[Tool]] = defaultdict(list)
 
     def register(self, tool: Tool) -> None:
         """
@@ -35,6 +39,7 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' is already registered")
 
         self._tools[tool.name] = tool
+        self._by_category[tool.category].append(tool)
 
     def unregister(self, tool_name: str) -> None:
         """
@@ -43,8 +48,12 @@ class ToolRegistry:
         Args:
             tool_name: Name of tool to unregister
         """
-        if tool_name in self._tools:
-            del self._tools[tool_name]
+        tool = self._tools.pop(tool_name, None)
+        if tool is not None:
+            tools = self._by_category[tool.category]
+            tools.remove(tool)
+            if not tools:
+                del self._by_category[tool.category]
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """
@@ -68,12 +77,9 @@ class ToolRegistry:
         Returns:
             List of tools
         """
-        tools = list(self._tools.values())
-
         if category:
-            tools = [tool for tool in tools if tool.category == category]
-
-        return tools
+            return list(self._by_category.get(category, ()))
+        return list(self._tools.values())
 
     def has_tool(self, name: str) -> bool:
         """
@@ -125,6 +131,41 @@ class ToolRegistry:
                 raise
             raise ToolExecutionError(f"Tool '{tool_name}' execution failed: {str(e)}") from e
 
+    async def execute_tools_batch(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = 8,
+    ) -> List[Any]:
+        """
+        Execute several independent tool calls concurrently.
+
+        Each call goes through execute_tool, so it is validated the same way.
+        A failing call does not cancel the others; its exception is returned
+        in its slot instead of a result.
+
+        Args:
+            calls: (tool name, parameters) pairs
+            max_concurrency: Maximum number of calls in flight at once
+
+        Returns:
+            Results (or exceptions) in the same order as calls
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(tool_name: str, params: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.execute_tool(tool_name, params)
+
+        return await asyncio.gather(
+            *(run(tool_name, params) for tool_name, params in calls), return_exceptions=True
+        )
+
     def get_all_tools(self) -> List[Tool]:
         """
         Get all registered tools.
@@ -145,5 +186,5 @@ class ToolRegistry:
             Number of tools
         """
         if category:
-            return len([t for t in self._tools.values() if t.category == category])
+            return len(self._by_category.get(category, ()))
         return len(self._tools)
@@ -6,6 +6,14 @@ from typing import Any, Dict, List, Optional
 from agents_army.tools.registry import ToolRegistry
 from agents_army.tools.tool import Tool, ToolExecutionError
 
+# A sentence is a run of text between terminators holding at least one
+# non-space character; matches start on that character, so scanning is linear
+_SENTENCE_RE = re.compile(r"[^.!?\s][^.!?]*")
+
+# HTML-like tag; only applied up to the last ">" so unclosed "<" runs cannot
+# make the engine rescan to the end of the input from every "<"
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class WebSearchTool(Tool):
     """Tool for web search (mock implementation for MVP)."""
@@ -152,8 +160,9 @@ class TextExtractorTool(Tool):
         Returns:
             Extracted text
         """
-        # Remove HTML tags if present
-        text = re.sub(r"<[^>]+>", "", content)
+        # Remove HTML tags if present; nothing after the last ">" can be a tag
+        end = content.rfind(">") + 1
+        text = _TAG_RE.sub("", content[:end]) + content[end:]
         # Remove extra whitespace
         text = " ".join(text.split())
         return text
@@ -298,17 +307,16 @@ class TextAnalyzerTool(Tool):
         Returns:
             Analysis results
         """
-        words = content.split()
-        sentences = re.split(r"[.!?]+", content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        word_count = len(content.split())
+        sentence_count = len(_SENTENCE_RE.findall(content))
 
         return {
-            "word_count": len(words),
+            "word_count": word_count,
             "character_count": len(content),
-            "character_count_no_spaces": len(content.replace(" ", "")),
-            "sentence_count": len(sentences),
-            "paragraph_count": len([p for p in content.split("\n\n") if p.strip()]),
-            "average_words_per_sentence": len(words) / len(sentences) if sentences else 0,
+            "character_count_no_spaces": len(content) - content.count(" "),
+            "sentence_count": sentence_count,
+            "paragraph_count": sum(1 for p in content.split("\n\n") if p.strip()),
+            "average_words_per_sentence": word_count / sentence_count if sentence_count else 0,
         }
 
 
@@ -0,0 +1,11 @@
+"""Shared helpers for Agents_Army components."""
+
+from agents_army.utils.columns import ColumnarSequence, StringInterner
+from agents_army.utils.serialization import json_dumps, json_loads
+
+__all__ = [
+    "ColumnarSequence",
+    "StringInterner",
+    "json_dumps",
+    "json_loads",
+]
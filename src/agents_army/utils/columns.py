@@ -0,0 +1,85 @@
+"""Helpers for records stored column-wise in typed arrays."""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Dict, List, Optional, TypeVar, Union, overload
+
+T = TypeVar("T")
+
+
+class StringInterner:
+    """
+    Maps strings to small int IDs, so string columns can live in int arrays.
+
+    ``None`` is stored as -1.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty interner."""
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, value: Optional[str]) -> int:
+        """
+        Get the ID of a string, assigning the next one if unseen.
+
+        Args:
+            value: String to intern, or None
+
+        Returns:
+            Integer ID, or -1 for None
+        """
+        if value is None:
+            return -1
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.names)
+            self.names.append(value)
+        return string_id
+
+    def lookup(self, value: Optional[str]) -> int:
+        """Get the ID of a string, or -1 if it was never interned."""
+        if value is None:
+            return -1
+        return self.ids.get(value, -1)
+
+    def name(self, string_id: int) -> Optional[str]:
+        """Get the string for an ID, or None for -1."""
+        return self.names[string_id] if string_id >= 0 else None
+
+    def clear(self) -> None:
+        """Forget every interned string."""
+        self.ids.clear()
+        self.names.clear()
+
+
+class ColumnarSequence(Sequence[T]):
+    """
+    Read-only sequence over column-wise storage, building each row on access.
+
+    Subclasses provide ``__len__`` and ``_row``; indexing and slicing are
+    handled here.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored rows."""
+
+    @abstractmethod
+    def _row(self, index: int) -> T:
+        """Build the row stored at a non-negative, in-range index."""
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._row(index)
@@ -1,12 +1,27 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
+
 import pytest
 from typing import AsyncGenerator
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure asyncio
 pytest_plugins = ("pytest_asyncio",)
 
 
+def pytest_configure(config):
+    """Run async tests on uvloop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 @pytest.fixture
 def sample_config() -> dict:
     """Sample configuration for testing."""
@@ -1,6 +1,5 @@
 """Tests for AutonomousTaskExecutor."""
 
-import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,11 +15,11 @@ class TestAutonomousTaskExecutor:
     """Tests for AutonomousTaskExecutor class."""
 
     @pytest.fixture
-    def mock_dt(self):
+    def mock_dt(self, tmp_path):
         """Create mock DT instance."""
         dt = MagicMock()
         dt.task_storage = MagicMock()
-        dt.task_storage.project_path = tempfile.mkdtemp()
+        dt.task_storage.project_path = str(tmp_path)
         dt.project_path = MagicMock()
         dt.project_path.name = ".dt"
         dt.project_path.parent = MagicMock()
@@ -1,5 +1,7 @@
 """Unit tests for DTAutonomyEngine."""
 
+from dataclasses import replace
+
 import pytest
 
 from agents_army.core.autonomy import (
@@ -13,6 +15,8 @@ from agents_army.core.models import Situation, Task
 from agents_army.core.rules import RulesLoader
 from agents_army.protocol.types import AgentRole
 
+_TASK_BASE = Task(id="task_001", title="Test task", description="Test description")
+
 
 class TestConfidenceCalculator:
     """Test ConfidenceCalculator."""
@@ -101,9 +105,11 @@ class TestDecisionHistory:
         )()
         result = type("ActionResult", (), {"success": True})()
 
+        before = len(history)
         history.add_decision(situation, decision, result)
 
-        assert len(history.history) == 1
+        assert len(history) == before + 1
+        assert len(history.history) == len(history)
 
     def test_find_similar(self):
         """Test finding similar decisions."""
@@ -137,6 +143,24 @@ class TestDecisionHistory:
 class TestDTAutonomyEngine:
     """Test DTAutonomyEngine."""
 
+    @pytest.fixture
+    def autonomy_engine(self):
+        """Create DTAutonomyEngine instance."""
+        return DTAutonomyEngine(rules_loader=RulesLoader())
+
+    @pytest.fixture
+    def analyzed(self, autonomy_engine):
+        """Analyze a situation once per task id and reuse the result."""
+        cache = {}
+
+        async def analyze(situation):
+            key = situation.task.id
+            if key not in cache:
+                cache[key] = await autonomy_engine._analyze_situation(situation)
+            return cache[key]
+
+        return analyze
+
     def test_create_engine(self):
         """Test creating DTAutonomyEngine."""
         rules_loader = RulesLoader()
@@ -146,7 +170,6 @@ class TestDTAutonomyEngine:
         assert engine.confidence_calculator is not None
         assert engine.risk_assessor is not None
 
-    @pytest.mark.asyncio
     async def test_decide_and_act(self):
         """Test decide_and_act."""
         rules_loader = RulesLoader()
@@ -168,40 +191,21 @@ class TestDTAutonomyEngine:
         assert "success" in result.__dict__
         assert "action_taken" in result.__dict__
 
-    @pytest.mark.asyncio
-    async def test_calculate_confidence(self):
+    async def test_calculate_confidence(self, autonomy_engine, analyzed):
         """Test calculate_confidence method."""
-        rules_loader = RulesLoader()
-        engine = DTAutonomyEngine(rules_loader=rules_loader)
+        situation = Situation(task=replace(_TASK_BASE), available_agents=[AgentRole.RESEARCHER])
+        analysis = await analyzed(situation)
 
-        task = Task(
-            id="task_001",
-            title="Test task",
-            description="Test description",
-        )
-        situation = Situation(task=task, available_agents=[AgentRole.RESEARCHER])
-        analysis = await engine._analyze_situation(situation)
-
-        confidence = engine.calculate_confidence(situation, analysis)
+        confidence = autonomy_engine.calculate_confidence(situation, analysis)
 
         assert 0.0 <= confidence.score <= 1.0
 
-    @pytest.mark.asyncio
-    async def test_assess_risk(self):
+    async def test_assess_risk(self, autonomy_engine, analyzed):
         """Test assess_risk method."""
-        rules_loader = RulesLoader()
-        engine = DTAutonomyEngine(rules_loader=rules_loader)
-
-        task = Task(
-            id="task_001",
-            title="Test task",
-            description="Test description",
-            priority=3,
-        )
-        situation = Situation(task=task)
-        analysis = await engine._analyze_situation(situation)
+        situation = Situation(task=replace(_TASK_BASE, priority=3))
+        analysis = await analyzed(situation)
 
-        risk = engine.assess_risk(situation, analysis)
+        risk = autonomy_engine.assess_risk(situation, analysis)
 
         assert 0.0 <= risk.total_risk <= 1.0
         assert risk.level in ["low", "medium", "high", "critical"]
@@ -227,10 +231,12 @@ class TestLearningEngine:
         )()
         result = type("ActionResult", (), {"success": True})()
 
+        decisions_before = len(engine.decision_history)
+        successes_before = len(engine.success_history)
         engine.record_decision(decision, result)
 
-        assert len(engine.decision_history) == 1
-        assert len(engine.success_history) == 1
+        assert len(engine.decision_history) == decisions_before + 1
+        assert len(engine.success_history) == successes_before + 1
 
     def test_adjust_thresholds(self):
         """Test threshold adjustment."""
@@ -1,10 +1,12 @@
 """Integration tests for DTAutonomyEngine with autonomous loops."""
 
-import tempfile
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
+from agents_army.core.autonomous_executor import AutonomousTaskExecutor
 from agents_army.core.autonomy import DTAutonomyEngine
 from agents_army.core.models import (
     ActionResult,
@@ -15,22 +17,46 @@ from agents_army.core.models import (
 from agents_army.core.rules import RulesLoader
 from agents_army.protocol.types import AgentRole
 
+_TASK_BASE = Task(id="test_task", title="Test task", description="Test description")
+
+
+@pytest.fixture(scope="module")
+def task():
+    """Create test task."""
+    return replace(_TASK_BASE, assigned_agent=AgentRole.BACKEND_ARCHITECT)
+
+
+@pytest.fixture(scope="module")
+def situation(task):
+    """Create situation shared by the autonomy level tests."""
+    return Situation(
+        task=task,
+        context={},
+        available_agents=[AgentRole.BACKEND_ARCHITECT],
+    )
+
 
 class TestDTAutonomyEngineIntegration:
     """Integration tests for DTAutonomyEngine."""
 
     @pytest.fixture
-    def mock_dt(self):
-        """Create mock DT instance."""
-        dt = MagicMock()
-        dt.task_storage = MagicMock()
-        dt.task_storage.project_path = tempfile.mkdtemp()
-        dt.project_path = MagicMock()
-        dt.project_path.name = ".dt"
-        dt.project_path.parent = MagicMock()
-        dt.current_project = None
-        dt.system = MagicMock()
-        return dt
+    def mock_agent(self):
+        """Create mock agent that completes any task it receives."""
+        agent = AsyncMock()
+        agent.handle_message.return_value = SimpleNamespace(
+            payload={"status": "completed", "result": {}}
+        )
+        return agent
+
+    @pytest.fixture
+    def mock_dt(self, tmp_path, mock_agent):
+        """Create lightweight stand-in for a DT instance."""
+        return SimpleNamespace(
+            task_storage=SimpleNamespace(project_path=str(tmp_path)),
+            project_path=SimpleNamespace(name=".dt", parent=SimpleNamespace()),
+            current_project=None,
+            system=SimpleNamespace(get_agent=lambda role: mock_agent),
+        )
 
     @pytest.fixture
     def autonomy_engine(self, mock_dt):
@@ -42,24 +68,23 @@ class TestDTAutonomyEngineIntegration:
         )
 
     @pytest.fixture
-    def task(self):
-        """Create test task."""
-        return Task(
-            id="test_task",
-            title="Test task",
-            description="Test description",
-            assigned_agent=AgentRole.BACKEND_ARCHITECT,
+    def mock_executor(self, monkeypatch):
+        """Replace AutonomousTaskExecutor with a mock that completes immediately."""
+        executor = AsyncMock(spec=AutonomousTaskExecutor)
+        executor.execute_until_complete.return_value = ActionResult(
+            success=True,
+            action_taken="completed",
         )
-
-    @pytest.mark.asyncio
-    async def test_level_4_executes_autonomous_loop(self, autonomy_engine, task, mock_dt):
-        """Test level 4 decision executes autonomous loop."""
-        situation = Situation(
-            task=task,
-            context={},
-            available_agents=[AgentRole.BACKEND_ARCHITECT],
+        monkeypatch.setattr(
+            "agents_army.core.autonomous_executor.AutonomousTaskExecutor",
+            lambda *args, **kwargs: executor,
         )
+        return executor
 
+    async def test_level_4_executes_autonomous_loop(
+        self, autonomy_engine, situation, mock_executor
+    ):
+        """Test level 4 decision executes autonomous loop."""
         # Mock decision with level 4
         decision = Decision(
             autonomous=True,
@@ -69,31 +94,13 @@ class TestDTAutonomyEngineIntegration:
             level=4,
         )
 
-        # Mock executor
-        with patch(
-            "agents_army.core.autonomous_executor.AutonomousTaskExecutor"
-        ) as mock_executor_class:
-            mock_executor = AsyncMock()
-            mock_executor.execute_until_complete.return_value = ActionResult(
-                success=True,
-                action_taken="completed",
-            )
-            mock_executor_class.return_value = mock_executor
-
-            result = await autonomy_engine._execute_autonomously(situation, decision)
+        result = await autonomy_engine._execute_autonomously(situation, decision)
 
-            assert result.success is True
-            mock_executor.execute_until_complete.assert_called_once()
+        assert result.success is True
+        mock_executor.execute_until_complete.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_level_3_executes_validated_loop(self, autonomy_engine, task, mock_dt):
+    async def test_level_3_executes_validated_loop(self, autonomy_engine, situation, mock_executor):
         """Test level 3 decision executes validated loop."""
-        situation = Situation(
-            task=task,
-            context={},
-            available_agents=[AgentRole.BACKEND_ARCHITECT],
-        )
-
         decision = Decision(
             autonomous=True,
             confidence=0.85,
@@ -102,32 +109,15 @@ class TestDTAutonomyEngineIntegration:
             level=3,
         )
 
-        with patch(
-            "agents_army.core.autonomous_executor.AutonomousTaskExecutor"
-        ) as mock_executor_class:
-            mock_executor = AsyncMock()
-            mock_executor.execute_until_complete.return_value = ActionResult(
-                success=True,
-                action_taken="completed",
-            )
-            mock_executor_class.return_value = mock_executor
-
-            result = await autonomy_engine._execute_autonomously(situation, decision)
-
-            assert result.success is True
-            # Should be called with validate_each_iteration=True
-            call_kwargs = mock_executor.execute_until_complete.call_args[1]
-            assert call_kwargs.get("validate_each_iteration") is True
-
-    @pytest.mark.asyncio
-    async def test_level_2_executes_simple(self, autonomy_engine, task, mock_dt):
-        """Test level 2 decision executes simple execution."""
-        situation = Situation(
-            task=task,
-            context={},
-            available_agents=[AgentRole.BACKEND_ARCHITECT],
-        )
+        result = await autonomy_engine._execute_autonomously(situation, decision)
+
+        assert result.success is True
+        # Should be called with validate_each_iteration=True
+        call_kwargs = mock_executor.execute_until_complete.call_args[1]
+        assert call_kwargs.get("validate_each_iteration") is True
 
+    async def test_level_2_executes_simple(self, autonomy_engine, situation, mock_agent):
+        """Test level 2 decision executes simple execution."""
         decision = Decision(
             autonomous=True,
             confidence=0.7,
@@ -136,27 +126,14 @@ class TestDTAutonomyEngineIntegration:
             level=2,
         )
 
-        # Mock agent execution
-        mock_agent = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.payload = {"status": "completed", "result": {}}
-        mock_agent.handle_message.return_value = mock_response
-        mock_dt.system.get_agent.return_value = mock_agent
-
         result = await autonomy_engine._execute_autonomously(situation, decision)
 
         # Should execute once and validate
-        assert mock_agent.handle_message.called
+        assert result.success is True
+        mock_agent.handle_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_level_1_escalates(self, autonomy_engine, task):
+    async def test_level_1_escalates(self, autonomy_engine, situation):
         """Test level 1 escalates to human."""
-        situation = Situation(
-            task=task,
-            context={},
-            available_agents=[AgentRole.BACKEND_ARCHITECT],
-        )
-
         decision = Decision(
             autonomous=False,
             confidence=0.5,
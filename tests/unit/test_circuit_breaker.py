@@ -1,7 +1,5 @@
 """Tests for TaskCircuitBreaker."""
 
-import tempfile
-
 import pytest
 
 from agents_army.core.circuit_breaker import (
@@ -13,29 +11,53 @@ from agents_army.core.progress_tracker import TaskProgressTracker
 from agents_army.core.task_storage import TaskStorage
 
 
+@pytest.fixture(scope="module")
+def progress_tracker(tmp_path_factory):
+    """Create TaskProgressTracker instance shared by the module."""
+    storage = TaskStorage(str(tmp_path_factory.mktemp("circuit_breaker")))
+    return TaskProgressTracker(storage)
+
+
+@pytest.fixture(scope="module")
+def circuit_breaker():
+    """Create TaskCircuitBreaker instance shared by the module."""
+    return TaskCircuitBreaker(
+        no_progress_threshold=3,
+        same_error_threshold=5,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(progress_tracker, circuit_breaker):
+    """Drop recorded iterations and circuit state so each test starts clean."""
+    yield
+    progress_tracker.clear_progress("test_task")
+    circuit_breaker.reset_all()
+
+
+@pytest.fixture
+def opened_circuit(circuit_breaker, progress_tracker):
+    """Open the circuit for "test_task" by recording iterations without progress."""
+    progress_tracker.record_iterations_bulk(
+        "test_task",
+        [
+            {
+                "iteration": i,
+                "file_changes": [],
+                "test_results": {},
+                "agent_output": "",
+                "errors": [],
+            }
+            for i in range(1, 4)
+        ],
+    )
+    circuit_breaker.check_should_continue("test_task", 4, progress_tracker)
+    return circuit_breaker
+
+
 class TestTaskCircuitBreaker:
     """Tests for TaskCircuitBreaker class."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for tests."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
-
-    @pytest.fixture
-    def progress_tracker(self, temp_dir):
-        """Create TaskProgressTracker instance."""
-        storage = TaskStorage(temp_dir)
-        return TaskProgressTracker(storage)
-
-    @pytest.fixture
-    def circuit_breaker(self):
-        """Create TaskCircuitBreaker instance."""
-        return TaskCircuitBreaker(
-            no_progress_threshold=3,
-            same_error_threshold=5,
-        )
-
     def test_check_should_continue_normal(self, circuit_breaker, progress_tracker):
         """Test normal operation (circuit closed)."""
         # Record some progress
@@ -56,15 +78,19 @@ class TestTaskCircuitBreaker:
     def test_check_should_continue_no_progress(self, circuit_breaker, progress_tracker):
         """Test circuit opening due to no progress."""
         # Record iterations without progress
-        for i in range(1, 4):
-            progress_tracker.record_iteration(
-                task_id="test_task",
-                iteration=i,
-                file_changes=[],  # No changes
-                test_results={"passed": False},
-                agent_output="",
-                errors=[],
-            )
+        progress_tracker.record_iterations_bulk(
+            "test_task",
+            [
+                {
+                    "iteration": i,
+                    "file_changes": [],
+                    "test_results": {"passed": False},
+                    "agent_output": "",
+                    "errors": [],
+                }
+                for i in range(1, 4)
+            ],
+        )
 
         result = circuit_breaker.check_should_continue("test_task", 4, progress_tracker)
 
@@ -75,59 +101,42 @@ class TestTaskCircuitBreaker:
     def test_check_should_continue_repeated_errors(self, circuit_breaker, progress_tracker):
         """Test circuit opening due to repeated errors."""
         # Record iterations with same error
-        for i in range(1, 6):
-            progress_tracker.record_iteration(
-                task_id="test_task",
-                iteration=i,
-                file_changes=[],
-                test_results={"passed": False},
-                agent_output="",
-                errors=["Same error"],
-            )
+        progress_tracker.record_iterations_bulk(
+            "test_task",
+            [
+                {
+                    "iteration": i,
+                    "file_changes": [],
+                    "test_results": {"passed": False},
+                    "agent_output": "",
+                    "errors": ["Same error"],
+                }
+                for i in range(1, 6)
+            ],
+        )
 
         result = circuit_breaker.check_should_continue("test_task", 6, progress_tracker)
 
         # Should open due to repeated errors
         assert result.should_continue is False
 
-    def test_is_open(self, circuit_breaker, progress_tracker):
+    def test_is_open(self, circuit_breaker):
         """Test checking if circuit is open."""
         assert circuit_breaker.is_open("test_task") is False
 
-        # Open circuit
-        for i in range(1, 4):
-            progress_tracker.record_iteration(
-                task_id="test_task",
-                iteration=i,
-                file_changes=[],
-                test_results={},
-                agent_output="",
-                errors=[],
-            )
-
-        circuit_breaker.check_should_continue("test_task", 4, progress_tracker)
+    def test_is_open_after_no_progress(self, opened_circuit):
+        """Test circuit reports open once stuck iterations open it."""
+        assert opened_circuit.is_open("test_task") is True
 
-        assert circuit_breaker.is_open("test_task") is True
-
-    def test_reset(self, circuit_breaker, progress_tracker):
+    def test_reset(self, opened_circuit):
         """Test resetting circuit breaker."""
-        # Open circuit
-        for i in range(1, 4):
-            progress_tracker.record_iteration(
-                task_id="test_task",
-                iteration=i,
-                file_changes=[],
-                test_results={},
-                agent_output="",
-                errors=[],
-            )
-
-        circuit_breaker.check_should_continue("test_task", 4, progress_tracker)
-        assert circuit_breaker.is_open("test_task") is True
-
-        # Reset
-        circuit_breaker.reset("test_task")
-        assert circuit_breaker.is_open("test_task") is False
+        opened_circuit.reset("test_task")
+        assert opened_circuit.is_open("test_task") is False
+
+    def test_reset_all(self, opened_circuit):
+        """Test resetting circuit breaker for every task."""
+        opened_circuit.reset_all()
+        assert opened_circuit.is_open("test_task") is False
 
     def test_strict_mode(self):
         """Test strict mode uses stricter thresholds."""
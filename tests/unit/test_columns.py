@@ -0,0 +1,51 @@
+"""Unit tests for the column storage helpers."""
+
+import pytest
+
+from agents_army.utils.columns import ColumnarSequence, StringInterner
+
+
+class SquaresView(ColumnarSequence):
+    """View over a list of ints, rebuilding each row as its square."""
+
+    def __init__(self, values):
+        self._values = values
+
+    def __len__(self):
+        return len(self._values)
+
+    def _row(self, index):
+        return self._values[index] ** 2
+
+
+class TestStringInterner:
+    """Test StringInterner."""
+
+    def test_intern_and_lookup(self):
+        """Test IDs are assigned in first-seen order and None maps to -1."""
+        interner = StringInterner()
+
+        assert [interner.intern(v) for v in ("a", "b", "a", None)] == [0, 1, 0, -1]
+        assert interner.lookup("b") == 1
+        assert interner.lookup("missing") == -1
+        assert interner.name(1) == "b"
+        assert interner.name(-1) is None
+
+        interner.clear()
+        assert interner.lookup("a") == -1
+        assert interner.intern("c") == 0
+
+
+class TestColumnarSequence:
+    """Test ColumnarSequence indexing."""
+
+    def test_indexing(self):
+        """Test integer, negative, slice and out-of-range access."""
+        view = SquaresView([1, 2, 3])
+
+        assert view[0] == 1
+        assert view[-1] == 9
+        assert view[1:] == [4, 9]
+        assert list(view) == [1, 4, 9]
+        with pytest.raises(IndexError, match="SquaresView index out of range"):
+            view[3]
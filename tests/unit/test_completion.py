@@ -124,23 +124,12 @@ class TestCompletionCriteria:
         count = criteria.count_completion_indicators(output)
         assert count == 0
 
-    def test_check_tests_without_runner(self):
-        """Test check_tests without validation runner."""
+    @pytest.mark.parametrize("method", ["check_tests", "check_linter", "check_build"])
+    def test_check_without_runner(self, method):
+        """Test validation checks without validation runner."""
         criteria = CompletionCriteria()
-        # Should return True if no runner (assumes tests pass)
-        assert criteria.check_tests() is True
-
-    def test_check_linter_without_runner(self):
-        """Test check_linter without validation runner."""
-        criteria = CompletionCriteria()
-        # Should return True if no runner (assumes linter passes)
-        assert criteria.check_linter() is True
-
-    def test_check_build_without_runner(self):
-        """Test check_build without validation runner."""
-        criteria = CompletionCriteria()
-        # Should return True if no runner (assumes build succeeds)
-        assert criteria.check_build() is True
+        # Should return True if no runner (assumes checks pass)
+        assert getattr(criteria, method)() is True
 
 
 class TestCompletionCriteriaFactory:
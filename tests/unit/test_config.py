@@ -1,8 +1,7 @@
 """Unit tests for ConfigLoader."""
 
 import json
-import tempfile
-from pathlib import Path
+import os
 
 import pytest
 import yaml
@@ -11,34 +10,88 @@ from agents_army.core.config import ConfigLoader
 from agents_army.protocol.types import AgentRole
 
 
-class TestConfigLoader:
-    """Test ConfigLoader class."""
-
-    def test_load_yaml_config(self):
-        """Test loading YAML configuration."""
-        config_data = {
-            "agents": {
-                "researcher": {
-                    "name": "Researcher",
-                    "goal": "Research topics",
-                    "backstory": "You are a researcher",
-                    "model": "gpt-4",
-                }
-            }
+@pytest.fixture(scope="module")
+def agents_yaml_path(tmp_path_factory):
+    """Write a two-agent YAML config once for the module."""
+    config_data = {
+        "agents": {
+            "researcher": {
+                "name": "Researcher",
+                "goal": "Research topics",
+                "backstory": "You are a researcher",
+                "model": "gpt-4",
+            },
+            "writer": {
+                "name": "Writer",
+                "goal": "Write content",
+                "backstory": "You are a writer",
+            },
         }
+    }
+    path = tmp_path_factory.mktemp("config") / "agents.yaml"
+    path.write_text(yaml.dump(config_data))
+    return str(path)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
 
-        try:
-            config = ConfigLoader.load_from_file(temp_path)
-            assert "agents" in config
-            assert "researcher" in config["agents"]
-        finally:
-            Path(temp_path).unlink()
+class TestConfigLoader:
+    """Test ConfigLoader class."""
 
-    def test_load_json_config(self):
+    def test_load_yaml_config(self, agents_yaml_path):
+        """Test loading YAML configuration."""
+        config = ConfigLoader.load_from_file(agents_yaml_path)
+        assert "agents" in config
+        assert "researcher" in config["agents"]
+
+    def test_load_yaml_config_json_cache(self, tmp_path):
+        """Test YAML config is served from its JSON cache while the cache is fresh."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({"agents": {"researcher": {"name": "Researcher"}}}))
+        cache_path = tmp_path / "config.yaml.cache.json"
+
+        config = ConfigLoader.load_from_file(str(config_path), json_cache=True)
+        assert config["agents"]["researcher"]["name"] == "Researcher"
+        assert json.loads(cache_path.read_text()) == config
+
+        # A fresh cache is read instead of the YAML
+        ConfigLoader.clear_cache()
+        cache_path.write_text(json.dumps({"agents": {}}))
+        assert ConfigLoader.load_from_file(str(config_path), json_cache=True) == {"agents": {}}
+
+        # A cache older than the YAML is ignored and rewritten
+        stale = config_path.stat().st_mtime_ns - 1_000_000_000
+        os.utime(cache_path, ns=(stale, stale))
+        ConfigLoader.clear_cache()
+        config = ConfigLoader.load_from_file(str(config_path), json_cache=True)
+        assert "researcher" in config["agents"]
+
+    def test_load_yaml_config_json_cache_skips_lossy_data(self, tmp_path):
+        """Test YAML that JSON cannot round-trip is never cached."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("ports:\n  8080: web\n")
+
+        config = ConfigLoader.load_from_file(str(config_path), json_cache=True)
+
+        assert config == {"ports": {8080: "web"}}
+        assert not (tmp_path / "config.yaml.cache.json").exists()
+
+    def test_load_from_file_memoized(self, tmp_path):
+        """Test repeated loads reuse the parsed config until the file changes."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({"agents": {"researcher": {"name": "Researcher"}}}))
+
+        first = ConfigLoader.load_from_file(str(config_path))
+        first["agents"]["researcher"]["name"] = "Mutated"
+
+        # Callers get independent copies
+        second = ConfigLoader.load_from_file(str(config_path))
+        assert second["agents"]["researcher"]["name"] == "Researcher"
+
+        # Changing the file invalidates the entry
+        config_path.write_text(yaml.dump({"agents": {"writer": {"name": "Writer"}}}))
+        third = ConfigLoader.load_from_file(str(config_path))
+        assert "writer" in third["agents"]
+
+    def test_load_json_config(self, tmp_path):
         """Test loading JSON configuration."""
         config_data = {
             "agents": {
@@ -49,16 +102,11 @@ class TestConfigLoader:
                 }
             }
         }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config_data))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
-
-        try:
-            config = ConfigLoader.load_from_file(temp_path)
-            assert "agents" in config
-        finally:
-            Path(temp_path).unlink()
+        config = ConfigLoader.load_from_file(str(config_path))
+        assert "agents" in config
 
     def test_create_agent_config(self):
         """Test creating AgentConfig from dictionary."""
@@ -91,50 +139,35 @@ class TestConfigLoader:
         assert agent_config.max_iterations == 5
         assert agent_config.department == "Research"
 
-    def test_load_agents_from_config(self):
+    def test_load_agents_from_config(self, agents_yaml_path):
         """Test loading multiple agents from config."""
-        config_data = {
-            "agents": {
-                "researcher": {
-                    "name": "Researcher",
-                    "goal": "Research topics",
-                    "backstory": "You are a researcher",
-                },
-                "writer": {
-                    "name": "Writer",
-                    "goal": "Write content",
-                    "backstory": "You are a writer",
-                },
-            }
-        }
+        agent_configs = ConfigLoader.load_agents_from_config(agents_yaml_path)
+
+        assert AgentRole.RESEARCHER in agent_configs
+        assert AgentRole.WRITER in agent_configs
+        assert agent_configs[AgentRole.RESEARCHER].name == "Researcher"
+        assert agent_configs[AgentRole.WRITER].name == "Writer"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
+    def test_load_agents_from_config_skips_unknown_roles(self, tmp_path):
+        """Test unknown roles are skipped and the memoized config is left untouched."""
+        path = tmp_path / "agents.yaml"
+        path.write_text(yaml.dump({"agents": {"researcher": {"name": "R"}, "wizard": {}}}))
 
-        try:
-            agent_configs = ConfigLoader.load_agents_from_config(temp_path)
+        agent_configs = ConfigLoader.load_agents_from_config(str(path))
+        agent_configs[AgentRole.RESEARCHER].name = "Changed"
 
-            assert AgentRole.RESEARCHER in agent_configs
-            assert AgentRole.WRITER in agent_configs
-            assert agent_configs[AgentRole.RESEARCHER].name == "Researcher"
-            assert agent_configs[AgentRole.WRITER].name == "Writer"
-        finally:
-            Path(temp_path).unlink()
+        assert list(agent_configs) == [AgentRole.RESEARCHER]
+        assert ConfigLoader.load_from_file(str(path))["agents"]["researcher"]["name"] == "R"
 
     def test_load_nonexistent_file(self):
         """Test loading non-existent file raises error."""
         with pytest.raises(FileNotFoundError):
             ConfigLoader.load_from_file("nonexistent.yaml")
 
-    def test_load_unsupported_format(self):
+    def test_load_unsupported_format(self, tmp_path):
         """Test loading unsupported format raises error."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Unsupported file format"):
-                ConfigLoader.load_from_file(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        config_path = tmp_path / "config.txt"
+        config_path.write_text("test")
+
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            ConfigLoader.load_from_file(str(config_path))
@@ -19,6 +19,13 @@ class TestCostTracker:
         # Should be approximately (1000/1M * 30) + (500/1M * 60) = 0.06
         assert cost > 0
         assert cost < 1.0  # Should be small
+        assert cost == pytest.approx(0.06)
+
+    def test_calculate_cost_unknown_model(self):
+        """Test unknown models cost nothing."""
+        tracker = CostTracker()
+
+        assert tracker.calculate_cost("unknown-model", 1000, 500) == 0.0
 
     def test_record_llm_cost(self):
         """Test recording LLM cost."""
@@ -72,6 +79,42 @@ class TestCostTracker:
         assert "agent_001" in breakdown
         assert "agent_002" in breakdown
 
+    def test_breakdowns_match_records(self):
+        """Test aggregates agree with the recorded costs and clear on reset."""
+        tracker = CostTracker()
+
+        tracker.record_llm_cost("gpt-4", 1000, 500, agent_id="agent_001")
+        tracker.record_llm_cost("gpt-4", 2000, 0, agent_id="agent_002")
+        tracker.record_llm_cost("claude-3-haiku", 1000, 500)
+
+        assert tracker.get_total_cost() == pytest.approx(sum(r.cost for r in tracker.costs))
+        assert tracker.get_cost_by_model()["gpt-4"] == pytest.approx(
+            sum(r.cost for r in tracker.costs if r.model == "gpt-4")
+        )
+        assert set(tracker.get_cost_by_agent()) == {"agent_001", "agent_002"}
+
+        tracker.reset()
+
+        assert tracker.get_total_cost() == 0.0
+        assert tracker.get_cost_by_model() == {}
+        assert tracker.get_cost_by_agent() == {}
+
+    def test_costs_view(self):
+        """Test recorded costs read back as CostRecord objects."""
+        tracker = CostTracker()
+
+        first = tracker.record_llm_cost("gpt-4", 1000, 500, metadata={"task": "t1"})
+        tracker.record_llm_cost("claude-3-haiku", 200, 100, agent_id="agent_001")
+
+        assert tracker.costs[0] == first
+        assert tracker.costs[0].agent_id is None
+        assert tracker.costs[0].metadata == {"task": "t1"}
+        assert tracker.costs[-1].agent_id == "agent_001"
+        assert [r.model for r in tracker.costs[:2]] == ["gpt-4", "claude-3-haiku"]
+        assert len(tracker.get_recent_costs(hours=1)) == 2
+        with pytest.raises(IndexError):
+            tracker.costs[2]
+
     def test_budget_alert(self):
         """Test budget alert triggering."""
         tracker = CostTracker(budget=0.01)  # Very small budget
@@ -1,5 +1,6 @@
 """Unit tests for El DT."""
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -12,6 +13,7 @@ import pytest
 from agents_army.agents.dt import DT
 from agents_army.core.agent import LLMProvider
 from agents_army.core.models import Task
+from agents_army.core.task_storage import TaskStorage
 from agents_army.protocol.types import AgentRole
 
 
@@ -133,6 +135,32 @@ class TestDT:
             assert next_task is not None
             assert next_task.priority == 5  # Should get highest priority
 
+    @pytest.mark.asyncio
+    async def test_get_next_task_skips_blocked(self):
+        """Test next task ignores tasks with dependencies and empty queues."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dt = DT(project_path=tmpdir)
+            await dt.initialize_project("Test", "Test")
+
+            assert await dt.get_next_task() is None
+
+            dt.task_storage.save_task(
+                Task(id="task_001", title="Ready", description="Test", priority=2)
+            )
+            dt.task_storage.save_task(
+                Task(
+                    id="task_002",
+                    title="Waiting",
+                    description="Test",
+                    priority=5,
+                    dependencies=["task_001"],
+                )
+            )
+
+            next_task = await dt.get_next_task()
+            assert next_task is not None
+            assert next_task.id == "task_001"
+
     @pytest.mark.asyncio
     async def test_assign_task(self):
         """Test assigning task to agent."""
@@ -174,3 +202,94 @@ class TestDT:
 
             assert updated.status == "done"
             assert updated.id == task.id
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_task_storage_round_trip(self, tmp_path, monkeypatch, use_orjson):
+        """Test tasks survive a save/load cycle with and without orjson."""
+        from agents_army.utils import serialization
+
+        if use_orjson and not serialization.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", use_orjson)
+
+        dt = DT(project_path=str(tmp_path))
+        await dt.initialize_project("Test", "Test")
+
+        task = Task(
+            id="task_001",
+            title="Técnico",
+            description="Test",
+            tags=["api"],
+            metadata={"estimate": 2},
+        )
+        dt.task_storage.save_task(task)
+
+        loaded = dt.task_storage.load_task("task_001")
+
+        assert loaded.to_dict() == task.to_dict()
+        assert [t.id for t in dt.task_storage.list_tasks()] == ["task_001"]
+
+    async def test_list_tasks_ignores_other_files(self, tmp_path):
+        """Test list_tasks loads every *.json file, dot-prefixed ones included, as glob did."""
+        dt = DT(project_path=str(tmp_path))
+        await dt.initialize_project("Test", "Test")
+        dt.task_storage.save_task(Task(id="task_001", title="Task", description="Test"))
+
+        pending = tmp_path / "tasks" / "pending"
+        (pending / "notes.txt").write_text("not a task")
+        (pending / "broken.json").write_text("{}")
+        hidden = Task(id="task_002", title="Hidden", description="Test")
+        (pending / ".hidden.json").write_text(json.dumps(hidden.to_dict()))
+
+        listed = dt.task_storage.list_tasks(status="pending")
+        assert sorted(t.id for t in listed) == ["task_001", "task_002"]
+        assert dt.task_storage.list_tasks(status="missing") == []
+
+    def test_task_storage_wal(self, tmp_path):
+        """Test write-ahead log saves are visible, replayed, and compacted to files."""
+        storage = TaskStorage(str(tmp_path), use_wal=True)
+        storage.save_task(Task(id="task_001", title="First", description="Test"))
+        storage.save_task(Task(id="task_002", title="Second", description="Test"))
+        storage.save_task(Task(id="task_001", title="First v2", description="Test"))
+        storage.move_task("task_002", "pending", "done")
+        storage.delete_task("task_003")
+
+        pending_dir = tmp_path / "tasks" / "pending"
+        assert not list(pending_dir.glob("*.json"))
+        assert storage.load_task("task_001").title == "First v2"
+        assert [t.id for t in storage.list_tasks(status="done")] == ["task_002"]
+
+        # A new instance replays the log left behind
+        replayed = TaskStorage(str(tmp_path), use_wal=True)
+        assert {t.id for t in replayed.list_tasks()} == {"task_001", "task_002"}
+
+        replayed.close()
+        storage.close()
+
+        assert not (tmp_path / "tasks" / TaskStorage.WAL_FILENAME).exists()
+        plain = TaskStorage(str(tmp_path))
+        assert plain.load_task("task_001").title == "First v2"
+        assert (tmp_path / "tasks" / "done" / "task_002.json").exists()
+
+    def test_task_storage_wal_status_change_of_saved_task(self, tmp_path):
+        """Test compacting a logged status change removes the task file from its old status."""
+        TaskStorage(str(tmp_path)).save_task(
+            Task(id="t1", title="Task", description="Test", priority=3)
+        )
+        storage = TaskStorage(str(tmp_path), use_wal=True)
+        storage.save_task(
+            Task(id="t1", title="Task", description="Test", status="done", priority=5)
+        )
+        storage.save_task(Task(id="t2", title="Other", description="Test"))
+        storage.move_task("t2", "pending", "blocked")
+        storage.compact()
+
+        tasks_dir = tmp_path / "tasks"
+        assert not (tasks_dir / "pending" / "t1.json").exists()
+        assert not (tasks_dir / "pending" / "t2.json").exists()
+        assert (tasks_dir / "blocked" / "t2.json").exists()
+
+        fresh = TaskStorage(str(tmp_path))
+        assert sorted(t.id for t in fresh.list_tasks()) == ["t1", "t2"]
+        assert [t.id for t in fresh.list_tasks(status="done")] == ["t1"]
+        assert fresh.load_task("t1").priority == 5
@@ -1,5 +1,8 @@
 """Unit tests for advanced DT functionalities."""
 
+import re
+from datetime import timedelta
+
 import pytest
 
 from agents_army.agents.dt import DT
@@ -12,21 +15,28 @@ from agents_army.core.models import (
 )
 from agents_army.protocol.types import AgentRole
 
+# Canned responses keyed by prompt keyword, in priority order
+_MOCK_RESPONSES = {
+    "synthesize": "Synthesized result combining all agent outputs",
+    "resolve": "Resolution: Choose approach A as it aligns best with project goals",
+    "conflict": "Resolution: Choose approach A as it aligns best with project goals",
+    "decompose": """[
+                {"title": "Subtask 1", "description": "First part", "priority": 5, "tags": ["tag1"], "dependencies": []},
+                {"title": "Subtask 2", "description": "Second part", "priority": 4, "tags": ["tag2"], "dependencies": ["Subtask 1"]}
+            ]""",
+}
+_MOCK_KEYWORDS = re.compile("|".join(_MOCK_RESPONSES), re.IGNORECASE)
+
 
 class MockLLMProvider(LLMProvider):
     """Mock LLM provider for testing."""
 
     async def generate(self, prompt: str, **kwargs):
         """Generate mock response."""
-        if "synthesize" in prompt.lower():
-            return "Synthesized result combining all agent outputs"
-        elif "resolve" in prompt.lower() or "conflict" in prompt.lower():
-            return "Resolution: Choose approach A as it aligns best with project goals"
-        elif "decompose" in prompt.lower():
-            return """[
-                {"title": "Subtask 1", "description": "First part", "priority": 5, "tags": ["tag1"], "dependencies": []},
-                {"title": "Subtask 2", "description": "Second part", "priority": 4, "tags": ["tag2"], "dependencies": ["Subtask 1"]}
-            ]"""
+        found = {keyword.lower() for keyword in _MOCK_KEYWORDS.findall(prompt)}
+        for keyword, response in _MOCK_RESPONSES.items():
+            if keyword in found:
+                return response
         return "Mock response"
 
 
@@ -203,6 +213,25 @@ class TestTaskScheduler:
         task2_idx = next(i for i, t in enumerate(scheduled) if t.id == "task_002")
         assert task1_idx < task2_idx
 
+    def test_schedule_tasks_keeps_dependencies(self):
+        """Test scheduling orders by priority without mutating task dependencies."""
+        dt = DT(llm_provider=MockLLMProvider())
+
+        base = Task(id="task_001", title="Base", description="Base", priority=1)
+        urgent = Task(id="task_002", title="Urgent", description="Urgent", priority=5)
+        follow_up = Task(
+            id="task_003",
+            title="Follow-up",
+            description="Follow-up",
+            priority=5,
+            dependencies=["task_001"],
+        )
+
+        scheduled = dt.task_scheduler.schedule_tasks([follow_up, base, urgent])
+
+        assert [t.id for t in scheduled] == ["task_002", "task_001", "task_003"]
+        assert follow_up.dependencies == ["task_001"]
+
     def test_find_critical_path(self):
         """Test finding critical path."""
         dt = DT(llm_provider=MockLLMProvider())
@@ -228,6 +257,27 @@ class TestTaskScheduler:
         assert "task_002" in critical_path
         assert "task_003" in critical_path
 
+    def test_find_critical_path_picks_longest_branch(self):
+        """Test critical path follows the longest-duration branch."""
+        dt = DT(llm_provider=MockLLMProvider())
+
+        tasks = [
+            Task(id="start", title="Start", description="Start"),
+            Task(id="short", title="Short", description="x", dependencies=["start"]),
+            Task(id="long", title="Long", description="x" * 3000, dependencies=["start"]),
+            Task(id="end", title="End", description="End", dependencies=["short", "long"]),
+        ]
+
+        critical_path = dt.task_scheduler.find_critical_path(tasks)
+        result = dt.task_scheduler.optimize_schedule(tasks)
+
+        assert critical_path == ["start", "long", "end"]
+        assert result["critical_path"] == critical_path
+        assert result["estimated_duration"] == sum(
+            (dt.task_scheduler.estimate_duration(t) for t in tasks if t.id in critical_path),
+            timedelta(),
+        )
+
     def test_estimate_duration(self):
         """Test duration estimation."""
         dt = DT(llm_provider=MockLLMProvider())
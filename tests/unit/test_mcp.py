@@ -153,14 +153,8 @@ class TestMCPServer:
             accessible_by=[AgentRole.BACKEND_ARCHITECT],
         )
 
-        # Register tools synchronously for this test
-        import asyncio
-
-        async def register():
-            await server.register_tool(tool1)
-            await server.register_tool(tool2)
-
-        asyncio.run(register())
+        server._register_tool_impl(tool1)
+        server._register_tool_impl(tool2)
 
         # Get tools for DT (should get tool1 only, tool2 is restricted)
         dt_tools = server.get_tools(AgentRole.DT)
@@ -171,6 +165,53 @@ class TestMCPServer:
         backend_tools = server.get_tools(AgentRole.BACKEND_ARCHITECT)
         assert len(backend_tools) == 2
 
+    async def test_get_tools_after_reregister(self):
+        """Test re-registering a tool replaces its access restrictions."""
+        server = MCPServer(MCPServerConfig(name="test_server"))
+
+        await server.register_tool(
+            MockMCPTool(name="tool1", description="Tool 1"),
+            accessible_by=[AgentRole.BACKEND_ARCHITECT],
+        )
+        assert server.get_tools(AgentRole.DT) == []
+
+        await server.register_tool(MockMCPTool(name="tool1", description="Tool 1"))
+
+        assert [t.name for t in server.get_tools(AgentRole.DT)] == ["tool1"]
+        assert [t.name for t in server.get_tools(AgentRole.BACKEND_ARCHITECT)] == ["tool1"]
+
+    async def test_get_tools_keeps_registration_order(self):
+        """Test role-filtered tools interleave open and restricted tools in registration order."""
+        server = MCPServer(MCPServerConfig(name="test_server"))
+        backend = [AgentRole.BACKEND_ARCHITECT]
+
+        await server.register_tool(MockMCPTool(name="a", description="A"), accessible_by=backend)
+        await server.register_tool(MockMCPTool(name="b", description="B"))
+        await server.register_tool(MockMCPTool(name="c", description="C"), accessible_by=backend)
+        await server.register_tool(MockMCPTool(name="d", description="D"))
+        # Re-registering keeps the tool's original position, as in server.tools
+        await server.register_tool(MockMCPTool(name="a", description="A"))
+
+        expected = list(server.tools)
+        assert [t.name for t in server.get_tools(AgentRole.BACKEND_ARCHITECT)] == expected
+        assert [t.name for t in server.get_tools(AgentRole.DT)] == ["a", "b", "d"]
+
+    async def test_get_resources_by_role(self):
+        """Test getting resources filtered by agent role."""
+        server = MCPServer(MCPServerConfig(name="test_server"))
+
+        await server.register_resource(
+            MockMCPResource(uri="resource://open", name="Open", description="Open")
+        )
+        await server.register_resource(
+            MockMCPResource(uri="resource://backend", name="Backend", description="Backend"),
+            accessible_by=[AgentRole.BACKEND_ARCHITECT],
+        )
+
+        assert [r.uri for r in server.get_resources(AgentRole.DT)] == ["resource://open"]
+        assert len(server.get_resources(AgentRole.BACKEND_ARCHITECT)) == 2
+        assert len(server.get_resources()) == 2
+
     def test_list_tools(self):
         """Test listing tools."""
         config = MCPServerConfig(name="test_server")
@@ -179,13 +220,8 @@ class TestMCPServer:
         tool1 = MockMCPTool(name="tool1", description="Tool 1")
         tool2 = MockMCPTool(name="tool2", description="Tool 2")
 
-        import asyncio
-
-        async def register():
-            await server.register_tool(tool1)
-            await server.register_tool(tool2)
-
-        asyncio.run(register())
+        server._register_tool_impl(tool1)
+        server._register_tool_impl(tool2)
 
         tool_names = server.list_tools()
         assert "tool1" in tool_names
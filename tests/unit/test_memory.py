@@ -1,6 +1,7 @@
 """Unit tests for memory system."""
 
-import tempfile
+import asyncio
+from contextlib import aclosing
 from datetime import datetime, timedelta
 
 import pytest
@@ -38,6 +39,14 @@ class TestMemoryItem:
 
         assert item.is_expired() is True
 
+    def test_is_expired_at_given_time(self):
+        """Test expiry is evaluated against the supplied time."""
+        expires_at = datetime(2025, 1, 1, 12, 0)
+        item = MemoryItem(key="test_key", value="test_value", expires_at=expires_at)
+
+        assert item.is_expired(expires_at - timedelta(seconds=1)) is False
+        assert item.is_expired(expires_at + timedelta(seconds=1)) is True
+
     def test_memory_item_to_dict(self):
         """Test memory item serialization."""
         item = MemoryItem(
@@ -67,6 +76,33 @@ class TestMemoryItem:
         assert item.key == "test_key"
         assert item.value == "test_value"
 
+    def test_memory_item_round_trip(self):
+        """Test to_dict/from_dict round-trips every field."""
+        item = MemoryItem(
+            key="test_key",
+            value={"nested": [1, 2]},
+            metadata={"source": "test"},
+            expires_at=datetime.now() + timedelta(hours=1),
+            tags=["tag1"],
+            memory_type="task",
+        )
+
+        assert MemoryItem.from_dict(item.to_dict()) == item
+        assert not hasattr(item, "__dict__")
+
+    def test_memory_item_row_round_trip(self):
+        """Test to_row/from_row round-trips every field through table columns."""
+        item = MemoryItem(
+            key="test_key",
+            value={"nested": [1, 2]},
+            metadata={"source": "test"},
+            expires_at=datetime.now() + timedelta(hours=1),
+            tags=["tag1"],
+        )
+        columns = ("key", "value", "metadata", "created_at", "expires_at", "tags", "memory_type")
+
+        assert MemoryItem.from_row(dict(zip(columns, item.to_row(), strict=True))) == item
+
 
 class TestRetentionPolicy:
     """Test RetentionPolicy."""
@@ -88,6 +124,13 @@ class TestRetentionPolicy:
         assert policy.get_ttl("task") == timedelta(days=7)
         assert policy.get_ttl("general") == timedelta(days=30)
 
+    def test_get_ttl_unknown_type(self):
+        """Test unknown memory types, including method names, use the general TTL."""
+        policy = RetentionPolicy(general=timedelta(days=3))
+
+        assert policy.get_ttl("scratch") == timedelta(days=3)
+        assert policy.get_ttl("get_ttl") == timedelta(days=3)
+
     def test_from_config(self):
         """Test creating from config."""
         config = {
@@ -118,6 +161,15 @@ class TestInMemoryBackend:
         assert retrieved is not None
         assert retrieved.value == "value"
 
+    @pytest.mark.asyncio
+    async def test_store_many(self):
+        """Test bulk store makes every item retrievable."""
+        backend = InMemoryBackend()
+
+        await backend.store_many([MemoryItem(key=f"key{i}", value=i) for i in range(3)])
+
+        assert [item.value for item in await backend.list_all()] == [0, 1, 2]
+
     @pytest.mark.asyncio
     async def test_search(self):
         """Test searching items."""
@@ -133,6 +185,42 @@ class TestInMemoryBackend:
         assert len(results) == 1
         assert results[0].key == "key1"
 
+    @pytest.mark.asyncio
+    async def test_search_by_tags(self):
+        """Test tag lookups intersect the tag index and track replaces and deletes."""
+        backend = InMemoryBackend()
+        await backend.store_many(
+            [
+                MemoryItem(key=f"key{i}", value=i, tags=[f"tag{i % 10}", f"even{i % 2 == 0}"])
+                for i in range(1000)
+            ]
+        )
+
+        results = await backend.search_by_tags(["tag3", "evenFalse"])
+        assert {item.key for item in results} == {f"key{i}" for i in range(3, 1000, 10)}
+        assert await backend.search_by_tags(["tag3", "evenTrue"]) == []
+        assert len(await backend.search_by_tags(["tag4"], limit=5)) == 5
+
+        await backend.store(MemoryItem(key="key3", value=3, tags=["retagged"]))
+        await backend.delete("key13")
+        results = await backend.search_by_tags(["tag3"])
+        assert len(results) == 98
+        assert [item.key for item in await backend.search_by_tags(["retagged"])] == ["key3"]
+
+        await backend.delete("key3")
+        assert "retagged" not in backend._keys_by_tag
+
+    @pytest.mark.asyncio
+    async def test_search_by_tags_default(self, tmp_path):
+        """Test backends without a tag index fall back to filtering list_all."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"))
+        await backend.store(MemoryItem(key="both", value="v", tags=["a", "b"]))
+        await backend.store(MemoryItem(key="one", value="v", tags=["a"]))
+
+        assert [item.key for item in await backend.search_by_tags(["a", "b"])] == ["both"]
+
+        backend.close()
+
     @pytest.mark.asyncio
     async def test_delete(self):
         """Test deleting items."""
@@ -166,58 +254,242 @@ class TestInMemoryBackend:
         assert await backend.retrieve("expired") is None
         assert await backend.retrieve("valid") is not None
 
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_yields_between_batches(self):
+        """Test long sweeps let other tasks run between batches."""
+        backend = InMemoryBackend(cleanup_batch_size=100)
+        past = datetime.now() - timedelta(hours=1)
+        await backend.store_many(
+            [MemoryItem(key=f"key{i}", value=i, expires_at=past) for i in range(1000)]
+        )
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks = 0
+        assert await backend.cleanup_expired() == 1000
+        task.cancel()
+
+        assert ticks >= 9
+        assert await backend.list_all() == []
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_skips_replaced_items(self):
+        """Test items re-stored with a later expiry survive cleanup."""
+        backend = InMemoryBackend()
+        past = datetime.now() - timedelta(hours=1)
+
+        await backend.store(MemoryItem(key="renewed", value="old", expires_at=past))
+        await backend.store(
+            MemoryItem(key="renewed", value="new", expires_at=datetime.now() + timedelta(hours=1))
+        )
+        await backend.store(MemoryItem(key="deleted", value="value", expires_at=past))
+        await backend.delete("deleted")
+
+        assert await backend.cleanup_expired() == 0
+        assert (await backend.retrieve("renewed")).value == "new"
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_bounded_by_live_items(self):
+        """Test re-storing and deleting items with a TTL does not grow the expiry heap."""
+        backend = InMemoryBackend()
+        expires_at = datetime.now() + timedelta(days=30)
+
+        for i in range(1000):
+            await backend.store(
+                MemoryItem(key="renewed", value=i, expires_at=expires_at + timedelta(seconds=i))
+            )
+            await backend.store(MemoryItem(key=f"tmp{i}", value=i, expires_at=expires_at))
+            await backend.delete(f"tmp{i}")
+
+        assert len(backend._expiry_heap) <= 2 * len(backend._storage) + 1
+        assert (await backend.retrieve("renewed")).value == 999
+
+
+@pytest.fixture(scope="module")
+def shared_sqlite_backend():
+    """One in-memory SQLite backend shared by the module's tests."""
+    backend = SQLiteBackend(database_path=":memory:")
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def sqlite_backend(shared_sqlite_backend):
+    """The shared in-memory backend, emptied after each test."""
+    yield shared_sqlite_backend
+    shared_sqlite_backend.conn.execute("DELETE FROM memories")
+    shared_sqlite_backend.conn.commit()
+
 
 class TestSQLiteBackend:
     """Test SQLiteBackend."""
 
     @pytest.mark.asyncio
-    async def test_store_and_retrieve(self):
+    async def test_store_and_retrieve(self, sqlite_backend):
         """Test storing and retrieving items."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
+        item = MemoryItem(key="test", value="value")
+        await sqlite_backend.store(item)
+
+        retrieved = await sqlite_backend.retrieve("test")
+        assert retrieved is not None
+        assert retrieved.value == "value"
+
+    @pytest.mark.asyncio
+    async def test_search(self, sqlite_backend):
+        """Test searching items."""
+        item1 = MemoryItem(key="key1", value="test value")
+        item2 = MemoryItem(key="key2", value="other value")
 
-        try:
-            backend = SQLiteBackend(database_path=db_path)
+        await sqlite_backend.store(item1)
+        await sqlite_backend.store(item2)
 
-            item = MemoryItem(key="test", value="value")
-            await backend.store(item)
+        results = await sqlite_backend.search("test")
+        assert len(results) == 1
+        assert results[0].key == "key1"
 
-            retrieved = await backend.retrieve("test")
-            assert retrieved is not None
-            assert retrieved.value == "value"
+    @pytest.mark.asyncio
+    async def test_store_many(self, tmp_path):
+        """Test bulk store writes every item with a single commit."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"))
+        items = [MemoryItem(key=f"key{i}", value=f"value {i}") for i in range(5)]
 
-            backend.close()
-        finally:
-            import os
+        statements = []
+        backend.conn.set_trace_callback(statements.append)
+        await backend.store_many(items)
+        backend.conn.set_trace_callback(None)
 
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        assert statements.count("COMMIT") == 1
+        for item in items:
+            retrieved = await backend.retrieve(item.key)
+            assert retrieved.value == item.value
+
+        backend.close()
 
     @pytest.mark.asyncio
-    async def test_search(self):
-        """Test searching items."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
+    async def test_search_full_text_index(self, tmp_path):
+        """Test indexed search matches substrings and tracks updates and deletes."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"))
+
+        await backend.store(MemoryItem(key="key1", value="Testing value"))
+        await backend.store(MemoryItem(key="key2", value="other value"))
+        await backend.store(MemoryItem(key="key3", value='say "hi"'))
 
-        try:
-            backend = SQLiteBackend(database_path=db_path)
+        assert [r.key for r in await backend.search("esti")] == ["key1"]
+        assert {r.key for r in await backend.search("ue")} == {"key1", "key2"}
+        assert [r.key for r in await backend.search('"hi')] == ["key3"]
 
-            item1 = MemoryItem(key="key1", value="test value")
-            item2 = MemoryItem(key="key2", value="other value")
+        await backend.store(MemoryItem(key="key1", value="replaced"))
+        await backend.delete("key2")
 
-            await backend.store(item1)
-            await backend.store(item2)
+        assert await backend.search("esti") == []
+        assert await backend.search("other") == []
+        assert [r.key for r in await backend.search("replaced")] == ["key1"]
 
-            results = await backend.search("test")
-            assert len(results) == 1
-            assert results[0].key == "key1"
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_iter_search(self, tmp_path):
+        """Test streamed search spans fetch batches and can stop early."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"))
+        count = SQLiteBackend.SEARCH_FETCH_SIZE * 2 + 1
+        await backend.store_many(
+            [MemoryItem(key=f"key{i}", value=f"match {i}") for i in range(count)]
+        )
 
-            backend.close()
-        finally:
-            import os
+        assert len([item async for item in backend.iter_search("match")]) == count
+        assert len([item async for item in backend.iter_search("match", limit=3)]) == 3
+        assert len(await backend.search("match")) == 10
 
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        async with aclosing(backend.iter_search("match")) as results:
+            item = await anext(results)
+        assert item.value.startswith("match")
+
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_bloom_filter_skips_guaranteed_misses(self, tmp_path):
+        """Test keys and queries absent from the Bloom filters issue no SQL."""
+        db_path = str(tmp_path / "memory.db")
+        seed = SQLiteBackend(database_path=db_path)
+        await seed.store(MemoryItem(key="existing", value="Stored earlier"))
+        seed.close()
+
+        backend = SQLiteBackend(database_path=db_path, bloom_filter=True)
+        await backend.store_many([MemoryItem(key="key1", value="test value")])
+
+        statements = []
+        backend.conn.set_trace_callback(statements.append)
+        assert await backend.retrieve("never_stored") is None
+        assert await backend.search("zzzqqq") == []
+        assert statements == []
+
+        # Rows stored before and after the filters were built are still found
+        assert (await backend.retrieve("existing")).value == "Stored earlier"
+        assert [r.key for r in await backend.search("EARLIER")] == ["existing"]
+        assert [r.key for r in await backend.search("st val")] == ["key1"]
+
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_items_hidden(self, tmp_path):
+        """Test items that expired moments ago are not returned."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"))
+        await backend.store(
+            MemoryItem(
+                key="expired",
+                value="test value",
+                expires_at=datetime.now() - timedelta(seconds=1),
+            )
+        )
+
+        assert await backend.retrieve("expired") is None
+        assert await backend.search("test") == []
+        assert await backend.list_all() == []
+
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_in_batches(self, tmp_path):
+        """Test expired rows are deleted across several batches."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"), cleanup_batch_size=2)
+        past = datetime.now() - timedelta(hours=1)
+
+        await backend.store_many(
+            [MemoryItem(key=f"expired{i}", value="value", expires_at=past) for i in range(5)]
+        )
+        await backend.store(MemoryItem(key="valid", value="value"))
+
+        assert await backend.cleanup_expired() == 5
+        assert [item.key for item in await backend.list_all()] == ["valid"]
+
+        backend.close()
+
+    def test_default_pragmas(self, tmp_path):
+        """Test file databases default to write-ahead logging."""
+        backend = SQLiteBackend(database_path=str(tmp_path / "memory.db"))
+
+        assert backend.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_pragma_overrides(self, tmp_path):
+        """Test pragma overrides are merged over the defaults."""
+        backend = SQLiteBackend(
+            database_path=str(tmp_path / "memory.db"), pragmas={"journal_mode": "DELETE"}
+        )
+
+        assert backend.conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert backend.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+        backend.close()
 
 
 class TestMemorySystem:
@@ -273,4 +545,41 @@ class TestMemorySystem:
         await system.store("valid", "value", memory_type="task")
 
         deleted = await system.cleanup_expired()
-        assert deleted >= 0  # May be 0 if cleanup happens automatically
+        assert deleted == 1
+
+    @pytest.mark.asyncio
+    async def test_store_sweeps_expired_once_per_interval(self, monkeypatch):
+        """Test store() triggers at most one expiry sweep per cleanup interval."""
+        backend = InMemoryBackend()
+        system = MemorySystem(backend, cleanup_interval=60.0)
+        sweeps = []
+
+        async def cleanup_expired():
+            sweeps.append(1)
+            return 0
+
+        monkeypatch.setattr(backend, "cleanup_expired", cleanup_expired)
+
+        await system.store("first", "value")
+        assert sweeps == []
+
+        system._last_cleanup -= 60.0
+        await system.store("second", "value")
+        await system.store("third", "value")
+        assert sweeps == [1]
+
+    @pytest.mark.asyncio
+    async def test_store_survives_failed_sweep(self, monkeypatch, caplog):
+        """Test a failing opportunistic sweep is logged and the store still succeeds."""
+        backend = InMemoryBackend()
+        system = MemorySystem(backend, cleanup_interval=0.0)
+
+        async def cleanup_expired():
+            raise RuntimeError("backend unavailable")
+
+        monkeypatch.setattr(backend, "cleanup_expired", cleanup_expired)
+
+        await system.store("key", "value")
+
+        assert (await system.retrieve("key")).value == "value"
+        assert "cleanup failed" in caplog.text
@@ -1,5 +1,7 @@
 """Unit tests for observability components."""
 
+from datetime import timedelta
+
 import pytest
 
 from agents_army.observability.logging import StructuredLogger
@@ -122,6 +124,21 @@ class TestMetricsCollector:
         assert collector.metrics["tasks.created"]["count"] == 1
         assert collector.metrics["tasks.completed"]["count"] == 1
 
+    def test_aggregated_metrics(self):
+        """Test counts and totals are folded into the nested metrics view."""
+        collector = MetricsCollector()
+
+        collector.record_llm_call("agent_001", "gpt-4", tokens=500, duration=1.5)
+        collector.record_llm_call("agent_001", "gpt-4", tokens=100, duration=0.5, success=False)
+
+        assert collector.metrics["llm_calls.gpt-4"] == {"count": 2, "total": 600.0}
+        assert collector.metrics["llm_calls.failed"] == {"count": 1, "total": 0.0}
+        assert collector.metrics["llm_calls.unknown"]["count"] == 0
+        assert collector.get_metrics()["raw_metrics"]["llm_calls.success"]["count"] == 1
+
+        collector.reset()
+        assert collector.metrics == {}
+
     def test_record_agent_action(self):
         """Test recording agent action."""
         collector = MetricsCollector()
@@ -184,6 +201,30 @@ class TestMetricsCollector:
         assert agent_metrics["tasks"] == 1
         assert agent_metrics["total_tokens"] == 500
 
+    def test_recorded_events_and_windowed_metrics(self):
+        """Test recorded events read back as dicts and aggregate per time window."""
+        collector = MetricsCollector()
+
+        collector.record_llm_call("agent_001", "gpt-4", tokens=500, duration=1.0)
+        collector.record_llm_call("agent_002", "gpt-4", tokens=100, duration=3.0, success=False)
+        collector.record_task_event("task_001", "completed")
+        collector.record_task_event("task_002", "failed", agent_id="agent_002", duration=4.0)
+
+        assert collector.llm_calls[-1]["success"] is False
+        assert collector.task_events[0]["agent_id"] is None
+        assert collector.task_events[0]["duration"] is None
+        assert collector.task_events[1]["duration"] == 4.0
+
+        for metrics in (collector.get_metrics(), collector.get_metrics(timedelta(hours=1))):
+            assert metrics["llm_calls"]["successful"] == 1
+            assert metrics["llm_calls"]["total_tokens"] == 600
+            assert metrics["llm_calls"]["avg_duration"] == 2.0
+            assert metrics["tasks"]["completion_rate"] == 0.5
+
+        assert collector.get_agent_metrics("agent_002")["total_tokens"] == 100
+        assert collector.get_agent_metrics("agent_002")["tasks"] == 1
+        assert collector.get_agent_metrics("unknown")["llm_calls"] == 0
+
     def test_reset(self):
         """Test resetting metrics."""
         collector = MetricsCollector()
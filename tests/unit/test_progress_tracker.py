@@ -165,6 +165,47 @@ class TestTaskProgressTracker:
 
         assert tracker.get_iteration_count("test_task") == 5
 
+    def test_record_iterations_bulk(self, tracker):
+        """Test recording several iterations at once."""
+        tracker.record_iterations_bulk(
+            "test_task",
+            [
+                {
+                    "iteration": i,
+                    "file_changes": [],
+                    "test_results": {"passed": False},
+                    "agent_output": "",
+                    "errors": ["Same error"],
+                }
+                for i in range(1, 4)
+            ],
+        )
+
+        assert tracker.get_iteration_count("test_task") == 3
+        assert tracker.has_progress("test_task", last_n=3) is False
+        assert tracker.is_stuck("test_task") is True
+
+    def test_checks_use_cached_summaries(self, tracker):
+        """Test progress checks read the in-memory cache, loaded from disk once."""
+        tracker.record_iterations_bulk(
+            "test_task",
+            [{"iteration": i, "errors": ["Same error"]} for i in range(1, 4)],
+        )
+        progress_file = tracker._get_progress_file("test_task")
+        saved = progress_file.read_text()
+
+        # A new tracker picks the iterations up from the progress file
+        reloaded = TaskProgressTracker(tracker.task_storage)
+        assert reloaded.get_iteration_count("test_task") == 3
+
+        progress_file.unlink()
+        assert tracker.is_stuck("test_task") is True
+        assert reloaded.get_error_patterns("test_task", last_n=1) == ["Same error"]
+
+        progress_file.write_text(saved)
+        tracker.clear_progress("test_task")
+        assert tracker.get_iteration_count("test_task") == 0
+
     def test_clear_progress(self, tracker):
         """Test clearing progress."""
         tracker.record_iteration(
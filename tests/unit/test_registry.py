@@ -1,5 +1,7 @@
 """Unit tests for AgentRegistry."""
 
+import functools
+
 import pytest
 from agents_army.core.agent import Agent, AgentConfig
 from agents_army.core.registry import AgentRegistry
@@ -13,169 +15,120 @@ class SimpleTestAgent(Agent):
         return None
 
 
-class TestAgentRegistry:
-    """Test AgentRegistry class."""
+@pytest.fixture
+def registry():
+    """Create an empty AgentRegistry."""
+    return AgentRegistry()
 
-    def test_register_agent(self):
-        """Test registering an agent."""
-        registry = AgentRegistry()
-        config = AgentConfig(
-            name="Test Agent",
-            role=AgentRole.RESEARCHER,
-            goal="Test goal",
-            backstory="Test backstory",
-        )
-        agent = SimpleTestAgent(config)
 
-        registry.register(agent)
+@pytest.fixture(scope="module")
+def config_factory():
+    """AgentConfig factory memoized on (name, role); agents never mutate their config."""
 
-        assert registry.has_agent(AgentRole.RESEARCHER)
-        assert registry.count_agents() == 1
-        assert registry.get_agent(AgentRole.RESEARCHER) == agent
-
-    def test_register_multiple_agents_same_role(self):
-        """Test registering multiple agents with same role."""
-        registry = AgentRegistry()
-
-        agent1 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 1",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 1",
-                backstory="Backstory 1",
-            )
-        )
-        agent2 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 2",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 2",
-                backstory="Backstory 2",
-            )
-        )
-
-        registry.register(agent1)
-        registry.register(agent2)
-
-        agents = registry.get_agents(AgentRole.RESEARCHER)
-        assert len(agents) == 2
-        assert agent1 in agents
-        assert agent2 in agents
-
-    def test_unregister_agent(self):
-        """Test unregistering an agent."""
-        registry = AgentRegistry()
-        config = AgentConfig(
-            name="Test Agent",
-            role=AgentRole.RESEARCHER,
-            goal="Test goal",
-            backstory="Test backstory",
-        )
-        agent = SimpleTestAgent(config)
+    @functools.cache
+    def _config(name, role):
+        return AgentConfig(name=name, role=role, goal="Test goal", backstory="Test backstory")
 
-        registry.register(agent)
-        assert registry.has_agent(AgentRole.RESEARCHER)
+    return _config
 
-        registry.unregister(agent)
-        assert not registry.has_agent(AgentRole.RESEARCHER)
-        assert registry.count_agents() == 0
 
-    def test_get_agent_by_id(self):
-        """Test getting agent by ID."""
-        registry = AgentRegistry()
-        config = AgentConfig(
-            name="Test Agent",
-            role=AgentRole.RESEARCHER,
-            goal="Test goal",
-            backstory="Test backstory",
-        )
-        agent = SimpleTestAgent(config)
+@pytest.fixture
+def make_agent(config_factory):
+    """Factory for test agents with the given role."""
 
-        registry.register(agent)
+    def _make_agent(role, name="Test Agent"):
+        return SimpleTestAgent(config_factory(name, role))
 
-        retrieved = registry.get_agent_by_id(agent.id)
-        assert retrieved == agent
-
-    def test_get_all_agents(self):
-        """Test getting all agents."""
-        registry = AgentRegistry()
-
-        agent1 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 1",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 1",
-                backstory="Backstory 1",
-            )
-        )
-        agent2 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 2",
-                role=AgentRole.WRITER,
-                goal="Goal 2",
-                backstory="Backstory 2",
-            )
-        )
-
-        registry.register(agent1)
-        registry.register(agent2)
-
-        all_agents = registry.get_all_agents()
-        assert len(all_agents) == 2
-        assert agent1 in all_agents
-        assert agent2 in all_agents
-
-    def test_get_registered_roles(self):
-        """Test getting registered roles."""
-        registry = AgentRegistry()
-
-        agent1 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 1",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 1",
-                backstory="Backstory 1",
-            )
-        )
-        agent2 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 2",
-                role=AgentRole.WRITER,
-                goal="Goal 2",
-                backstory="Backstory 2",
-            )
-        )
-
-        registry.register(agent1)
-        registry.register(agent2)
-
-        roles = registry.get_registered_roles()
-        assert AgentRole.RESEARCHER in roles
-        assert AgentRole.WRITER in roles
-
-    def test_clear_registry(self):
-        """Test clearing the registry."""
-        registry = AgentRegistry()
-
-        agent = SimpleTestAgent(
-            AgentConfig(
-                name="Test Agent",
-                role=AgentRole.RESEARCHER,
-                goal="Test goal",
-                backstory="Test backstory",
-            )
-        )
+    return _make_agent
 
-        registry.register(agent)
-        assert registry.count_agents() == 1
+
+@pytest.fixture
+def two_agent_registry(registry, make_agent):
+    """Registry holding a researcher and a writer."""
+    registry.register(make_agent(AgentRole.RESEARCHER, name="Agent 1"))
+    registry.register(make_agent(AgentRole.WRITER, name="Agent 2"))
+    return registry
+
+
+class TestAgentRegistry:
+    """Test AgentRegistry class."""
+
+    @pytest.mark.parametrize(
+        "roles",
+        [
+            pytest.param([AgentRole.RESEARCHER], id="single"),
+            pytest.param([AgentRole.RESEARCHER, AgentRole.RESEARCHER], id="same-role"),
+        ],
+    )
+    def test_register_and_clear(self, registry, make_agent, roles):
+        """Test registering agents, looking them up, and clearing the registry."""
+        agents = [make_agent(role, name=f"Agent {i}") for i, role in enumerate(roles)]
+        for agent in agents:
+            registry.register(agent)
+
+        ids = {agent.id for agent in agents}
+        assert registry.count_agents() == len(agents)
+        assert set(registry.get_registered_roles()) == set(roles)
+        assert {agent.id for agent in registry.get_all_agents()} == ids
+        for agent in agents:
+            assert registry.has_agent(agent.role)
+            assert agent.id in {a.id for a in registry.get_agents(agent.role)}
+            assert registry.get_agent_by_id(agent.id) is agent
+        assert registry.get_agent(agents[0].role) == agents[0]
+        assert len(registry.get_agents(AgentRole.RESEARCHER)) == roles.count(AgentRole.RESEARCHER)
 
         registry.clear()
         assert registry.count_agents() == 0
-        assert not registry.has_agent(AgentRole.RESEARCHER)
+        assert not any(registry.has_agent(role) for role in roles)
+
+    @pytest.mark.parametrize(
+        "projection, expected",
+        [
+            pytest.param(
+                lambda r: [a.name for a in r.get_all_agents()], ["Agent 1", "Agent 2"], id="all"
+            ),
+            pytest.param(
+                lambda r: r.get_registered_roles(),
+                [AgentRole.RESEARCHER, AgentRole.WRITER],
+                id="roles",
+            ),
+            pytest.param(
+                lambda r: [a.name for a in r.get_agents(AgentRole.RESEARCHER)],
+                ["Agent 1"],
+                id="by-role",
+            ),
+        ],
+    )
+    def test_mixed_role_projections(self, two_agent_registry, projection, expected):
+        """Test each registry view over agents with different roles."""
+        assert sorted(projection(two_agent_registry)) == sorted(expected)
+
+    @pytest.mark.parametrize("role", list(AgentRole), ids=lambda role: role.name)
+    def test_unregister_agent(self, registry, make_agent, role):
+        """Test unregistering an agent of every role."""
+        agent = make_agent(role)
 
-    def test_register_none(self):
-        """Test registering None raises error."""
-        registry = AgentRegistry()
+        registry.register(agent)
+        assert registry.has_agent(role)
+
+        registry.unregister(agent)
+        assert not registry.has_agent(role)
+        assert registry.count_agents() == 0
 
+    def test_register_none(self, registry):
+        """Test registering None raises error."""
         with pytest.raises(ValueError, match="Agent cannot be None"):
             registry.register(None)
+
+    @pytest.mark.performance
+    def test_bench_get_agent_by_id(self, request, registry, make_agent):
+        """Benchmark ID lookup in a registry of 10,000 agents."""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        agents = [make_agent(AgentRole.RESEARCHER, name=f"a{i}") for i in range(10_000)]
+        for agent in agents:
+            registry.register(agent)
+        target = agents[5000]
+
+        assert benchmark(registry.get_agent_by_id, target.id) is target
@@ -9,6 +9,14 @@ from agents_army.security.rate_limiter import RateLimiter
 from agents_army.protocol.types import AgentRole
 
 
+@pytest.fixture(scope="class")
+def shared_auth():
+    """AuthenticationManager with role permissions set, shared by read-only tests."""
+    auth = AuthenticationManager()
+    auth.set_role_permissions(AgentRole.BACKEND_ARCHITECT, ["design_architecture", "design_api"])
+    return auth
+
+
 class TestAuthenticationManager:
     """Test AuthenticationManager functionality."""
 
@@ -34,20 +42,13 @@ class TestAuthenticationManager:
         # Invalid token
         assert auth.authenticate("invalid_token") is None
 
-    def test_authorize(self):
+    def test_authorize(self, shared_auth):
         """Test authorization."""
-        auth = AuthenticationManager()
-
         # DT has full access
-        assert auth.authorize(AgentRole.DT, "any_action") is True
+        assert shared_auth.authorize(AgentRole.DT, "any_action") is True
 
-        # Set permissions for other role
-        auth.set_role_permissions(
-            AgentRole.BACKEND_ARCHITECT, ["design_architecture", "design_api"]
-        )
-
-        assert auth.authorize(AgentRole.BACKEND_ARCHITECT, "design_architecture") is True
-        assert auth.authorize(AgentRole.BACKEND_ARCHITECT, "unauthorized_action") is False
+        assert shared_auth.authorize(AgentRole.BACKEND_ARCHITECT, "design_architecture") is True
+        assert shared_auth.authorize(AgentRole.BACKEND_ARCHITECT, "unauthorized_action") is False
 
     def test_revoke_token(self):
         """Test revoking token."""
@@ -61,16 +62,74 @@ class TestAuthenticationManager:
         assert auth.revoke_token("invalid_token") is False
 
 
+def drain(limiter, identifier, requests):
+    """Make several requests and return whether each was allowed."""
+    return [limiter.is_allowed(identifier) for _ in range(requests)]
+
+
+# Consume -> exceed -> reset -> consume, as (method, identifier, expected result)
+_LIFECYCLE = [
+    ("is_allowed", "agent_001", True),
+    ("is_allowed", "agent_001", True),
+    ("is_allowed", "agent_001", False),
+    ("get_remaining", "agent_001", 0),
+    ("reset", "agent_001", None),
+    ("is_allowed", "agent_001", True),
+    ("get_remaining", "agent_001", 1),
+]
+
+
+def run_ops(limiter, ops):
+    """Apply each operation in order, checking results where one is expected."""
+    for step, (method, identifier, expected) in enumerate(ops):
+        result = getattr(limiter, method)(identifier)
+        if expected is not None:
+            assert result == expected, f"step {step}: {method}({identifier!r})"
+
+
 class TestRateLimiter:
     """Test RateLimiter functionality."""
 
-    def test_is_allowed(self):
+    @pytest.mark.parametrize(
+        "limit, requests, expected",
+        [
+            pytest.param(2, 3, [True, True, False], id="exceeds-limit"),
+            pytest.param(5, 1, [True], id="under-limit"),
+            pytest.param(1, 2, [True, False], id="single-slot"),
+        ],
+    )
+    def test_is_allowed(self, limit, requests, expected):
         """Test rate limiting."""
-        limiter = RateLimiter(default_limit=2, default_window=timedelta(seconds=60))
+        limiter = RateLimiter(
+            default_limit=limit, default_window=timedelta(seconds=60), clock=lambda: 0.0
+        )
+
+        assert drain(limiter, "agent_001", requests) == expected
+
+    @pytest.mark.parametrize(
+        "advance, expected_allowed",
+        [
+            pytest.param(59.9, False, id="inside-window"),
+            pytest.param(60.0, True, id="at-boundary"),
+            pytest.param(89.0, True, id="past-window"),
+        ],
+    )
+    def test_sliding_window_boundary(self, advance, expected_allowed):
+        """Test requests leave the window exactly one window length after they were made."""
+        now = [0.0]
+        limiter = RateLimiter(
+            default_limit=2, default_window=timedelta(seconds=60), clock=lambda: now[0]
+        )
 
         assert limiter.is_allowed("agent_001") is True
+        now[0] = 30.0
         assert limiter.is_allowed("agent_001") is True
-        assert limiter.is_allowed("agent_001") is False  # Exceeded limit
+        assert limiter.is_allowed("agent_001") is False
+
+        now[0] = advance
+        assert limiter.is_allowed("agent_001") is expected_allowed
+        # The request made at 30s is still inside every window tested
+        assert limiter.get_remaining("agent_001") == 0
 
     def test_get_remaining(self):
         """Test getting remaining requests."""
@@ -87,19 +146,9 @@ class TestRateLimiter:
 
         limiter.set_limit("agent_001", limit=2)
 
-        assert limiter.is_allowed("agent_001") is True
-        assert limiter.is_allowed("agent_001") is True
-        assert limiter.is_allowed("agent_001") is False
+        assert drain(limiter, "agent_001", 3) == [True, True, False]
+        assert drain(limiter, "agent_002", 3) == [True, True, True]
 
     def test_reset(self):
-        """Test resetting rate limit."""
-        limiter = RateLimiter(default_limit=2)
-
-        limiter.is_allowed("agent_001")
-        limiter.is_allowed("agent_001")
-
-        assert limiter.is_allowed("agent_001") is False
-
-        limiter.reset("agent_001")
-
-        assert limiter.is_allowed("agent_001") is True
+        """Test the consume, exceed, reset, consume lifecycle on one limiter."""
+        run_ops(RateLimiter(default_limit=2, clock=lambda: 0.0), _LIFECYCLE)
@@ -1,90 +1,116 @@
 """Unit tests for MessageSerializer."""
 
+import json
+
 import pytest
 
 from agents_army.protocol.message import AgentMessage
 from agents_army.protocol.serializer import MessageSerializer
 from agents_army.protocol.types import AgentRole, MessageType
 
+# Canonical wire-format message shared by the deserialization tests
+_CANONICAL_DICT = {
+    "id": "msg_123",
+    "timestamp": "2024-01-01T12:00:00Z",
+    "from": "dt",
+    "to": "researcher",
+    "type": "task_request",
+    "payload": {"task_id": "task_001"},
+}
+_CANONICAL_JSON = json.dumps(_CANONICAL_DICT, separators=(",", ":"))
+
+
+@pytest.fixture(scope="module")
+def message_proto():
+    """Validated task request, built once and copied by each test."""
+    return AgentMessage(
+        from_role=AgentRole.DT,
+        to_role=AgentRole.RESEARCHER,
+        type=MessageType.TASK_REQUEST,
+        payload={"task_id": "task_001"},
+    )
+
 
 class TestMessageSerializer:
     """Test MessageSerializer class."""
 
-    def test_serialize_json(self):
+    def test_serialize_json(self, message_proto):
         """Test JSON serialization."""
-        message = AgentMessage(
-            from_role=AgentRole.DT,
-            to_role=AgentRole.RESEARCHER,
-            type=MessageType.TASK_REQUEST,
-            payload={"task_id": "task_001"},
-        )
+        message = message_proto.model_copy()
 
         json_str = MessageSerializer.serialize(message, format="json")
         assert isinstance(json_str, str)
         assert "task_001" in json_str
         assert "task_request" in json_str
 
-    def test_deserialize_json(self):
-        """Test JSON deserialization."""
-        json_str = '{"id":"msg_123","timestamp":"2024-01-01T12:00:00Z","from":"dt","to":"researcher","type":"task_request","payload":{"task_id":"task_001"}}'
-
-        message = MessageSerializer.deserialize(json_str, format="json")
+    @pytest.mark.parametrize(
+        "data, deserialize",
+        [
+            pytest.param(_CANONICAL_JSON, MessageSerializer.deserialize, id="json"),
+            pytest.param(_CANONICAL_DICT, MessageSerializer.deserialize_dict, id="dict"),
+        ],
+    )
+    def test_deserialize(self, data, deserialize):
+        """Test JSON and dictionary deserialization."""
+        message = deserialize(data)
 
         assert message.from_role == AgentRole.DT
         assert message.to_role == AgentRole.RESEARCHER
         assert message.type == MessageType.TASK_REQUEST
         assert message.payload["task_id"] == "task_001"
 
-    def test_serialize_dict(self):
+    def test_serialize_dict(self, message_proto):
         """Test dictionary serialization."""
-        message = AgentMessage(
-            from_role=AgentRole.DT,
-            to_role=AgentRole.RESEARCHER,
-            type=MessageType.TASK_REQUEST,
-            payload={"task_id": "task_001"},
-        )
+        message = message_proto.model_copy()
 
         message_dict = MessageSerializer.serialize_dict(message)
         assert isinstance(message_dict, dict)
         assert message_dict["from"] == "dt"
         assert message_dict["to"] == "researcher"
 
-    def test_deserialize_dict(self):
-        """Test dictionary deserialization."""
-        message_dict = {
-            "id": "msg_123",
-            "timestamp": "2024-01-01T12:00:00Z",
-            "from": "dt",
-            "to": "researcher",
-            "type": "task_request",
-            "payload": {"task_id": "task_001"},
-        }
-
-        message = MessageSerializer.deserialize_dict(message_dict)
-
-        assert message.from_role == AgentRole.DT
-        assert message.to_role == AgentRole.RESEARCHER
-        assert message.type == MessageType.TASK_REQUEST
-
     def test_validate_json(self):
         """Test JSON validation."""
-        valid_json = '{"id":"msg_123","timestamp":"2024-01-01T12:00:00Z","from":"dt","to":"researcher","type":"task_request","payload":{"task_id":"task_001"}}'
         invalid_json = '{"invalid": "json"}'
 
-        assert MessageSerializer.validate_json(valid_json) is True
+        assert MessageSerializer.validate_json(_CANONICAL_JSON) is True
         assert MessageSerializer.validate_json(invalid_json) is False
 
-    def test_unsupported_format(self):
+    @pytest.mark.parametrize(
+        "json_str",
+        [
+            pytest.param(_CANONICAL_JSON, id="valid"),
+            pytest.param('{"invalid": "json"}', id="invalid-message"),
+            pytest.param("{not json", id="malformed"),
+        ],
+    )
+    def test_validate_json_orjson_parity(self, json_str):
+        """Test the orjson backend agrees with the default backend."""
+        pytest.importorskip("orjson")
+
+        assert MessageSerializer.validate_json(
+            json_str, backend="orjson"
+        ) == MessageSerializer.validate_json(json_str)
+
+    def test_validate_json_unsupported_backend(self):
+        """Test error on unsupported JSON backend."""
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            MessageSerializer.validate_json(_CANONICAL_JSON, backend="ujson")
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(
+                lambda message: MessageSerializer.serialize(message, format="xml"), id="serialize"
+            ),
+            pytest.param(
+                lambda message: MessageSerializer.deserialize("data", format="xml"),
+                id="deserialize",
+            ),
+        ],
+    )
+    def test_unsupported_format(self, message_proto, call):
         """Test error on unsupported format."""
-        message = AgentMessage(
-            from_role=AgentRole.DT,
-            to_role=AgentRole.RESEARCHER,
-            type=MessageType.TASK_REQUEST,
-            payload={"task_id": "task_001"},
-        )
-
-        with pytest.raises(ValueError, match="Unsupported format"):
-            MessageSerializer.serialize(message, format="xml")
+        message = message_proto.model_copy()
 
         with pytest.raises(ValueError, match="Unsupported format"):
-            MessageSerializer.deserialize("data", format="xml")
+            call(message)
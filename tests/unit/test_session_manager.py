@@ -1,10 +1,10 @@
 """Tests for TaskSessionManager."""
 
-import tempfile
 from datetime import datetime, timedelta
 
 import pytest
 
+from agents_army.core import session_manager as session_manager_module
 from agents_army.core.session_manager import (
     SessionResetReason,
     TaskSession,
@@ -13,113 +13,134 @@ from agents_army.core.session_manager import (
 from agents_army.core.task_storage import TaskStorage
 from agents_army.protocol.types import AgentRole
 
+_FROZEN_NOW = datetime(2024, 6, 1, 12, 0)
 
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to _FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the session manager's clock so session ages are exact."""
+    monkeypatch.setattr(session_manager_module, "datetime", _FrozenDatetime)
+    return _FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def storage_root(tmp_path_factory):
+    """Storage root shared by every session manager test."""
+    return tmp_path_factory.mktemp("sessions_root")
+
+
+@pytest.mark.slow
 class TestTaskSessionManager:
     """Tests for TaskSessionManager class."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for tests."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    def session_manager(self, storage_root):
+        """Create TaskSessionManager instance over the shared storage root."""
+        storage = TaskStorage(str(storage_root))
+        return TaskSessionManager(storage, expiration_hours=24)
 
     @pytest.fixture
-    def session_manager(self, temp_dir):
-        """Create TaskSessionManager instance."""
-        storage = TaskStorage(temp_dir)
-        return TaskSessionManager(storage, expiration_hours=24)
+    def task_id(self, request):
+        """Task ID unique to the running test, so tests sharing storage never collide."""
+        return request.node.name
 
-    def test_get_or_create_session_new(self, session_manager):
+    def test_get_or_create_session_new(self, session_manager, task_id):
         """Test creating new session."""
-        session = session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
+        session = session_manager.get_or_create_session(task_id, AgentRole.BACKEND_ARCHITECT)
 
-        assert session.task_id == "test_task"
+        assert session.task_id == task_id
         assert session.agent_role == AgentRole.BACKEND_ARCHITECT
         assert len(session.iterations) == 0
 
-    def test_get_or_create_session_existing(self, session_manager):
+    def test_get_or_create_session_existing(self, session_manager, task_id):
         """Test getting existing session."""
-        session1 = session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
+        session1 = session_manager.get_or_create_session(task_id, AgentRole.BACKEND_ARCHITECT)
 
-        session2 = session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
+        session2 = session_manager.get_or_create_session(task_id, AgentRole.BACKEND_ARCHITECT)
 
         assert session1.task_id == session2.task_id
         assert session1.agent_role == session2.agent_role
 
-    def test_get_or_create_session_agent_changed(self, session_manager):
+    def test_get_or_create_session_agent_changed(self, session_manager, task_id):
         """Test session reset when agent changes."""
-        session1 = session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
+        session1 = session_manager.get_or_create_session(task_id, AgentRole.BACKEND_ARCHITECT)
 
-        session2 = session_manager.get_or_create_session("test_task", AgentRole.FRONTEND_DEVELOPER)
+        session2 = session_manager.get_or_create_session(task_id, AgentRole.FRONTEND_DEVELOPER)
 
         # Should create new session when agent changes
         assert session2.agent_role == AgentRole.FRONTEND_DEVELOPER
 
-    def test_should_reset_session_circuit_breaker(self, session_manager):
-        """Test should_reset_session for circuit breaker."""
-        session = session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
-
-        should_reset = session_manager.should_reset_session(
-            session, SessionResetReason.CIRCUIT_BREAKER_OPEN
-        )
-
-        assert should_reset is True
-
-    def test_should_reset_session_expired(self, session_manager):
-        """Test should_reset_session for expired session."""
+    @pytest.mark.parametrize(
+        "reason, age_hours, expected",
+        [
+            pytest.param(SessionResetReason.CIRCUIT_BREAKER_OPEN, 0, True, id="circuit-breaker"),
+            pytest.param(SessionResetReason.SESSION_EXPIRED, 25, True, id="expired"),
+            pytest.param(SessionResetReason.SESSION_EXPIRED, 24, False, id="at-expiry"),
+            pytest.param(SessionResetReason.SESSION_EXPIRED, 1, False, id="not-expired"),
+        ],
+    )
+    def test_should_reset_session(self, session_manager, frozen_now, reason, age_hours, expected):
+        """Test should_reset_session for each reset reason and session age."""
+        last_active = frozen_now - timedelta(hours=age_hours)
         session = TaskSession(
             task_id="test_task",
             agent_role=AgentRole.BACKEND_ARCHITECT,
-            created_at=datetime.now() - timedelta(hours=25),
-            last_accessed=datetime.now() - timedelta(hours=25),
-        )
-
-        should_reset = session_manager.should_reset_session(
-            session, SessionResetReason.SESSION_EXPIRED
+            created_at=last_active,
+            last_accessed=last_active,
         )
 
-        assert should_reset is True
-
-    def test_store_context(self, session_manager):
-        """Test storing context."""
-        session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
-
-        context = {"key1": "value1", "key2": "value2"}
-        session_manager.store_context("test_task", context)
-
-        retrieved = session_manager.get_context("test_task")
-        assert retrieved["key1"] == "value1"
-        assert retrieved["key2"] == "value2"
+        assert session_manager.should_reset_session(session, reason) is expected
 
     def test_get_context_empty(self, session_manager):
         """Test getting context for non-existent session."""
         context = session_manager.get_context("non_existent")
         assert context == {}
 
-    def test_add_iteration(self, session_manager):
-        """Test adding iteration to session."""
-        session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
-
-        session_manager.add_iteration(
-            "test_task",
-            iteration=1,
-            agent_output="Output",
-            file_changes=["file1.py"],
-            errors=[],
-        )
-
-        # Session should have iteration
-        session = session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
-        assert len(session.iterations) == 1
-
-    def test_reset_session(self, session_manager):
-        """Test resetting session."""
-        session_manager.get_or_create_session("test_task", AgentRole.BACKEND_ARCHITECT)
-
-        session_manager.store_context("test_task", {"key": "value"})
-        assert session_manager.get_context("test_task") != {}
-
-        session_manager.reset_session("test_task", "test_reason")
-
-        # Context should be cleared
-        assert session_manager.get_context("test_task") == {}
+    class TestSessionLifecycle:
+        """Context and iteration tests against an existing session."""
+
+        @pytest.fixture(autouse=True)
+        def _seed(self, session_manager, task_id):
+            """Create the session every test in this class works on."""
+            session_manager.get_or_create_session(task_id, AgentRole.BACKEND_ARCHITECT)
+
+        def test_store_context(self, session_manager, task_id):
+            """Test storing context."""
+            context = {"key1": "value1", "key2": "value2"}
+            session_manager.store_context(task_id, context)
+
+            retrieved = session_manager.get_context(task_id)
+            assert retrieved["key1"] == "value1"
+            assert retrieved["key2"] == "value2"
+
+        def test_add_iteration(self, session_manager, task_id):
+            """Test adding iteration to session."""
+            session_manager.add_iteration(
+                task_id,
+                iteration=1,
+                agent_output="Output",
+                file_changes=["file1.py"],
+                errors=[],
+            )
+
+            # Session should have iteration
+            session = session_manager.get_or_create_session(task_id, AgentRole.BACKEND_ARCHITECT)
+            assert len(session.iterations) == 1
+
+        def test_reset_session(self, session_manager, task_id):
+            """Test resetting session."""
+            session_manager.store_context(task_id, {"key": "value"})
+            assert session_manager.get_context(task_id) != {}
+
+            session_manager.reset_session(task_id, "test_reason")
+
+            # Context should be cleared
+            assert session_manager.get_context(task_id) == {}
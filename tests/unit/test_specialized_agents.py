@@ -31,22 +31,80 @@ class MockLLMProvider(LLMProvider):
         return "Mock response"
 
 
+@pytest.fixture(scope="module")
+def llm():
+    """Mock LLM provider shared by every agent in the module."""
+    return MockLLMProvider()
+
+
+# (agent class, name, role, department, allow_delegation) for every specialized agent
+AGENT_SPECS = [
+    (Researcher, "Researcher", AgentRole.RESEARCHER, "Research", False),
+    (BackendArchitect, "Backend Architect", AgentRole.BACKEND_ARCHITECT, "Engineering", False),
+    (
+        MarketingStrategist,
+        "Marketing Strategist",
+        AgentRole.MARKETING_STRATEGIST,
+        "Marketing",
+        True,
+    ),
+    (QATester, "QA Tester", AgentRole.QA_TESTER, "Testing", False),
+    (DevOpsAutomator, "DevOps Automator", AgentRole.DEVOPS_AUTOMATOR, "Engineering", False),
+    (FrontendDeveloper, "Frontend Developer", AgentRole.FRONTEND_DEVELOPER, "Engineering", False),
+    (ProductStrategist, "Product Strategist", AgentRole.PRODUCT_STRATEGIST, "Product", True),
+    (FeedbackSynthesizer, "Feedback Synthesizer", AgentRole.FEEDBACK_SYNTHESIZER, "Product", False),
+    (UXResearcher, "UX Researcher", AgentRole.UX_RESEARCHER, "Design", False),
+    (UIDesigner, "UI Designer", AgentRole.UI_DESIGNER, "Design", False),
+    (BrandGuardian, "Brand Guardian", AgentRole.BRAND_GUARDIAN, "Marketing", False),
+    (ContentCreator, "Content Creator", AgentRole.CONTENT_CREATOR, "Marketing", True),
+    (
+        StorytellingSpecialist,
+        "Storytelling Specialist",
+        AgentRole.STORYTELLING_SPECIALIST,
+        "Marketing",
+        True,
+    ),
+    (PitchSpecialist, "Pitch Specialist", AgentRole.PITCH_SPECIALIST, "Marketing", True),
+    (GrowthHacker, "Growth Hacker", AgentRole.GROWTH_HACKER, "Marketing", False),
+    (
+        OperationsMaintainer,
+        "Operations Maintainer",
+        AgentRole.OPERATIONS_MAINTAINER,
+        "Operations",
+        False,
+    ),
+]
+
+
+class TestAgentMetadata:
+    """Test the configuration each specialized agent is created with."""
+
+    @pytest.mark.parametrize(
+        "agent_class, name, role, department, allow_delegation",
+        AGENT_SPECS,
+        ids=[spec[0].__name__ for spec in AGENT_SPECS],
+    )
+    def test_agent_metadata(self, llm, agent_class, name, role, department, allow_delegation):
+        """Test creating an agent sets its name, role, department and delegation."""
+        agent = agent_class(llm_provider=llm)
+
+        assert agent.name == name
+        assert agent.role == role
+        assert agent.config.department == department
+        assert agent.config.allow_delegation is allow_delegation
+
+
 class TestResearcher:
     """Test Researcher agent."""
 
-    def test_create_researcher(self):
-        """Test creating Researcher agent."""
-        researcher = Researcher(llm_provider=MockLLMProvider())
-
-        assert researcher.name == "Researcher"
-        assert researcher.role == AgentRole.RESEARCHER
-        assert researcher.config.department == "Research"
+    @pytest.fixture
+    def researcher(self, llm):
+        """Create a Researcher agent."""
+        return Researcher(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_research(self):
+    async def test_research(self, researcher):
         """Test research functionality."""
-        researcher = Researcher(llm_provider=MockLLMProvider())
-
         result = await researcher.research("AI agents", "Context here")
 
         assert "query" in result
@@ -54,20 +112,16 @@ class TestResearcher:
         assert "result" in result
 
     @pytest.mark.asyncio
-    async def test_analyze_document(self):
+    async def test_analyze_document(self, researcher):
         """Test document analysis."""
-        researcher = Researcher(llm_provider=MockLLMProvider())
-
         result = await researcher.analyze_document("Test document content")
 
         assert "analysis" in result
         assert "document_length" in result
 
     @pytest.mark.asyncio
-    async def test_handle_research_message(self):
+    async def test_handle_research_message(self, researcher):
         """Test handling research message."""
-        researcher = Researcher(llm_provider=MockLLMProvider())
-
         message = AgentMessage(
             from_role=AgentRole.DT,
             to_role=AgentRole.RESEARCHER,
@@ -85,19 +139,14 @@ class TestResearcher:
 class TestBackendArchitect:
     """Test BackendArchitect agent."""
 
-    def test_create_backend_architect(self):
-        """Test creating BackendArchitect agent."""
-        architect = BackendArchitect(llm_provider=MockLLMProvider())
-
-        assert architect.name == "Backend Architect"
-        assert architect.role == AgentRole.BACKEND_ARCHITECT
-        assert architect.config.department == "Engineering"
+    @pytest.fixture
+    def architect(self, llm):
+        """Create a BackendArchitect agent."""
+        return BackendArchitect(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_design_architecture(self):
+    async def test_design_architecture(self, architect):
         """Test architecture design."""
-        architect = BackendArchitect(llm_provider=MockLLMProvider())
-
         requirements = {"type": "web_app", "users": 10000}
         result = await architect.design_architecture(requirements)
 
@@ -105,10 +154,8 @@ class TestBackendArchitect:
         assert "requirements" in result
 
     @pytest.mark.asyncio
-    async def test_handle_architecture_message(self):
+    async def test_handle_architecture_message(self, architect):
         """Test handling architecture design message."""
-        architect = BackendArchitect(llm_provider=MockLLMProvider())
-
         message = AgentMessage(
             from_role=AgentRole.DT,
             to_role=AgentRole.BACKEND_ARCHITECT,
@@ -125,20 +172,14 @@ class TestBackendArchitect:
 class TestMarketingStrategist:
     """Test MarketingStrategist agent."""
 
-    def test_create_marketing_strategist(self):
-        """Test creating MarketingStrategist agent."""
-        strategist = MarketingStrategist(llm_provider=MockLLMProvider())
-
-        assert strategist.name == "Marketing Strategist"
-        assert strategist.role == AgentRole.MARKETING_STRATEGIST
-        assert strategist.config.department == "Marketing"
-        assert strategist.config.allow_delegation is True
+    @pytest.fixture
+    def strategist(self, llm):
+        """Create a MarketingStrategist agent."""
+        return MarketingStrategist(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_develop_strategy(self):
+    async def test_develop_strategy(self, strategist):
         """Test strategy development."""
-        strategist = MarketingStrategist(llm_provider=MockLLMProvider())
-
         context = {"product": "App", "target": "Millennials"}
         result = await strategist.develop_strategy(context)
 
@@ -146,10 +187,8 @@ class TestMarketingStrategist:
         assert "context" in result
 
     @pytest.mark.asyncio
-    async def test_handle_strategy_message(self):
+    async def test_handle_strategy_message(self, strategist):
         """Test handling strategy message."""
-        strategist = MarketingStrategist(llm_provider=MockLLMProvider())
-
         message = AgentMessage(
             from_role=AgentRole.DT,
             to_role=AgentRole.MARKETING_STRATEGIST,
@@ -166,19 +205,14 @@ class TestMarketingStrategist:
 class TestQATester:
     """Test QATester agent."""
 
-    def test_create_qa_tester(self):
-        """Test creating QATester agent."""
-        tester = QATester(llm_provider=MockLLMProvider())
-
-        assert tester.name == "QA Tester"
-        assert tester.role == AgentRole.QA_TESTER
-        assert tester.config.department == "Testing"
+    @pytest.fixture
+    def tester(self, llm):
+        """Create a QATester agent."""
+        return QATester(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_create_test_plan(self):
+    async def test_create_test_plan(self, tester):
         """Test test plan creation."""
-        tester = QATester(llm_provider=MockLLMProvider())
-
         feature_spec = {"name": "Login", "requirements": ["Auth", "Validation"]}
         result = await tester.create_test_plan(feature_spec)
 
@@ -186,20 +220,16 @@ class TestQATester:
         assert "feature" in result
 
     @pytest.mark.asyncio
-    async def test_validate_output(self):
+    async def test_validate_output(self, tester):
         """Test output validation."""
-        tester = QATester(llm_provider=MockLLMProvider())
-
         result = await tester.validate_output("actual", "expected")
 
         assert "passed" in result
         assert "validation" in result
 
     @pytest.mark.asyncio
-    async def test_handle_validation_message(self):
+    async def test_handle_validation_message(self, tester):
         """Test handling validation message."""
-        tester = QATester(llm_provider=MockLLMProvider())
-
         message = AgentMessage(
             from_role=AgentRole.DT,
             to_role=AgentRole.QA_TESTER,
@@ -220,19 +250,14 @@ class TestQATester:
 class TestDevOpsAutomator:
     """Test DevOpsAutomator agent."""
 
-    def test_create_devops_automator(self):
-        """Test creating DevOpsAutomator agent."""
-        automator = DevOpsAutomator(llm_provider=MockLLMProvider())
-
-        assert automator.name == "DevOps Automator"
-        assert automator.role == AgentRole.DEVOPS_AUTOMATOR
-        assert automator.config.department == "Engineering"
+    @pytest.fixture
+    def automator(self, llm):
+        """Create a DevOpsAutomator agent."""
+        return DevOpsAutomator(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_create_cicd_pipeline(self):
+    async def test_create_cicd_pipeline(self, automator):
         """Test CI/CD pipeline creation."""
-        automator = DevOpsAutomator(llm_provider=MockLLMProvider())
-
         project_config = {"language": "Python", "framework": "FastAPI"}
         result = await automator.create_cicd_pipeline(project_config)
 
@@ -243,19 +268,14 @@ class TestDevOpsAutomator:
 class TestFrontendDeveloper:
     """Test FrontendDeveloper agent."""
 
-    def test_create_frontend_developer(self):
-        """Test creating FrontendDeveloper agent."""
-        developer = FrontendDeveloper(llm_provider=MockLLMProvider())
-
-        assert developer.name == "Frontend Developer"
-        assert developer.role == AgentRole.FRONTEND_DEVELOPER
-        assert developer.config.department == "Engineering"
+    @pytest.fixture
+    def developer(self, llm):
+        """Create a FrontendDeveloper agent."""
+        return FrontendDeveloper(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_implement_ui(self):
+    async def test_implement_ui(self, developer):
         """Test UI implementation."""
-        developer = FrontendDeveloper(llm_provider=MockLLMProvider())
-
         design_spec = {"layout": "grid", "components": ["header", "footer"]}
         result = await developer.implement_ui(design_spec)
 
@@ -266,20 +286,14 @@ class TestFrontendDeveloper:
 class TestProductStrategist:
     """Test ProductStrategist agent."""
 
-    def test_create_product_strategist(self):
-        """Test creating ProductStrategist agent."""
-        strategist = ProductStrategist(llm_provider=MockLLMProvider())
-
-        assert strategist.name == "Product Strategist"
-        assert strategist.role == AgentRole.PRODUCT_STRATEGIST
-        assert strategist.config.department == "Product"
-        assert strategist.config.allow_delegation is True
+    @pytest.fixture
+    def strategist(self, llm):
+        """Create a ProductStrategist agent."""
+        return ProductStrategist(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_prioritize_features(self):
+    async def test_prioritize_features(self, strategist):
         """Test feature prioritization."""
-        strategist = ProductStrategist(llm_provider=MockLLMProvider())
-
         features = [{"name": "Feature 1", "value": 5}, {"name": "Feature 2", "value": 3}]
         context = {"budget": 10000, "timeline": "Q1"}
         result = await strategist.prioritize_features(features, context)
@@ -291,19 +305,14 @@ class TestProductStrategist:
 class TestFeedbackSynthesizer:
     """Test FeedbackSynthesizer agent."""
 
-    def test_create_feedback_synthesizer(self):
-        """Test creating FeedbackSynthesizer agent."""
-        synthesizer = FeedbackSynthesizer(llm_provider=MockLLMProvider())
-
-        assert synthesizer.name == "Feedback Synthesizer"
-        assert synthesizer.role == AgentRole.FEEDBACK_SYNTHESIZER
-        assert synthesizer.config.department == "Product"
+    @pytest.fixture
+    def synthesizer(self, llm):
+        """Create a FeedbackSynthesizer agent."""
+        return FeedbackSynthesizer(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_collect_feedback(self):
+    async def test_collect_feedback(self, synthesizer):
         """Test feedback collection."""
-        synthesizer = FeedbackSynthesizer(llm_provider=MockLLMProvider())
-
         sources = [{"source": "survey", "feedback": "Great product"}]
         result = await synthesizer.collect_feedback(sources)
 
@@ -314,19 +323,14 @@ class TestFeedbackSynthesizer:
 class TestUXResearcher:
     """Test UXResearcher agent."""
 
-    def test_create_ux_researcher(self):
-        """Test creating UXResearcher agent."""
-        researcher = UXResearcher(llm_provider=MockLLMProvider())
-
-        assert researcher.name == "UX Researcher"
-        assert researcher.role == AgentRole.UX_RESEARCHER
-        assert researcher.config.department == "Design"
+    @pytest.fixture
+    def researcher(self, llm):
+        """Create a UXResearcher agent."""
+        return UXResearcher(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_research_users(self):
+    async def test_research_users(self, researcher):
         """Test user research."""
-        researcher = UXResearcher(llm_provider=MockLLMProvider())
-
         questions = ["What are user pain points?", "How do users navigate?"]
         result = await researcher.research_users(questions)
 
@@ -337,19 +341,14 @@ class TestUXResearcher:
 class TestUIDesigner:
     """Test UIDesigner agent."""
 
-    def test_create_ui_designer(self):
-        """Test creating UIDesigner agent."""
-        designer = UIDesigner(llm_provider=MockLLMProvider())
-
-        assert designer.name == "UI Designer"
-        assert designer.role == AgentRole.UI_DESIGNER
-        assert designer.config.department == "Design"
+    @pytest.fixture
+    def designer(self, llm):
+        """Create a UIDesigner agent."""
+        return UIDesigner(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_create_design(self):
+    async def test_create_design(self, designer):
         """Test design creation."""
-        designer = UIDesigner(llm_provider=MockLLMProvider())
-
         requirements = {"type": "dashboard", "style": "modern"}
         result = await designer.create_design(requirements)
 
@@ -360,19 +359,14 @@ class TestUIDesigner:
 class TestBrandGuardian:
     """Test BrandGuardian agent."""
 
-    def test_create_brand_guardian(self):
-        """Test creating BrandGuardian agent."""
-        guardian = BrandGuardian(llm_provider=MockLLMProvider())
-
-        assert guardian.name == "Brand Guardian"
-        assert guardian.role == AgentRole.BRAND_GUARDIAN
-        assert guardian.config.department == "Marketing"
+    @pytest.fixture
+    def guardian(self, llm):
+        """Create a BrandGuardian agent."""
+        return BrandGuardian(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_review_brand_compliance(self):
+    async def test_review_brand_compliance(self, guardian):
         """Test brand compliance review."""
-        guardian = BrandGuardian(llm_provider=MockLLMProvider())
-
         result = await guardian.review_brand_compliance("Sample content", "text")
 
         assert "compliant" in result
@@ -382,20 +376,14 @@ class TestBrandGuardian:
 class TestContentCreator:
     """Test ContentCreator agent."""
 
-    def test_create_content_creator(self):
-        """Test creating ContentCreator agent."""
-        creator = ContentCreator(llm_provider=MockLLMProvider())
-
-        assert creator.name == "Content Creator"
-        assert creator.role == AgentRole.CONTENT_CREATOR
-        assert creator.config.department == "Marketing"
-        assert creator.config.allow_delegation is True
+    @pytest.fixture
+    def creator(self, llm):
+        """Create a ContentCreator agent."""
+        return ContentCreator(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_create_content(self):
+    async def test_create_content(self, creator):
         """Test content creation."""
-        creator = ContentCreator(llm_provider=MockLLMProvider())
-
         brief = {"channel": "blog", "topic": "AI", "tone": "professional"}
         result = await creator.create_content(brief)
 
@@ -406,20 +394,14 @@ class TestContentCreator:
 class TestStorytellingSpecialist:
     """Test StorytellingSpecialist agent."""
 
-    def test_create_storytelling_specialist(self):
-        """Test creating StorytellingSpecialist agent."""
-        specialist = StorytellingSpecialist(llm_provider=MockLLMProvider())
-
-        assert specialist.name == "Storytelling Specialist"
-        assert specialist.role == AgentRole.STORYTELLING_SPECIALIST
-        assert specialist.config.department == "Marketing"
-        assert specialist.config.allow_delegation is True
+    @pytest.fixture
+    def specialist(self, llm):
+        """Create a StorytellingSpecialist agent."""
+        return StorytellingSpecialist(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_create_story(self):
+    async def test_create_story(self, specialist):
         """Test story creation."""
-        specialist = StorytellingSpecialist(llm_provider=MockLLMProvider())
-
         brief = {"protagonist": "User", "conflict": "Problem", "resolution": "Solution"}
         result = await specialist.create_story(brief)
 
@@ -430,20 +412,14 @@ class TestStorytellingSpecialist:
 class TestPitchSpecialist:
     """Test PitchSpecialist agent."""
 
-    def test_create_pitch_specialist(self):
-        """Test creating PitchSpecialist agent."""
-        specialist = PitchSpecialist(llm_provider=MockLLMProvider())
-
-        assert specialist.name == "Pitch Specialist"
-        assert specialist.role == AgentRole.PITCH_SPECIALIST
-        assert specialist.config.department == "Marketing"
-        assert specialist.config.allow_delegation is True
+    @pytest.fixture
+    def specialist(self, llm):
+        """Create a PitchSpecialist agent."""
+        return PitchSpecialist(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_create_pitch(self):
+    async def test_create_pitch(self, specialist):
         """Test pitch creation."""
-        specialist = PitchSpecialist(llm_provider=MockLLMProvider())
-
         brief = {"audience": "investors", "objective": "funding", "duration": 10}
         result = await specialist.create_pitch(brief)
 
@@ -454,19 +430,14 @@ class TestPitchSpecialist:
 class TestGrowthHacker:
     """Test GrowthHacker agent."""
 
-    def test_create_growth_hacker(self):
-        """Test creating GrowthHacker agent."""
-        hacker = GrowthHacker(llm_provider=MockLLMProvider())
-
-        assert hacker.name == "Growth Hacker"
-        assert hacker.role == AgentRole.GROWTH_HACKER
-        assert hacker.config.department == "Marketing"
+    @pytest.fixture
+    def hacker(self, llm):
+        """Create a GrowthHacker agent."""
+        return GrowthHacker(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_design_experiment(self):
+    async def test_design_experiment(self, hacker):
         """Test experiment design."""
-        hacker = GrowthHacker(llm_provider=MockLLMProvider())
-
         hypothesis = "Adding social proof increases conversions"
         result = await hacker.design_experiment(hypothesis)
 
@@ -477,19 +448,14 @@ class TestGrowthHacker:
 class TestOperationsMaintainer:
     """Test OperationsMaintainer agent."""
 
-    def test_create_operations_maintainer(self):
-        """Test creating OperationsMaintainer agent."""
-        maintainer = OperationsMaintainer(llm_provider=MockLLMProvider())
-
-        assert maintainer.name == "Operations Maintainer"
-        assert maintainer.role == AgentRole.OPERATIONS_MAINTAINER
-        assert maintainer.config.department == "Operations"
+    @pytest.fixture
+    def maintainer(self, llm):
+        """Create an OperationsMaintainer agent."""
+        return OperationsMaintainer(llm_provider=llm)
 
     @pytest.mark.asyncio
-    async def test_monitor_systems(self):
+    async def test_monitor_systems(self, maintainer):
         """Test system monitoring."""
-        maintainer = OperationsMaintainer(llm_provider=MockLLMProvider())
-
         result = await maintainer.monitor_systems()
 
         assert "status" in result
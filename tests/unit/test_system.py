@@ -17,6 +17,25 @@ class SimpleTestAgent(Agent):
         return None
 
 
+# Fields every test agent shares; only name and role vary
+_BASE_CONFIG = {"goal": "Test goal", "backstory": "Test backstory"}
+
+
+def make_agent(name, role, agent_class=SimpleTestAgent):
+    """Create a test agent with the shared base configuration."""
+    return agent_class(AgentConfig(name=name, role=role, **_BASE_CONFIG))
+
+
+@pytest.fixture
+async def system():
+    """The singleton AgentSystem, stopped and reset after each test instead of rebuilt."""
+    instance = AgentSystem.get_instance()
+    yield instance
+    # Stop first so a test failing before its own stop() cannot leak the router task
+    await instance.stop()
+    instance.reset()
+
+
 class TestAgentSystem:
     """Test AgentSystem class."""
 
@@ -28,42 +47,19 @@ class TestAgentSystem:
         assert system1 is system2
         assert isinstance(system1, AgentSystem)
 
-    def test_register_agent(self):
+    def test_register_agent(self, system):
         """Test registering an agent."""
-        system = AgentSystem()
-        config = AgentConfig(
-            name="Test Agent",
-            role=AgentRole.RESEARCHER,
-            goal="Test goal",
-            backstory="Test backstory",
-        )
-        agent = SimpleTestAgent(config)
+        agent = make_agent("Test Agent", AgentRole.RESEARCHER)
 
         system.register_agent(agent)
 
         assert system.get_agent(AgentRole.RESEARCHER) == agent
         assert system.agents_loaded() is True
 
-    def test_get_agents(self):
+    def test_get_agents(self, system):
         """Test getting agents by role."""
-        system = AgentSystem()
-
-        agent1 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 1",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 1",
-                backstory="Backstory 1",
-            )
-        )
-        agent2 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 2",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 2",
-                backstory="Backstory 2",
-            )
-        )
+        agent1 = make_agent("Agent 1", AgentRole.RESEARCHER)
+        agent2 = make_agent("Agent 2", AgentRole.RESEARCHER)
 
         system.register_agent(agent1)
         system.register_agent(agent2)
@@ -73,26 +69,10 @@ class TestAgentSystem:
         assert agent1 in agents
         assert agent2 in agents
 
-    def test_get_all_agents(self):
+    def test_get_all_agents(self, system):
         """Test getting all agents."""
-        system = AgentSystem()
-
-        agent1 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 1",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 1",
-                backstory="Backstory 1",
-            )
-        )
-        agent2 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 2",
-                role=AgentRole.WRITER,
-                goal="Goal 2",
-                backstory="Backstory 2",
-            )
-        )
+        agent1 = make_agent("Agent 1", AgentRole.RESEARCHER)
+        agent2 = make_agent("Agent 2", AgentRole.WRITER)
 
         system.register_agent(agent1)
         system.register_agent(agent2)
@@ -101,24 +81,18 @@ class TestAgentSystem:
         assert len(all_agents) == 2
 
     @pytest.mark.asyncio
-    async def test_send_message(self):
+    async def test_send_message(self, system):
         """Test sending a message."""
-        system = AgentSystem()
         received_messages = []
+        done = asyncio.Event()
 
         class MessageHandlerAgent(Agent):
             async def _process_message(self, message):
                 received_messages.append(message)
+                done.set()
                 return None
 
-        agent = MessageHandlerAgent(
-            AgentConfig(
-                name="Handler",
-                role=AgentRole.RESEARCHER,
-                goal="Handle messages",
-                backstory="Test",
-            )
-        )
+        agent = make_agent("Handler", AgentRole.RESEARCHER, agent_class=MessageHandlerAgent)
 
         system.register_agent(agent)
         await system.start()
@@ -131,32 +105,16 @@ class TestAgentSystem:
         )
 
         await system.send_message(message)
-        await asyncio.sleep(0.1)  # Wait for processing
+        await asyncio.wait_for(done.wait(), timeout=1.0)
 
         await system.stop()
 
         assert len(received_messages) == 1
 
-    def test_get_registered_roles(self):
+    def test_get_registered_roles(self, system):
         """Test getting registered roles."""
-        system = AgentSystem()
-
-        agent1 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 1",
-                role=AgentRole.RESEARCHER,
-                goal="Goal 1",
-                backstory="Backstory 1",
-            )
-        )
-        agent2 = SimpleTestAgent(
-            AgentConfig(
-                name="Agent 2",
-                role=AgentRole.WRITER,
-                goal="Goal 2",
-                backstory="Backstory 2",
-            )
-        )
+        agent1 = make_agent("Agent 1", AgentRole.RESEARCHER)
+        agent2 = make_agent("Agent 2", AgentRole.WRITER)
 
         system.register_agent(agent1)
         system.register_agent(agent2)
@@ -165,35 +123,31 @@ class TestAgentSystem:
         assert AgentRole.RESEARCHER in roles
         assert AgentRole.WRITER in roles
 
-    def test_health_checks(self):
+    def test_health_checks(self, system):
         """Test health check methods."""
-        system = AgentSystem()
-
         # Initially no agents
         assert system.agents_loaded() is False
         assert system.memory_connected() is False
         assert system.tools_registered() is False
 
         # Add memory agent
-        memory_agent = SimpleTestAgent(
-            AgentConfig(
-                name="Memory",
-                role=AgentRole.MEMORY,
-                goal="Store memories",
-                backstory="Test",
-            )
-        )
+        memory_agent = make_agent("Memory", AgentRole.MEMORY)
         system.register_agent(memory_agent)
         assert system.memory_connected() is True
 
         # Add tool agent
-        tool_agent = SimpleTestAgent(
-            AgentConfig(
-                name="Tool",
-                role=AgentRole.TOOL,
-                goal="Provide tools",
-                backstory="Test",
-            )
-        )
+        tool_agent = make_agent("Tool", AgentRole.TOOL)
         system.register_agent(tool_agent)
         assert system.tools_registered() is True
+
+    def test_reset(self, system):
+        """Test reset clears agents and routing in place."""
+        registry, router = system.registry, system.router
+        system.register_agent(make_agent("Agent 1", AgentRole.RESEARCHER))
+
+        system.reset()
+
+        assert system.registry is registry
+        assert system.router is router
+        assert system.agents_loaded() is False
+        assert router.get_handler_count(AgentRole.RESEARCHER) == 0
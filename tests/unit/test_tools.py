@@ -1,5 +1,7 @@
 """Unit tests for tools system."""
 
+import asyncio
+
 import pytest
 
 from agents_army.tools.registry import ToolRegistry
@@ -20,6 +22,42 @@ from agents_army.tools.tools import (
 )
 
 
+@pytest.fixture(scope="module")
+def web_search_tool():
+    """Stateless web search tool shared by the module."""
+    return WebSearchTool()
+
+
+@pytest.fixture(scope="module")
+def doc_parser_tool():
+    """Stateless document parser tool shared by the module."""
+    return DocumentParserTool()
+
+
+@pytest.fixture(scope="module")
+def text_extractor_tool():
+    """Stateless text extractor tool shared by the module."""
+    return TextExtractorTool()
+
+
+@pytest.fixture(scope="module")
+def text_formatter_tool():
+    """Stateless text formatter tool shared by the module."""
+    return TextFormatterTool()
+
+
+@pytest.fixture(scope="module")
+def text_analyzer_tool():
+    """Stateless text analyzer tool shared by the module."""
+    return TextAnalyzerTool()
+
+
+@pytest.fixture
+def registry():
+    """Create an empty ToolRegistry."""
+    return ToolRegistry()
+
+
 class TestTool:
     """Test base Tool class."""
 
@@ -67,19 +105,15 @@ class TestTool:
 class TestToolRegistry:
     """Test ToolRegistry."""
 
-    def test_register_tool(self):
+    def test_register_tool(self, registry, web_search_tool):
         """Test registering a tool."""
-        registry = ToolRegistry()
-        tool = WebSearchTool()
-
-        registry.register(tool)
+        registry.register(web_search_tool)
 
         assert registry.has_tool("web_search")
-        assert registry.get_tool("web_search") == tool
+        assert registry.get_tool("web_search") == web_search_tool
 
-    def test_register_duplicate_tool(self):
+    def test_register_duplicate_tool(self, registry):
         """Test registering duplicate tool raises error."""
-        registry = ToolRegistry()
         tool1 = WebSearchTool()
         tool2 = WebSearchTool()
 
@@ -88,24 +122,19 @@ class TestToolRegistry:
         with pytest.raises(ValueError, match="already registered"):
             registry.register(tool2)
 
-    def test_get_tool(self):
+    def test_get_tool(self, registry, web_search_tool):
         """Test getting a tool."""
-        registry = ToolRegistry()
-        tool = WebSearchTool()
-
-        registry.register(tool)
+        registry.register(web_search_tool)
 
         retrieved = registry.get_tool("web_search")
-        assert retrieved == tool
+        assert retrieved == web_search_tool
 
         assert registry.get_tool("nonexistent") is None
 
-    def test_list_tools(self):
+    def test_list_tools(self, registry, web_search_tool, text_analyzer_tool):
         """Test listing tools."""
-        registry = ToolRegistry()
-
-        registry.register(WebSearchTool())
-        registry.register(TextAnalyzerTool())
+        registry.register(web_search_tool)
+        registry.register(text_analyzer_tool)
 
         tools = registry.list_tools()
         assert len(tools) == 2
@@ -114,30 +143,81 @@ class TestToolRegistry:
         assert len(web_tools) == 1
         assert web_tools[0].name == "web_search"
 
+    def test_category_index_follows_unregister(self, registry, web_search_tool):
+        """Test category listing and counts stay in sync after unregistering."""
+        registry.register(web_search_tool)
+        assert registry.count_tools(category="web") == 1
+
+        registry.unregister("web_search")
+
+        assert registry.list_tools(category="web") == []
+        assert registry.count_tools(category="web") == 0
+        assert registry.list_tools(category="missing") == []
+
     @pytest.mark.asyncio
-    async def test_execute_tool(self):
+    async def test_execute_tool(self, registry, web_search_tool):
         """Test executing a tool through registry."""
-        registry = ToolRegistry()
-        registry.register(WebSearchTool())
+        registry.register(web_search_tool)
 
         result = await registry.execute_tool("web_search", {"query": "test", "max_results": 3})
 
         assert isinstance(result, list)
         assert len(result) == 3
 
+    async def test_execute_tools_batch(self, registry, web_search_tool):
+        """Test batch execution keeps call order and returns failures in place."""
+        registry.register(web_search_tool)
+        calls = [("web_search", {"query": f"q{i}", "max_results": 1}) for i in range(16)]
+        calls.insert(3, ("nonexistent", {}))
+
+        results = await registry.execute_tools_batch(calls, max_concurrency=4)
+
+        assert len(results) == 17
+        assert isinstance(results[3], ToolNotFoundError)
+        queries = [r[0]["title"] for i, r in enumerate(results) if i != 3]
+        assert queries == [f"Result 0 for: q{i}" for i in range(16)]
+
+    async def test_execute_tools_batch_limits_concurrency(self, registry):
+        """Test no more than max_concurrency calls run at once."""
+        in_flight = []
+        peak = []
+
+        class SlowTool(Tool):
+            def __init__(self):
+                super().__init__(name="slow", description="Slow tool")
+
+            async def execute(self) -> None:
+                in_flight.append(None)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0)
+                in_flight.pop()
+
+        registry.register(SlowTool())
+        await registry.execute_tools_batch([("slow", {})] * 10, max_concurrency=3)
+
+        assert max(peak) == 3
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    async def test_execute_tools_batch_rejects_bad_concurrency(
+        self, registry, web_search_tool, max_concurrency
+    ):
+        """Test a concurrency limit below 1 is rejected instead of hanging."""
+        registry.register(web_search_tool)
+        calls = [("web_search", {"query": "q", "max_results": 1})]
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await registry.execute_tools_batch(calls, max_concurrency=max_concurrency)
+
     @pytest.mark.asyncio
-    async def test_execute_nonexistent_tool(self):
+    async def test_execute_nonexistent_tool(self, registry):
         """Test executing nonexistent tool raises error."""
-        registry = ToolRegistry()
-
         with pytest.raises(ToolNotFoundError):
             await registry.execute_tool("nonexistent", {})
 
     @pytest.mark.asyncio
-    async def test_execute_tool_invalid_params(self):
+    async def test_execute_tool_invalid_params(self, registry, web_search_tool):
         """Test executing tool with invalid parameters."""
-        registry = ToolRegistry()
-        registry.register(WebSearchTool())
+        registry.register(web_search_tool)
 
         with pytest.raises(InvalidParametersError):
             await registry.execute_tool("web_search", {})
@@ -147,11 +227,9 @@ class TestBuiltInTools:
     """Test built-in tools."""
 
     @pytest.mark.asyncio
-    async def test_web_search_tool(self):
+    async def test_web_search_tool(self, web_search_tool):
         """Test web search tool."""
-        tool = WebSearchTool()
-
-        results = await tool.execute(query="AI agents", max_results=3)
+        results = await web_search_tool.execute(query="AI agents", max_results=3)
 
         assert isinstance(results, list)
         assert len(results) == 3
@@ -159,45 +237,66 @@ class TestBuiltInTools:
         assert "url" in results[0]
 
     @pytest.mark.asyncio
-    async def test_document_parser_tool(self):
+    async def test_document_parser_tool(self, doc_parser_tool):
         """Test document parser tool."""
-        tool = DocumentParserTool()
-
-        result = await tool.execute(document="# Title\n\nContent here", format="markdown")
+        result = await doc_parser_tool.execute(
+            document="# Title\n\nContent here", format="markdown"
+        )
 
         assert result["format"] == "markdown"
         assert "sections" in result
 
     @pytest.mark.asyncio
-    async def test_text_extractor_tool(self):
+    async def test_text_extractor_tool(self, text_extractor_tool):
         """Test text extractor tool."""
-        tool = TextExtractorTool()
-
-        result = await tool.execute(content="<p>Test content</p>")
+        result = await text_extractor_tool.execute(content="<p>Test content</p>")
 
         assert result == "Test content"
 
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            pytest.param("<b>bold</b> <i>text", "bold text", id="unclosed-tail"),
+            pytest.param("a < b and c > d", "a d", id="comparison"),
+            pytest.param("<" * 20_000 + "x", "<" * 20_000 + "x", id="unclosed-run"),
+        ],
+    )
+    async def test_text_extractor_tool_edges(self, text_extractor_tool, content, expected):
+        """Test tag stripping leaves text after the last closing bracket untouched."""
+        assert await text_extractor_tool.execute(content=content) == expected
+
     @pytest.mark.asyncio
-    async def test_text_formatter_tool(self):
+    async def test_text_formatter_tool(self, text_formatter_tool):
         """Test text formatter tool."""
-        tool = TextFormatterTool()
-
-        result = await tool.execute(content="Test content", format="markdown")
+        result = await text_formatter_tool.execute(content="Test content", format="markdown")
 
         assert isinstance(result, str)
         assert "Test content" in result
 
     @pytest.mark.asyncio
-    async def test_text_analyzer_tool(self):
+    async def test_text_analyzer_tool(self, text_analyzer_tool):
         """Test text analyzer tool."""
-        tool = TextAnalyzerTool()
-
-        result = await tool.execute(content="This is a test. It has two sentences.")
+        result = await text_analyzer_tool.execute(content="This is a test. It has two sentences.")
 
         assert result["word_count"] == 8
         assert result["sentence_count"] == 2
         assert "character_count" in result
 
+    @pytest.mark.parametrize(
+        "content, sentences",
+        [
+            pytest.param("", 0, id="empty"),
+            pytest.param(" ... ! ", 0, id="only-terminators"),
+            pytest.param("Hi!! Really?  Yes", 3, id="repeated-terminators"),
+            pytest.param("No terminator at all", 1, id="no-terminator"),
+        ],
+    )
+    async def test_text_analyzer_sentence_count(self, text_analyzer_tool, content, sentences):
+        """Test sentence counting ignores empty and whitespace-only segments."""
+        result = await text_analyzer_tool.execute(content=content)
+
+        assert result["sentence_count"] == sentences
+
     def test_create_default_tools(self):
         """Test creating default tools registry."""
         registry = create_default_tools()
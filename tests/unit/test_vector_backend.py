@@ -1,5 +1,8 @@
 """Unit tests for vector backends."""
 
+import asyncio
+import math
+
 import pytest
 
 from agents_army.memory.embeddings import MockEmbeddings
@@ -7,13 +10,35 @@ from agents_army.memory.models import MemoryItem, RetentionPolicy
 from agents_army.memory.vector_backend import InMemoryVectorBackend
 
 
+@pytest.fixture(scope="module")
+def embeddings():
+    """Mock embedding provider shared by the module."""
+    return MockEmbeddings()
+
+
+@pytest.fixture(scope="module")
+async def populated_backend(embeddings):
+    """Backend stored once with items for the read-only search tests."""
+    backend = InMemoryVectorBackend(embedding_provider=embeddings)
+    await backend.store_many(
+        [
+            MemoryItem(key="python", value="Python programming language", tags=["programming"]),
+            MemoryItem(key="javascript", value="JavaScript web development", tags=["programming"]),
+            MemoryItem(key="cooking", value="Cooking recipes", tags=["food"]),
+            MemoryItem(key="test", value="Test content", tags=["test"]),
+            MemoryItem(key="snake", value="Python snake", tags=["animals"]),
+        ]
+    )
+    return backend
+
+
 class TestInMemoryVectorBackend:
     """Test InMemoryVectorBackend functionality."""
 
     @pytest.mark.asyncio
-    async def test_store_with_embedding(self):
+    async def test_store_with_embedding(self, embeddings):
         """Test storing items with embeddings."""
-        backend = InMemoryVectorBackend(embedding_provider=MockEmbeddings())
+        backend = InMemoryVectorBackend(embedding_provider=embeddings)
 
         item = MemoryItem(
             key="test_key",
@@ -27,112 +52,241 @@ class TestInMemoryVectorBackend:
         assert "test_key" in backend._storage
         assert "test_key" in backend._embeddings
         assert len(backend._embeddings["test_key"]) == 384  # MockEmbeddings default
+        assert backend._embeddings["test_key"].typecode == "f"
 
-    @pytest.mark.asyncio
-    async def test_search_semantic(self):
-        """Test semantic search."""
-        backend = InMemoryVectorBackend(embedding_provider=MockEmbeddings())
+    async def test_store_many_embeds_in_one_batch(self, embeddings):
+        """Test store_many makes a single embed_batch call and matches store()."""
+        provider = MockEmbeddings()
+        calls = []
+        embed_batch = provider.embed_batch
 
-        # Store items
-        item1 = MemoryItem(
-            key="key1",
-            value="Python programming language",
-            tags=["programming"],
-        )
-        item2 = MemoryItem(
-            key="key2",
-            value="JavaScript web development",
-            tags=["programming"],
-        )
-        item3 = MemoryItem(
-            key="key3",
-            value="Cooking recipes",
-            tags=["food"],
-        )
+        async def counting_embed_batch(texts):
+            calls.append(texts)
+            return await embed_batch(texts)
 
-        await backend.store(item1)
-        await backend.store(item2)
-        await backend.store(item3)
+        provider.embed_batch = counting_embed_batch
+        backend = InMemoryVectorBackend(embedding_provider=provider)
+        single = InMemoryVectorBackend(embedding_provider=embeddings)
+        items = [MemoryItem(key=f"key{i}", value=f"Value {i}") for i in range(3)]
 
+        await backend.store_many(items)
+        for item in items:
+            await single.store(item)
+
+        assert calls == [["Value 0", "Value 1", "Value 2"]]
+        assert backend._embeddings == single._embeddings
+        assert await backend.retrieve("key1") is items[1]
+
+    async def test_store_many_rejects_short_batch(self, embeddings):
+        """Test a provider returning too few embeddings stores nothing instead of dropping items."""
+        provider = MockEmbeddings()
+        embed_batch = provider.embed_batch
+
+        async def short_embed_batch(texts):
+            return (await embed_batch(texts))[:-1]
+
+        provider.embed_batch = short_embed_batch
+        backend = InMemoryVectorBackend(embedding_provider=provider)
+        items = [MemoryItem(key=f"key{i}", value=f"Value {i}") for i in range(3)]
+
+        with pytest.raises(ValueError, match="2 embeddings for 3 items"):
+            await backend.store_many(items)
+        assert backend._storage == {}
+
+    async def test_search_semantic(self, populated_backend):
+        """Test semantic search."""
         # Search with threshold 0.0 (should find all items)
-        results = await backend.search_semantic("test query", limit=10, threshold=0.0)
+        results = await populated_backend.search_semantic("test query", limit=10, threshold=0.0)
 
         # MockEmbeddings uses hash-based approach, so results depend on hash similarity
         # Just verify search doesn't crash and returns some results
         assert len(results) >= 0
 
-    @pytest.mark.asyncio
-    async def test_search_semantic_with_threshold(self):
+    async def test_search_semantic_with_threshold(self, populated_backend):
         """Test semantic search with threshold."""
-        backend = InMemoryVectorBackend(embedding_provider=MockEmbeddings())
-
-        item = MemoryItem(
-            key="key1",
-            value="Test content",
-            tags=["test"],
-        )
-
-        await backend.store(item)
-
-        # Search with high threshold (should find item)
-        results = await backend.search_semantic("Test content", limit=10, threshold=0.0)
-        assert len(results) >= 1
+        # An exact match clears even a near-1.0 threshold
+        results = await populated_backend.search_semantic("Test content", limit=10, threshold=0.999)
+        assert [item.key for item in results] == ["test"]
 
         # Search with very high threshold (might not find)
-        results = await backend.search_semantic("completely different", limit=10, threshold=0.99)
+        results = await populated_backend.search_semantic(
+            "completely different", limit=10, threshold=0.99
+        )
         # Results depend on hash similarity, so just check it doesn't crash
 
-    @pytest.mark.asyncio
-    async def test_search_semantic_with_tags(self):
+    async def test_search_semantic_with_tags(self, populated_backend):
         """Test semantic search with tag filtering."""
-        backend = InMemoryVectorBackend(embedding_provider=MockEmbeddings())
-
-        item1 = MemoryItem(
-            key="key1",
-            value="Python programming",
-            tags=["programming"],
-        )
-        item2 = MemoryItem(
-            key="key2",
-            value="Python snake",
-            tags=["animals"],
-        )
-
-        await backend.store(item1)
-        await backend.store(item2)
-
-        # Search with tag filter
-        results = await backend.search_semantic(
+        results = await populated_backend.search_semantic(
             "Python", limit=10, threshold=0.0, tags=["programming"]
         )
 
         # Should only return items with programming tag
-        assert len(results) <= 1
-        if results:
-            assert results[0].key == "key1"
-            assert "programming" in results[0].tags
+        assert {item.key for item in results} == {"python", "javascript"}
+        assert all("programming" in item.tags for item in results)
+
+    async def test_embeddings_stored_normalized(self, embeddings):
+        """Test stored embeddings are unit length and score an exact match as 1.0."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings)
+        await backend.store(MemoryItem(key="key1", value="Test content"))
+
+        assert math.isclose(math.hypot(*backend._embeddings["key1"]), 1.0, rel_tol=1e-6)
+        results = await backend.search_semantic("Test content", limit=1, threshold=0.999)
+        assert [item.key for item in results] == ["key1"]
+
+    async def test_tag_index_follows_store_and_delete(self, embeddings):
+        """Test tag-filtered search sees re-tagged and deleted items correctly."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings)
+        await backend.store(MemoryItem(key="key1", value="Python", tags=["programming"]))
+        await backend.store(MemoryItem(key="key2", value="Python", tags=["programming", "docs"]))
+
+        # Re-storing under new tags moves the key in the index
+        await backend.store(MemoryItem(key="key1", value="Python", tags=["animals"]))
+        await backend.delete("key2")
+
+        async def keys_for(*tags):
+            results = await backend.search_semantic("Python", threshold=0.0, tags=list(tags))
+            return {item.key for item in results}
+
+        assert await keys_for("programming") == set()
+        assert await keys_for("animals", "docs") == {"key1"}
+        assert backend._keys_by_tag == {"animals": {"key1"}}
+
+    async def test_search_semantic_limit(self, embeddings):
+        """Test the limit keeps the most similar items in descending order."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings)
+        await asyncio.gather(
+            *(backend.store(MemoryItem(key=f"key{i}", value=f"Value {i}")) for i in range(5))
+        )
 
-    def test_cosine_similarity(self):
+        everything = await backend.search_semantic("Value 3", limit=5, threshold=-1.0)
+        top = await backend.search_semantic("Value 3", limit=2, threshold=-1.0)
+
+        assert [item.key for item in top] == [item.key for item in everything[:2]]
+        assert top[0].key == "key3"
+
+    async def test_search_semantic_mixed_dimensions(self, embeddings):
+        """Test embeddings of another dimension score 0.0 instead of failing the search."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings)
+        await backend.store(MemoryItem(key="key1", value="Test content"))
+        backend.embedding_provider = MockEmbeddings(dimensions=128)
+        await backend.store(MemoryItem(key="key2", value="Test content"))
+        backend.embedding_provider = embeddings
+
+        results = await backend.search_semantic("Test content", threshold=0.0)
+        assert [item.key for item in results] == ["key1", "key2"]
+
+        results = await backend.search_semantic("Test content", threshold=0.5)
+        assert [item.key for item in results] == ["key1"]
+
+    async def test_persist_path_restart(self, embeddings, tmp_path):
+        """Test a backend on the same persist_path reloads items and embeddings."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        await backend.store(MemoryItem(key="key1", value="Python programming", tags=["code"]))
+        await backend.store(MemoryItem(key="key2", value="Cooking recipes", tags=["food"]))
+        await backend.store(MemoryItem(key="key1", value="Python snake", tags=["animals"]))
+        await backend.store(MemoryItem(key="key3", value="Test content"))
+        await backend.delete("key3")
+        backend.close()
+
+        restarted = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        assert restarted._storage.keys() == {"key1", "key2"}
+        assert restarted._storage["key1"].value == "Python snake"
+        assert restarted._embeddings == backend._embeddings
+        assert restarted._keys_by_tag == {"animals": {"key1"}, "food": {"key2"}}
+        results = await restarted.search_semantic("Python snake", limit=1)
+        assert [item.key for item in results] == ["key1"]
+
+        # Compaction drops overwritten rows and deletions
+        size = (tmp_path / InMemoryVectorBackend.EMBEDDINGS_FILENAME).stat().st_size
+        restarted.compact()
+        assert (tmp_path / InMemoryVectorBackend.EMBEDDINGS_FILENAME).stat().st_size < size
+        reloaded = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        assert reloaded._embeddings == backend._embeddings
+
+    async def test_persist_path_torn_write(self, embeddings, tmp_path):
+        """Test a torn final write is dropped and later stores still reload."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        await backend.store(MemoryItem(key="key1", value="Test content"))
+        await backend.store(MemoryItem(key="key2", value="Cooking recipes"))
+        backend.close()
+        items_path = tmp_path / InMemoryVectorBackend.ITEMS_FILENAME
+        items_path.write_bytes(items_path.read_bytes()[:-10])
+
+        restarted = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        assert list(restarted._storage) == ["key1"]
+        await restarted.store(MemoryItem(key="key3", value="Python programming"))
+        restarted.close()
+
+        reloaded = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        assert list(reloaded._storage) == ["key1", "key3"]
+        assert reloaded._embeddings == restarted._embeddings
+
+    async def test_persist_path_unserializable_value(self, embeddings, tmp_path):
+        """Test a value JSON cannot encode is rejected without touching memory or the logs."""
+        backend = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        await backend.store(MemoryItem(key="key1", value="Test content"))
+        with pytest.raises(TypeError):
+            await backend.store(MemoryItem(key="bad", value=object()))
+        await backend.store(MemoryItem(key="key2", value="Cooking recipes"))
+        backend.close()
+
+        assert "bad" not in backend._storage
+        reloaded = InMemoryVectorBackend(embedding_provider=embeddings, persist_path=str(tmp_path))
+        assert list(reloaded._storage) == ["key1", "key2"]
+        assert reloaded._embeddings == backend._embeddings
+
+    def test_unsupported_index(self):
+        """Test an unknown index name is rejected."""
+        with pytest.raises(ValueError, match="Unsupported index"):
+            InMemoryVectorBackend(index="ivf")
+
+    async def test_hnsw_index_matches_flat(self, embeddings):
+        """Test HNSW search recalls the exact top-k on a larger corpus."""
+        pytest.importorskip("hnswlib")
+        flat = InMemoryVectorBackend(embedding_provider=embeddings)
+        hnsw = InMemoryVectorBackend(embedding_provider=embeddings, index="hnsw")
+        items = [MemoryItem(key=f"key{i}", value=f"Document {i}") for i in range(2000)]
+        await flat.store_many(items)
+        await hnsw.store_many(items)
+        for i in range(0, 2000, 2):
+            await flat.delete(f"key{i}")
+            await hnsw.delete(f"key{i}")
+
+        for query in ("Document 7", "Document 1999", "unrelated query"):
+            expected = await flat.search_semantic(query, limit=5, threshold=0.0)
+            results = await hnsw.search_semantic(query, limit=5, threshold=0.0)
+            # Approximate search: allow one miss in the top 5
+            assert len(results) == 5
+            assert len({item.key for item in results} & {item.key for item in expected}) >= 4
+
+    async def test_hnsw_index_reuses_deleted_slots(self, embeddings):
+        """Test re-stores and deletes reuse graph slots instead of growing the index."""
+        pytest.importorskip("hnswlib")
+        backend = InMemoryVectorBackend(embedding_provider=embeddings, index="hnsw")
+        for i in range(3000):
+            await backend.store(MemoryItem(key="renewed", value=f"Version {i}"))
+            await backend.store(MemoryItem(key=f"tmp{i}", value=f"Scratch {i}"))
+            await backend.delete(f"tmp{i}")
+
+        assert backend._hnsw.get_max_elements() == 1024
+        assert backend._label_by_key.keys() == {"renewed"}
+        results = await backend.search_semantic("Version 2999", limit=1)
+        assert [item.value for item in results] == ["Version 2999"]
+
+    @pytest.mark.parametrize(
+        "vec1, vec2, expected",
+        [
+            pytest.param([1.0, 0.0, 0.0], [1.0, 0.0, 0.0], 1.0, id="identical"),
+            pytest.param([1.0, 0.0], [0.0, 1.0], 0.0, id="orthogonal"),
+            pytest.param([1.0, 0.0], [1.0, 0.0, 0.0], 0.0, id="length-mismatch"),
+            pytest.param([0.0, 0.0], [1.0, 0.0], 0.0, id="zero-vector"),
+        ],
+    )
+    def test_cosine_similarity(self, vec1, vec2, expected):
         """Test cosine similarity calculation."""
         backend = InMemoryVectorBackend()
 
-        # Test identical vectors
-        vec1 = [1.0, 0.0, 0.0]
-        vec2 = [1.0, 0.0, 0.0]
-        similarity = backend._cosine_similarity(vec1, vec2)
-        assert abs(similarity - 1.0) < 0.01
-
-        # Test orthogonal vectors
-        vec1 = [1.0, 0.0]
-        vec2 = [0.0, 1.0]
-        similarity = backend._cosine_similarity(vec1, vec2)
-        assert abs(similarity - 0.0) < 0.01
-
-        # Test different length vectors
-        vec1 = [1.0, 0.0]
-        vec2 = [1.0, 0.0, 0.0]
-        similarity = backend._cosine_similarity(vec1, vec2)
-        assert similarity == 0.0
+        assert backend._cosine_similarity(vec1, vec2) == pytest.approx(expected)
 
 
 class TestMockEmbeddings:
@@ -159,6 +313,17 @@ class TestMockEmbeddings:
         assert len(batch_embeddings) == 3
         assert all(len(emb) == 128 for emb in batch_embeddings)
 
+    async def test_embed_cached_copies(self):
+        """Test repeated embeds agree and callers cannot mutate the cached vector."""
+        embeddings = MockEmbeddings(dimensions=128)
+
+        first = await embeddings.embed("Test text")
+        first[0] = 42.0
+        second = await embeddings.embed("Test text")
+
+        assert second[0] != 42.0
+        assert second == (await embeddings.embed_batch(["Test text"]))[0]
+
     def test_dimensions(self):
         """Test dimensions property."""
         embeddings = MockEmbeddings(dimensions=256)